@@ -0,0 +1,91 @@
+"""
+日期解析微基准 - 对比旧实现（每次调用重新构造正则列表）与 src/fetchers/dates.py
+
+用法: python benchmarks/bench_dates.py [--rounds 2000]
+列表页每个元素都会调用一次 parse_date，同一批日期文本在一次运行中反复出现，
+因此分别测量冷启动（清空缓存）和重复调用两种情况。
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, "src"))
+from fetchers import dates
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "date_corpus.txt")
+
+
+def legacy_parse_date(date_str):
+    """旧版 BaseFetcher.parse_date"""
+    if not date_str:
+        return None
+    date_str = date_str.strip()
+    months = {'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+              'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12}
+    month = lambda s: months.get(s.lower()[:3], 1)
+    patterns = [
+        (r"(\d{4})-(\d{1,2})-(\d{1,2})", lambda m: f"{m.group(1)}-{int(m.group(2)):02d}-{int(m.group(3)):02d}"),
+        (r"(\d{1,2})/(\d{1,2})/(\d{4})", lambda m: f"{m.group(3)}-{int(m.group(1)):02d}-{int(m.group(2)):02d}"),
+        (r"(\d{1,2})-(\d{1,2})-(\d{4})", lambda m: f"{m.group(3)}-{int(m.group(1)):02d}-{int(m.group(2)):02d}"),
+        (r"(\d{4})/(\d{1,2})/(\d{1,2})", lambda m: f"{m.group(1)}-{int(m.group(2)):02d}-{int(m.group(3)):02d}"),
+        (r"(\d{4})\.(\d{1,2})\.(\d{1,2})", lambda m: f"{m.group(1)}-{int(m.group(2)):02d}-{int(m.group(3)):02d}"),
+        (r"(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(\d{4})",
+         lambda m: f"{m.group(3)}-{month(m.group(2)):02d}-{int(m.group(1)):02d}"),
+        (r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(\d{1,2}),?\s+(\d{4})",
+         lambda m: f"{m.group(3)}-{month(m.group(1)):02d}-{int(m.group(2)):02d}"),
+        (r"(\d{4}-\d{2}-\d{2})T", lambda m: m.group(1)),
+    ]
+    for pattern, formatter in patterns:
+        match = re.search(pattern, date_str, re.IGNORECASE)
+        if match:
+            try:
+                return formatter(match)
+            except Exception:
+                continue
+    return None
+
+
+def load_corpus():
+    with open(CORPUS, "r", encoding="utf-8") as f:
+        return [line.rstrip("\n") for line in f if line.strip() and not line.startswith("#")]
+
+
+def bench(fn, corpus, rounds, before_round=None):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        if before_round:
+            before_round()
+        for text in corpus:
+            fn(text)
+    elapsed = time.perf_counter() - start
+    return elapsed / (rounds * len(corpus)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="日期解析微基准")
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    mismatches = [(t, legacy_parse_date(t), dates.parse_date(t)) for t in corpus
+                  if legacy_parse_date(t) != dates.parse_date(t)]
+
+    print(f"语料: {len(corpus)} 条, 轮数: {args.rounds}")
+    print(f"  旧实现:            {bench(legacy_parse_date, corpus, args.rounds):7.2f} µs/次")
+    print(f"  dates (冷缓存):    {bench(dates.parse_date, corpus, args.rounds, dates._parse_memo.cache_clear):7.2f} µs/次")
+    dates._parse_memo.cache_clear()
+    print(f"  dates (重复调用):  {bench(dates.parse_date, corpus, args.rounds):7.2f} µs/次")
+    print(f"  {dates.cache_info()}")
+
+    if mismatches:
+        print(f"\n结果不同的条目 ({len(mismatches)}):")
+        for text, old, new in mismatches:
+            print(f"  {text!r}: 旧 {old} / 新 {new}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+HTML 解析后端基准与一致性检查
+
+用法:
+    python benchmarks/bench_parsers.py --save              # 保存各来源的列表页到 benchmarks/pages/
+    python benchmarks/bench_parsers.py --update-expected   # 按 html.parser 当前结果重写 fixtures/expected.json
+    python benchmarks/bench_parsers.py [--rounds 20]
+
+benchmarks/fixtures/ 中的页面全部是手写的合成页面，不是抓取的真实页面：解析差异用例，以及按各来源
+选择器仿写的列表页（*_list.html）/ 详情页（*_detail.html，含生成的 window.__cfgN 脚本），每个只有
+0–3 KB。expected.json 由 --update-expected 用被测代码本身生成，只是回归快照，不能证明 lxml 等后端在
+真实页面上与 html.parser 一致。真实页面的一致性需要先运行 --save 下载到 benchmarks/pages/（不提交），
+再运行本脚本；pages/ 为空时会给出提示。
+
+对每个页面分别用每个可用后端提取日期、标题、正文和链接，与 html.parser 的结果比较并统计耗时；
+fixtures 的 html.parser 结果还要与 expected.json 一致。任一后端（含 selectolax 正文）结果不一致或与
+expected.json 不符时以非零状态退出。
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, "src"))
+from config.settings import COMPETITOR_SOURCES, INDUSTRY_SOURCES
+from fetchers.document import Document, DATE_CLASS
+from fetchers.parsing import available_backends, make_soup, squash, selectolax_available, selectolax_content
+from fetchers.dates import parse_date
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIRS = [os.path.join(BENCH_DIR, "fixtures"), os.path.join(BENCH_DIR, "pages")]
+REFERENCE = "html.parser"
+EXPECTED_FILE = os.path.join(BENCH_DIR, "fixtures", "expected.json")
+
+CONTENT_SELECTORS = ['.entry-content', '.post-content', '.article-content', '.press-release',
+                     'article', '.content', '.blog-content', 'main']
+
+
+def save_pages():
+    """下载每个来源的列表页"""
+    from fetchers.transport import get_transport
+
+    pages_dir = os.path.join(BENCH_DIR, "pages")
+    os.makedirs(pages_dir, exist_ok=True)
+    sources = {**{k: v["url"] for k, v in COMPETITOR_SOURCES.items()},
+               **{k: v["url"] for k, v in INDUSTRY_SOURCES.items()}}
+    transport = get_transport()
+    for key, url in sources.items():
+        name = key.lower().replace(" ", "_") + ".html"
+        try:
+            response = transport.get(url, timeout=30)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"  ✗ {key}: {str(e)[:80]}")
+            continue
+        with open(os.path.join(pages_dir, name), "w", encoding="utf-8") as f:
+            f.write(response.text)
+        print(f"  ✓ {key}: {len(response.text) // 1024} KB")
+
+
+def load_pages():
+    pages = []
+    for directory in FIXTURE_DIRS:
+        if not os.path.isdir(directory):
+            continue
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".html"):
+                with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+                    pages.append((f"{os.path.basename(directory)}/{name}", f.read()))
+    return pages
+
+
+def extract(html: str, backend: str) -> dict:
+    """抓取器依赖的提取结果"""
+    soup = make_soup(html, backend)
+    links = [(a["href"], squash(a.get_text())) for a in soup.find_all("a", href=True)]
+    dates = [parse_date(e.get_text(strip=True)) for e in soup.find_all(class_=DATE_CLASS)]
+
+    doc = Document(html, "", backend)
+    return {
+        "date": doc.date,
+        "title": doc.title,
+        "content": doc.content(CONTENT_SELECTORS, body_fallback=True),
+        "links": links,
+        "dates": dates,
+    }
+
+
+def expectation(result: dict) -> dict:
+    """expected.json 中保存的提取结果摘要（正文只保存长度和开头）"""
+    return {
+        "date": result["date"],
+        "title": result["title"],
+        "content_length": len(result["content"]),
+        "content_start": result["content"][:80],
+        "links": len(result["links"]),
+        "dates": result["dates"],
+    }
+
+
+def load_expected() -> dict:
+    if not os.path.exists(EXPECTED_FILE):
+        return {}
+    with open(EXPECTED_FILE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def timed(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 解析后端基准")
+    parser.add_argument("--save", action="store_true", help="保存各来源的列表页")
+    parser.add_argument("--update-expected", action="store_true", help="按当前结果重写 fixtures/expected.json")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.save:
+        save_pages()
+        return 0
+
+    pages = load_pages()
+    if args.update_expected:
+        expected = {name: expectation(extract(html, REFERENCE))
+                    for name, html in pages if name.startswith("fixtures/")}
+        with open(EXPECTED_FILE, "w", encoding="utf-8") as f:
+            json.dump(expected, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"✓ 已写入 {len(expected)} 个页面的期望结果")
+        return 0
+
+    expected = load_expected()
+    backends = available_backends()
+    print(f"页面: {len(pages)}, 后端: {', '.join(backends)}"
+          f"{', selectolax(正文)' if selectolax_available() else ''}")
+    if not any(name.startswith("pages/") for name, _ in pages):
+        print("[!] benchmarks/pages/ 为空，只比较了合成 fixtures；真实页面请先运行 --save")
+
+    mismatches = 0
+    totals = {b: 0.0 for b in backends}
+    for name, html in pages:
+        reference = extract(html, REFERENCE)
+        if name in expected:
+            wanted, got = expected[name], expectation(reference)
+            diff = [k for k in wanted if got.get(k) != wanted[k]]
+            if diff:
+                mismatches += 1
+                print(f"  ✗ {name} [{REFERENCE}] 与 expected.json 不一致: {', '.join(diff)}")
+        elif name.startswith("fixtures/"):
+            mismatches += 1
+            print(f"  ✗ {name} 缺少期望结果（运行 --update-expected）")
+        row = []
+        for backend in backends:
+            result = extract(html, backend)
+            diff = [k for k in reference if result[k] != reference[k]]
+            if diff:
+                mismatches += 1
+                print(f"  ✗ {name} [{backend}] 与 {REFERENCE} 不一致: {', '.join(diff)}")
+            ms = timed(lambda: extract(html, backend), args.rounds)
+            totals[backend] += ms
+            row.append(f"{backend} {ms:7.2f} ms")
+        if selectolax_available():
+            text = selectolax_content(html, CONTENT_SELECTORS, body_fallback=True)
+            if text != reference["content"]:
+                mismatches += 1
+                print(f"  ✗ {name} [selectolax] 正文与 {REFERENCE} 不一致")
+            ms = timed(lambda: selectolax_content(html, CONTENT_SELECTORS, body_fallback=True), args.rounds)
+            row.append(f"selectolax(正文) {ms:7.2f} ms")
+        print(f"  {name:40s} {len(html) // 1024:5d} KB  " + "  ".join(row))
+
+    print("\n合计: " + "  ".join(f"{b} {ms:.1f} ms" for b, ms in totals.items()))
+    if mismatches:
+        print(f"✗ {mismatches} 处不一致")
+        return 1
+    print("✓ 各后端提取结果一致")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+摘要质量检查微基准 - 对比旧版 Validator._validate_summary_quality 与 src/quality.py
+
+用法: python benchmarks/bench_quality.py [--rounds 2000] [--extra-keywords 500]
+--extra-keywords 向关键词表追加若干不会命中的词，观察关键词表变大时的耗时变化。
+同时输出语料中各关键词的命中次数，便于调整 FACT_KEYWORDS。
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, "src"))
+from quality import FACT_KEYWORDS, SummaryScorer
+
+CORPUS = [
+    "TTD 于本周宣布推出基于 AI 的广告定向新功能，可实现 95% 的定向准确率，预计 Q2 扩展至欧洲。",
+    "AppLovin 公布 2025 年 Q4 财报，营收达 12.5 亿美元，同比增长 45%，超出市场预期。",
+    "Criteo announced a partnership with a major retailer to expand its commerce media platform.",
+    "Magnite reported revenue of $162.9 million for the quarter, up 8 percent year over year.",
+    "该公司任命了一位首席执行官，负责亚太区业务的整体运营与团队管理工作。",
+    "The company appointed a chief executive to lead operations across the region.",
+    "Moloco 与多家游戏发行商达成合作，帮助其在 Android 平台上获取高价值用户。",
+    "报告讨论了行业趋势与挑战，并回顾了过去一段时间的主要变化和观点。",
+]
+
+
+def legacy_quality(summary, fact_keywords=FACT_KEYWORDS):
+    """旧版 Validator._validate_summary_quality"""
+    if not summary:
+        return False
+    number_patterns = [r'\d+', r'\d+\.\d+', r'\d+%', r'\$\d+', r'\d{4}', r'20\d{2}']
+    has_number = any(re.search(pattern, summary) for pattern in number_patterns)
+    has_keyword = any(keyword in summary.lower() for keyword in fact_keywords)
+    return has_number or has_keyword
+
+
+def bench(fn, corpus, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in corpus:
+            fn(text)
+    elapsed = time.perf_counter() - start
+    return elapsed / (rounds * len(corpus)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="摘要质量检查微基准")
+    parser.add_argument("--rounds", type=int, default=2000)
+    parser.add_argument("--extra-keywords", type=int, default=0)
+    args = parser.parse_args()
+
+    keywords = FACT_KEYWORDS + tuple(f"unusedkeyword{i}" for i in range(args.extra_keywords))
+    scorer = SummaryScorer(keywords)
+
+    print(f"语料: {len(CORPUS)} 条, 关键词: {len(scorer.keywords)} 个, 轮数: {args.rounds}")
+    print(f"  旧实现:          {bench(lambda t: legacy_quality(t, keywords), CORPUS, args.rounds):7.2f} µs/次")
+    print(f"  passes():        {bench(scorer.passes, CORPUS, args.rounds):7.2f} µs/次")
+    print(f"  score():         {bench(scorer.score, CORPUS, args.rounds):7.2f} µs/次")
+
+    print("\n命中关键词（语料内）:")
+    for keyword, count in scorer.keyword_counts(CORPUS).most_common():
+        if count:
+            print(f"  {keyword}: {count}")
+
+    mismatches = [t for t in CORPUS if legacy_quality(t, keywords) != scorer.passes(t)]
+    if mismatches:
+        print(f"\n结果不同的条目 ({len(mismatches)}):")
+        for text in mismatches:
+            print(f"  {text!r}: {scorer.score(text)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
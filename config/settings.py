@@ -14,6 +14,23 @@ DEEPSEEK_API_KEY = os.getenv("DEEPSEEK_API_KEY", "")
 DEEPSEEK_API_BASE = os.getenv("DEEPSEEK_API_BASE", "https://api.deepseek.com")
 DEEPSEEK_MODEL = os.getenv("DEEPSEEK_MODEL", "deepseek-chat")
 
+# 摘要生成并发与限速（DeepSeek 接口）
+SUMMARY_CONFIG = {
+    "concurrency": int(os.getenv("SUMMARY_CONCURRENCY", "4")),  # 同时进行的摘要请求数
+    "requests_per_second": float(os.getenv("SUMMARY_RPS", "2")),  # 令牌桶速率，0 表示不限速
+    "burst": 4,  # 令牌桶容量（允许的突发请求数）
+    "max_retries": 4,  # 429 / 5xx / 网络错误的重试次数
+    "backoff_base": 1.0,  # 指数退避基数（秒）
+    "backoff_max": 30.0,  # 单次等待上限（秒）
+    "timeout": 60,
+    # 每次请求打包的文章数（返回 JSON 数组），1 表示逐条请求；解析失败的条目退回逐条请求
+    "batch_size": int(os.getenv("SUMMARY_BATCH_SIZE", "5")),
+    # 长度不符合要求的摘要发回模型扩写/压缩的最多次数，0 表示不修复
+    "repair_attempts": 2,
+    # integrate_and_send 流式接收中文标题/摘要，解析出两个字段后即结束请求
+    "stream": os.getenv("SUMMARY_STREAM", "0") == "1",
+}
+
 # =============================================================================
 # 邮件配置
 # =============================================================================
@@ -30,6 +47,8 @@ EMAIL_CONFIG = {
 
 # =============================================================================
 # 竞品资讯来源配置（13家公司）
+# - sorted_listing: 列表按日期倒序，遇到早于窗口起点的条目即停止遍历
+# - ready / detail_ready: 列表页 / 详情页的就绪条件（selector、network_idle_ms、max_wait_ms）
 # =============================================================================
 
 COMPETITOR_SOURCES = {
@@ -37,66 +56,91 @@ COMPETITOR_SOURCES = {
         "name": "TTD",
         "url": "https://www.thetradedesk.com/press-room",
         "type": "press_room",
+        "sorted_listing": True,
+        "ready": {"selector": "a[href*='/press-room/']", "max_wait_ms": 8000},
     },
     "Criteo": {
         "name": "Criteo",
         "url": "https://criteo.investorroom.com/releases",
         "type": "investor_room",
+        "sorted_listing": True,
+        "ready": {"selector": "a[href*='/news/press-releases/']", "max_wait_ms": 8000},
+        "detail_ready": {"selector": ".press-release, .entry-content, article", "max_wait_ms": 5000},
     },
     "Taboola": {
         "name": "Taboola",
         "url": "https://www.taboola.com/press-releases/",
         "type": "press_releases",
+        "ready": {"selector": "article, .post, .entry", "max_wait_ms": 8000},
+        "detail_ready": {"selector": "time", "max_wait_ms": 5000},
     },
     "Teads": {
         "name": "Teads",
         "url": "https://www.teads.com/press-releases/",
         "type": "press_releases",
+        "ready": {"selector": "a[href*='/blog/']", "max_wait_ms": 8000},
+        "detail_ready": {"selector": "time", "max_wait_ms": 5000},
     },
     "AppLovin": {
         "name": "AppLovin",
         "url": "https://investors.applovin.com/",
         "type": "investor",
+        "sorted_listing": True,
+        "ready": {"network_idle_ms": 1000, "max_wait_ms": 10000},
     },
     "mobvista": {
         "name": "mobvista",
         "url": "https://www.mobvista.com/en/investor-relations/overview",
         "type": "investor",
+        "ready": {"selector": ".announce-item", "max_wait_ms": 10000},
     },
     "Moloco": {
         "name": "Moloco",
         "url": "https://www.moloco.com/newsroom",
         "type": "newsroom",
+        "sorted_listing": True,
+        "ready": {"selector": "a[href*='/press-releases/']", "max_wait_ms": 10000},
+        "detail_ready": {"selector": "time", "max_wait_ms": 5000},
     },
     "BIGO Ads": {
         "name": "BIGO Ads",
         "url": "https://www.bigoads.com/resources/blog",
         "type": "blog",
+        "ready": {"selector": "a[href*='/resources/blog/']", "max_wait_ms": 10000},
+        "detail_ready": {"selector": "h1", "network_idle_ms": 500, "max_wait_ms": 5000},
     },
     "Unity": {
         "name": "Unity",
         "url": "https://unity.com/news",
         "type": "news",
+        "ready": {"selector": "article, .news-item", "max_wait_ms": 10000},
     },
     "Viant Technology": {
         "name": "Viant Technology",
         "url": "https://www.viantinc.com/company/news/press-releases/",
         "type": "press_releases",
+        "ready": {"network_idle_ms": 500, "max_wait_ms": 8000},
     },
     "Zeta Global": {
         "name": "Zeta Global",
         "url": "https://investors.zetaglobal.com/news/default.aspx",
         "type": "investor_news",
+        "sorted_listing": True,
+        "ready": {"selector": "table, .item", "max_wait_ms": 10000},
     },
     "PubMatic": {
         "name": "PubMatic",
         "url": "https://investors.pubmatic.com/news-events/news-releases/",
         "type": "news_releases",
+        "sorted_listing": True,
+        "ready": {"network_idle_ms": 500, "max_wait_ms": 8000},
     },
     "Magnite": {
         "name": "Magnite",
         "url": "https://investor.magnite.com/press-releases",
         "type": "press_releases",
+        "sorted_listing": True,
+        "ready": {"selector": "a[href*='/press-releases/']", "max_wait_ms": 8000},
     },
 }
 
@@ -104,6 +148,8 @@ COMPETITOR_SOURCES = {
 # 行业资讯来源配置（2个来源）
 # - AdExchanger: 抓 Popular 前 5 条
 # - Search Engine Land: 抓最新 3 条
+# - heading: 报告中该来源小节的标题（未配置时使用 name），小节按此处顺序排列
+# - detail_ready: 浏览器打开详情页时的就绪条件（同 COMPETITOR_SOURCES）
 # =============================================================================
 
 INDUSTRY_SOURCES = {
@@ -111,11 +157,14 @@ INDUSTRY_SOURCES = {
         "name": "AdExchanger",
         "url": "https://www.adexchanger.com/",
         "max_items": 5,
+        "heading": "📰 AdExchanger Popular",
     },
     "Search Engine Land": {
         "name": "Search Engine Land",
         "url": "https://searchengineland.com/latest-posts",
         "max_items": 3,
+        "heading": "🔍 Search Engine Land",
+        "detail_ready": {"selector": "h1", "max_wait_ms": 5000},
     },
 }
 
@@ -134,6 +183,112 @@ SCRAPER_CONFIG = {
     },
 }
 
+# =============================================================================
+# HTTP 传输层配置（所有 HTTP 抓取器和链接验证共用一个连接池）
+# =============================================================================
+
+TRANSPORT_CONFIG = {
+    "backend": os.getenv("HTTP_TRANSPORT", "requests"),  # requests / httpx
+    "http2": False,  # 仅 httpx 后端有效，需要安装 httpx[http2]
+    "keep_alive": True,
+    "pool_connections": 20,  # 保留连接池的主机数
+    "pool_maxsize": 10,  # 每个主机的连接数
+    "host_pool_sizes": {  # 单独指定主机的连接数
+        "investors.pubmatic.com": 4,
+        "investor.magnite.com": 4,
+    },
+}
+
+# =============================================================================
+# HTML 解析配置
+# =============================================================================
+
+PARSER_CONFIG = {
+    "backend": os.getenv("HTML_PARSER", "lxml"),  # lxml / html.parser（未安装 lxml 时自动退回 html.parser）
+    "content_engine": os.getenv("CONTENT_ENGINE", "soup"),  # soup / selectolax（正文提取，需要安装 selectolax）
+}
+
+# =============================================================================
+# 浏览器配置（PlaywrightFetcher / StealthFetcher / IndustryFetcher 共享）
+# =============================================================================
+
+BROWSER_CONFIG = {
+    "headless": True,
+    "max_pages": 8,  # 同时打开的页面上限（每个浏览器线程最多同时占用列表页+详情页 2 个）
+    "page_wait_timeout": 120,  # 等待空闲页面名额的秒数
+    "per_host_limit": 3,  # 异步引擎对同一站点的并发详情页上限
+    # 未配置 ready / detail_ready 的页面使用的就绪条件
+    "default_ready": {"network_idle_ms": 500, "max_wait_ms": 5000},
+}
+
+# =============================================================================
+# 混合抓取流水线配置（HTTP -> Playwright -> Stealth，每层独立线程池）
+# 浏览器数量：同步 Playwright 对象绑定线程，每个 playwright / stealth 工作线程各自启动一个 Chromium；
+# stealth 工作线程处理异步引擎的公司时（AsyncStealthFetcher.fetch_companies）再临时启动一个。
+# 因此同时运行的 Chromium 最多为 playwright_workers + 2 * stealth_workers（默认 6 个），
+# 调整线程数时按机器内存控制这两项。
+# =============================================================================
+
+PIPELINE_CONFIG = {
+    "http_workers": 4,
+    "playwright_workers": 2,
+    "stealth_workers": 2,
+    # 等待全部公司完成的最长时间（秒），超时后返回已抓到的结果；应小于调用方的总超时（480s）
+    "timeout": 420,
+}
+
+# =============================================================================
+# 本地状态缓存配置（跨运行保存的抓取/摘要状态）
+# =============================================================================
+
+CACHE_CONFIG = {
+    "cache_dir": os.getenv(
+        "REPORT_CACHE_DIR",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache"),
+    ),
+    "tier_outcomes_file": "tier_outcomes.json",
+    "tier_reprobe_every": 4,  # 每隔 N 次运行从 HTTP 层重新探测一次
+    # HTTP 条件请求缓存（ETag / Last-Modified）
+    "http_cache_enabled": True,
+    "http_cache_dir": "http",
+    "http_cache_max_mb": 200,
+    "http_cache_max_age_days": 30,
+    # 已打开过的详情页（日期、标题、正文哈希、摘要）
+    "crawl_state_file": "crawl_state.json",
+    "crawl_state_max_age_days": 180,
+    # AI 摘要 / 中文标题缓存（按模型、提示词版本、标题、截断后正文的哈希）
+    "summary_cache_enabled": os.getenv("SUMMARY_CACHE", "1") != "0",
+    "summary_cache_file": "summary_cache.json",
+    "summary_cache_max_entries": 2000,  # 超出时淘汰最久未使用的条目
+}
+
+# =============================================================================
+# 条目历史库（每次抓取到的 ContentItem 追加写入 SQLite，按日期 / 来源 / URL 查询）
+# =============================================================================
+
+ITEM_STORE_CONFIG = {
+    "path": os.getenv("ITEM_STORE_PATH", os.path.join(CACHE_CONFIG["cache_dir"], "items.sqlite3")),
+    "reuse_hours": 12,  # 该时间内完整抓取过且窗口覆盖本次窗口时，直接用库中数据生成报告
+}
+
+# =============================================================================
+# 链接验证配置（Validator）
+# =============================================================================
+
+VALIDATION_CONFIG = {
+    "timeout": 15,
+    "workers": 8,  # 并发检查的链接数
+    "per_host_limit": 2,  # 同一主机同时进行的检查数
+    # 抓取器在该时间内成功打开过的链接直接视为可用（CrawlState / HTTP 缓存记录）
+    "recently_seen_hours": 6,
+    # 跨运行的链接状态缓存：可用链接 ok_ttl_hours 内不再检查，404/410 在 dead_ttl_hours 内直接判为不可用
+    # 超时、5xx 等临时失败不缓存；VALIDATE_FORCE=1 时忽略缓存重新检查
+    "status_cache_file": "link_status.json",
+    "ok_ttl_hours": 72,
+    "dead_ttl_hours": 24,
+    "force_revalidate": os.getenv("VALIDATE_FORCE", "0") == "1",
+}
+
 # =============================================================================
 # 内容配置
 # =============================================================================
@@ -142,6 +297,8 @@ CONTENT_CONFIG = {
     "summary_min_length": 80,
     "summary_max_length": 100,
     "industry_max_items": 3,
+    # 详情页正文最多提取的字符数（摘要生成最多使用前 3000 字），0 表示不限
+    "detail_text_budget": 3000,
 }
 
 # =============================================================================
@@ -97,28 +97,14 @@ try:
     
     # 竞品摘要
     if competitor_items:
-        for i, item in enumerate(competitor_items, 1):
-            print(f"  [竞品 {i}/{len(competitor_items)}] {item.title[:35]}...")
-            try:
-                item.summary = summarizer.summarize(item.title, item.summary)
-                print(f"      ✓ {len(item.summary)} 字")
-            except Exception as e:
-                print(f"      ✗ 摘要生成失败: {e}")
-                item.summary = item.summary[:100] if item.summary else "摘要生成失败"
+        summarizer.summarize_items(competitor_items, "竞品")
     else:
         print("  没有竞品内容需要生成摘要")
     
     # 行业摘要
     if total_ind > 0:
-        for module, items in industry_items.items():
-            for item in items:
-                print(f"  [行业-{module}] {item.title[:35]}...")
-                try:
-                    item.summary = summarizer.summarize(item.title, item.summary)
-                    print(f"      ✓ {len(item.summary)} 字")
-                except Exception as e:
-                    print(f"      ✗ 摘要生成失败: {e}")
-                    item.summary = item.summary[:100] if item.summary else "摘要生成失败"
+        industry_list = [item for items in industry_items.values() for item in items]
+        summarizer.summarize_items(industry_list, "行业")
     else:
         print("  没有行业内容需要生成摘要")
         
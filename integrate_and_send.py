@@ -8,6 +8,8 @@ import json
 import os
 import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -16,6 +18,18 @@ sys.path.insert(0, 'src')
 from fetchers.base import ContentItem
 from renderer import HTMLRenderer
 from email_sender import send_weekly_report
+from summary_cache import cache_key, get_summary_cache
+from rate_limit import TokenBucket
+from config.settings import DEEPSEEK_API_BASE, SUMMARY_CONFIG
+
+TITLE_SUMMARY_MODEL = "deepseek-chat"
+# 修改提示词后递增，使旧的缓存结果失效
+TITLE_SUMMARY_PROMPT_VERSION = "title-summary-v1"
+
+# 整个运行共用一个客户端（复用连接池），并发请求共用一个令牌桶
+_client = None
+_client_lock = threading.Lock()
+_rate_limiter = TokenBucket(SUMMARY_CONFIG["requests_per_second"], SUMMARY_CONFIG["burst"])
 
 
 def load_company_results():
@@ -42,7 +56,7 @@ def load_company_results():
                 company = data.get('company')
                 items = data.get('items', [])
                 if company:
-                    results[company] = [ContentItem(**item) for item in items]
+                    results[company] = [ContentItem.from_dict(item) for item in items]
                     print(f"  ✓ {company}: {len(items)} 条")
         except Exception as e:
             print(f"  ✗ Error loading {json_file}: {e}")
@@ -71,7 +85,7 @@ def load_industry_results():
         results = {}
         total = 0
         for module_name, items in data.items():
-            results[module_name] = [ContentItem(**item) for item in items]
+            results[module_name] = [ContentItem.from_dict(item) for item in items]
             total += len(items)
             print(f"  ✓ {module_name}: {len(items)} 条")
         
@@ -83,25 +97,128 @@ def load_industry_results():
         return {}
 
 
-def generate_chinese_title_summary(title, summary):
-    """使用 DeepSeek 生成中文标题和摘要"""
+def get_openai_client():
+    """获取共享的 OpenAI 客户端（线程安全，429/5xx 由客户端按 max_retries 重试）"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            from openai import OpenAI
+            
+            _client = OpenAI(
+                api_key=os.getenv('DEEPSEEK_API_KEY'),
+                base_url=DEEPSEEK_API_BASE,
+                timeout=SUMMARY_CONFIG["timeout"],
+                max_retries=SUMMARY_CONFIG["max_retries"]
+            )
+        return _client
+
+
+class TitleSummaryParser:
+    """按行解析 "中文标题：" / "中文摘要：" 格式的回复，可逐块输入流式内容"""
+    
+    def __init__(self):
+        self.title = None
+        self.summary = None
+        self._buffer = ""
+    
+    @property
+    def done(self) -> bool:
+        return self.title is not None and self.summary is not None
+    
+    def feed(self, text: str):
+        """输入一段文本，只解析已经完整的行"""
+        self._buffer += text
+        while '\n' in self._buffer:
+            line, self._buffer = self._buffer.split('\n', 1)
+            self._parse_line(line)
+    
+    def close(self):
+        """解析最后一行（没有换行结尾）"""
+        if self._buffer:
+            self._parse_line(self._buffer)
+            self._buffer = ""
+    
+    def _parse_line(self, line: str):
+        line = line.strip()
+        if line.startswith('中文标题：') or line.startswith('中文标题:'):
+            chinese_title = line.split('：', 1)[1].strip() if '：' in line else line.split(':', 1)[1].strip()
+            # 保留分类标签格式如 [AI], [CTV], [Programmatic], [联网电视] 等
+            # 分类标签特点：中括号内2-20个字符，后面跟着空格和正文
+            category_match = re.match(r'^(\[[^\]]{2,20}\])\s*(.+)', chinese_title)
+            if category_match:
+                # 是分类标签格式，保留标签 + 内容
+                chinese_title = category_match.group(1) + ' ' + category_match.group(2).strip()
+            else:
+                # 不是分类标签，移除可能的纯方括号包裹
+                chinese_title = chinese_title.strip('[]')
+            self.title = chinese_title
+        elif line.startswith('中文摘要：') or line.startswith('中文摘要:'):
+            chinese_summary = line.split('：', 1)[1].strip() if '：' in line else line.split(':', 1)[1].strip()
+            # 摘要一般没有分类标签，直接移除可能的方括号包裹
+            self.summary = chinese_summary.strip('[]')
+
+
+def _request_title_summary(prompt: str, stream: bool) -> TitleSummaryParser:
+    """调用 DeepSeek 并解析回复；流式模式下两个字段都解析出来后立即结束请求"""
+    client = get_openai_client()
+    parser = TitleSummaryParser()
+    _rate_limiter.acquire()
+    
+    if not stream:
+        response = client.chat.completions.create(
+            model=TITLE_SUMMARY_MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=300,
+            temperature=0.7
+        )
+        parser.feed(response.choices[0].message.content.strip())
+        parser.close()
+        return parser
+    
+    response = client.chat.completions.create(
+        model=TITLE_SUMMARY_MODEL,
+        messages=[{"role": "user", "content": prompt}],
+        max_tokens=300,
+        temperature=0.7,
+        stream=True
+    )
+    try:
+        for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parser.feed(chunk.choices[0].delta.content)
+                if parser.done:
+                    break
+    finally:
+        response.close()
+    parser.close()
+    return parser
+
+
+def generate_chinese_title_summary(title, summary, stream: bool = None):
+    """
+    使用 DeepSeek 生成中文标题和摘要
+    :param stream: 是否流式接收，默认取 SUMMARY_CONFIG["stream"]
+    """
     api_key = os.getenv('DEEPSEEK_API_KEY')
     if not api_key:
         return title, summary[:200] if summary else "无摘要"
     
+    content = (summary or "")[:500]
+    cache = get_summary_cache()
+    key = cache_key("title_summary", TITLE_SUMMARY_MODEL, TITLE_SUMMARY_PROMPT_VERSION, title, content)
+    cached = cache.get(key)
+    if cached:
+        return tuple(cached)
+    
+    if stream is None:
+        stream = SUMMARY_CONFIG["stream"]
+    
     try:
-        from openai import OpenAI
-        
-        client = OpenAI(
-            api_key=api_key,
-            base_url="https://api.deepseek.com"
-        )
-        
         prompt = f"""请将以下英文新闻标题和内容翻译成中文。
 
 原标题：{title}
 
-内容：{summary[:500]}
+内容：{content}
 
 翻译要求：
 1. 人名、公司名、品牌名、股票代码、产品名等专有名词保留英文，不要翻译
@@ -114,37 +231,15 @@ def generate_chinese_title_summary(title, summary):
 
 请确保中文标题简洁明了，不超过30个字。"""
         
-        response = client.chat.completions.create(
-            model="deepseek-chat",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=300,
-            temperature=0.7
-        )
-        
-        result = response.choices[0].message.content.strip()
+        parser = _request_title_summary(prompt, stream)
         
         # 解析结果
-        chinese_title = title
-        chinese_summary = summary[:200] if summary else "无摘要"
-        
-        for line in result.split('\n'):
-            line = line.strip()
-            if line.startswith('中文标题：') or line.startswith('中文标题:'):
-                chinese_title = line.split('：', 1)[1].strip() if '：' in line else line.split(':', 1)[1].strip()
-                # 保留分类标签格式如 [AI], [CTV], [Programmatic], [联网电视] 等
-                # 分类标签特点：中括号内2-20个字符，后面跟着空格和正文
-                category_match = re.match(r'^(\[[^\]]{2,20}\])\s*(.+)', chinese_title)
-                if category_match:
-                    # 是分类标签格式，保留标签 + 内容
-                    chinese_title = category_match.group(1) + ' ' + category_match.group(2).strip()
-                else:
-                    # 不是分类标签，移除可能的纯方括号包裹
-                    chinese_title = chinese_title.strip('[]')
-            elif line.startswith('中文摘要：') or line.startswith('中文摘要:'):
-                chinese_summary = line.split('：', 1)[1].strip() if '：' in line else line.split(':', 1)[1].strip()
-                # 摘要一般没有分类标签，直接移除可能的方括号包裹
-                chinese_summary = chinese_summary.strip('[]')
+        chinese_title = parser.title or title
+        chinese_summary = parser.summary or (summary[:200] if summary else "无摘要")
         
+        # 只缓存解析出中文摘要的结果
+        if parser.summary:
+            cache.put(key, [chinese_title, chinese_summary])
         return chinese_title, chinese_summary
         
     except Exception as e:
@@ -152,6 +247,19 @@ def generate_chinese_title_summary(title, summary):
         return title, summary[:200] if summary else "无摘要"
 
 
+def translate_items(items):
+    """并发生成中文标题和摘要并写回条目"""
+    if not items:
+        return
+    workers = min(SUMMARY_CONFIG["concurrency"], len(items))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="translate") as pool:
+        futures = {pool.submit(generate_chinese_title_summary, item.title, item.summary): item for item in items}
+        for done, future in enumerate(as_completed(futures), 1):
+            item = futures[future]
+            print(f"  [{done}/{len(items)}] {item.source} | {item.title[:40]}...")
+            item.title, item.summary = future.result()
+
+
 def main():
     print("=" * 70)
     print("周报整合系统 - 纯整合模式")
@@ -201,16 +309,11 @@ def main():
     if use_ai_summary:
         print("\n[3/4] 生成中文标题和摘要...")
         
-        # 竞品资讯
-        for i, item in enumerate(competitor_items, 1):
-            print(f"  [{i}/{len(competitor_items)}] {item.title[:40]}...")
-            item.title, item.summary = generate_chinese_title_summary(item.title, item.summary)
+        # 竞品和行业资讯一起提交，共享客户端、并发名额和限速
+        industry_list = [item for items in industry_results.values() for item in items]
+        translate_items(competitor_items + industry_list)
         
-        # 行业资讯
-        for module, items in industry_results.items():
-            for item in items:
-                print(f"  [行业-{module}] {item.title[:40]}...")
-                item.title, item.summary = generate_chinese_title_summary(item.title, item.summary)
+        get_summary_cache().report()
     else:
         # 截断原文作为摘要
         for item in competitor_items:
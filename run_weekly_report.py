@@ -13,6 +13,8 @@
 - EMAIL_PASSWORD: 发件邮箱密码
 - EMAIL_FROM: 发件人地址（默认与用户名相同）
 - EMAIL_TO: 收件人地址（默认: wangmeng42@baidu.com）
+- REPORT_FROM_STORE: 设为 1 时不抓取，直接用条目历史库中的数据生成报告
+- REPORT_REFRESH: 设为 1 时总是重新抓取，不复用条目历史库中近期的完整抓取记录
 
 定时任务:
 - 北京时间每周一早上 8:00
@@ -21,6 +23,7 @@
 
 import os
 import sys
+import time
 import traceback
 
 sys.path.insert(0, 'src')
@@ -28,11 +31,22 @@ sys.path.insert(0, 'src')
 from datetime import datetime, timedelta
 from fetchers.hybrid_fetcher import HybridCompetitorFetcher
 from fetchers.industry_fetcher import IndustryFetcher
+from fetchers.browser_pool import shutdown_browser_pool
+from fetchers.item_store import get_item_store
+from config.settings import COMPETITOR_SOURCES, INDUSTRY_SOURCES
 from summarizer import Summarizer
 from renderer import HTMLRenderer
 from email_sender import send_weekly_report
 
 
+def stored_run_note(run) -> str:
+    """说明本次使用的是哪条条目库记录"""
+    if not run:
+        return "REPORT_FROM_STORE=1"
+    age = (time.time() - run["finished_at"]) / 3600
+    return f"{age:.1f} 小时前的完整抓取 #{run['id']}，设置 REPORT_REFRESH=1 可强制重新抓取"
+
+
 def main():
     print("=" * 70)
     print("竞品周报自动化系统")
@@ -66,58 +80,94 @@ def main():
         print(f"⚠️ 未设置 DEEPSEEK_API_KEY，将使用原文摘要")
         use_ai_summary = False
     
+    # 条目历史库：近期已完整抓取过覆盖本窗口的数据时直接使用，不再重新抓取（REPORT_REFRESH=1 时总是抓取）
+    store = get_item_store()
+    refresh = os.getenv('REPORT_REFRESH') == '1'
+    from_store = os.getenv('REPORT_FROM_STORE') == '1' and not refresh
+    competitor_groups = list(COMPETITOR_SOURCES.keys())
+    industry_groups = list(INDUSTRY_SOURCES.keys())
+    
     # 1. 抓取竞品资讯（总超时 8 分钟）
     print("\n[1/4] 抓取竞品资讯...")
     competitor_results = {}
     competitor_items = []
     
-    try:
-        import signal
-        
-        def timeout_handler(signum, frame):
-            raise TimeoutError("抓取总超时")
-        
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(480)  # 8分钟总超时
-        
-        fetcher = HybridCompetitorFetcher()
-        competitor_results = fetcher.fetch_all(window_start, window_end)
-        
-        signal.alarm(0)  # 取消超时
-        
-        for company, items in competitor_results.items():
+    stored_run = None if refresh else store.covering_run("competitor", window_start, window_end, competitor_groups)
+    if from_store or stored_run:
+        competitor_results = store.items_between("competitor", window_start, window_end, competitor_groups)
+        for items in competitor_results.values():
             competitor_items.extend(items)
-            print(f"  {company}: {len(items)} 条")
-        
-        print(f"  竞品总计: {len(competitor_items)} 条")
+        print(f"  使用条目库数据: {len(competitor_items)} 条（{stored_run_note(stored_run)}）")
+    else:
+        complete = False
+        try:
+            import signal
+            
+            def timeout_handler(signum, frame):
+                raise TimeoutError("抓取总超时")
+            
+            signal.signal(signal.SIGALRM, timeout_handler)
+            signal.alarm(480)  # 8分钟总超时
+            
+            fetcher = HybridCompetitorFetcher()
+            competitor_results = fetcher.fetch_all(window_start, window_end)
+            
+            signal.alarm(0)  # 取消超时
+            
+            for company, items in competitor_results.items():
+                competitor_items.extend(items)
+                print(f"  {company}: {len(items)} 条")
+            
+            print(f"  竞品总计: {len(competitor_items)} 条")
+            # 全部为空多半是抓取失败（站点改版、浏览器不可用），不作为可复用的完整记录
+            complete = bool(competitor_items)
+            
+        except TimeoutError:
+            print("⚠️ 竞品抓取超时，使用已获取的数据")
+            for company, items in competitor_results.items():
+                competitor_items.extend(items)
+        except Exception as e:
+            print(f"❌ 抓取竞品失败: {e}")
+            traceback.print_exc()
         
-    except TimeoutError:
-        print("⚠️ 竞品抓取超时，使用已获取的数据")
-        for company, items in competitor_results.items():
-            competitor_items.extend(items)
-    except Exception as e:
-        print(f"❌ 抓取竞品失败: {e}")
-        traceback.print_exc()
+        # 摘要生成前写入条目库（保存原文摘要）；未抓到条目的公司也记为空分组，
+        # 否则记录的分组与 competitor_groups 不一致，covering_run 永远无法命中
+        if competitor_results or complete:
+            recorded = {key: competitor_results.get(COMPETITOR_SOURCES[key]["name"], [])
+                        for key in competitor_groups}
+            store.record_run("competitor", recorded, window_start, window_end, complete)
     
     # 2. 抓取行业资讯
     print("\n[2/4] 抓取行业资讯...")
     industry_items = {}
     total_ind = 0
     
-    try:
-        ind_fetcher = IndustryFetcher()
-        industry_items = ind_fetcher.fetch_all(window_start, window_end)
+    stored_run = None if refresh else store.covering_run("industry", window_start, window_end, industry_groups)
+    if from_store or stored_run:
+        industry_items = store.items_between("industry", window_start, window_end, industry_groups)
         total_ind = sum(len(v) for v in industry_items.values())
-        
-        for module, items in industry_items.items():
-            if items:
-                print(f"  {module}: {len(items)} 条")
-        
-        print(f"  行业总计: {total_ind} 条")
-        
-    except Exception as e:
-        print(f"❌ 抓取行业资讯失败: {e}")
-        traceback.print_exc()
+        print(f"  使用条目库数据: {total_ind} 条（{stored_run_note(stored_run)}）")
+    else:
+        try:
+            ind_fetcher = IndustryFetcher()
+            industry_items = ind_fetcher.fetch_all(window_start, window_end)
+            total_ind = sum(len(v) for v in industry_items.values())
+            
+            for module, items in industry_items.items():
+                if items:
+                    print(f"  {module}: {len(items)} 条")
+            
+            print(f"  行业总计: {total_ind} 条")
+            # 有来源抓取出错或为空时只记录条目，不作为可复用的完整记录（每个来源每周都应有文章）
+            complete = not ind_fetcher.failed and all(industry_items.get(g) for g in industry_groups)
+            store.record_run("industry", industry_items, window_start, window_end, complete)
+            
+        except Exception as e:
+            print(f"❌ 抓取行业资讯失败: {e}")
+            traceback.print_exc()
+    
+    # 抓取结束，释放共享浏览器
+    shutdown_browser_pool()
     
     # 3. 生成中文摘要（可选）
     if use_ai_summary and (competitor_items or total_ind > 0):
@@ -126,26 +176,9 @@ def main():
         try:
             summarizer = Summarizer()
             
-            # 竞品摘要
-            for i, item in enumerate(competitor_items, 1):
-                print(f"  [竞品 {i}/{len(competitor_items)}] {item.title[:35]}...")
-                try:
-                    item.summary = summarizer.summarize(item.title, item.summary)
-                    print(f"      ✓ {len(item.summary)} 字")
-                except Exception as e:
-                    print(f"      ✗ 摘要生成失败: {e}")
-                    item.summary = item.summary[:100] if item.summary else "摘要生成失败"
-            
-            # 行业摘要
-            for module, items in industry_items.items():
-                for item in items:
-                    print(f"  [行业-{module}] {item.title[:35]}...")
-                    try:
-                        item.summary = summarizer.summarize(item.title, item.summary)
-                        print(f"      ✓ {len(item.summary)} 字")
-                    except Exception as e:
-                        print(f"      ✗ 摘要生成失败: {e}")
-                        item.summary = item.summary[:100] if item.summary else "摘要生成失败"
+            # 竞品和行业条目一起提交，共享并发名额和限速
+            industry_list = [item for items in industry_items.values() for item in items]
+            summarizer.summarize_items(competitor_items + industry_list)
         
         except Exception as e:
             print(f"❌ 摘要生成模块失败: {e}")
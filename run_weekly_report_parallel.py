@@ -39,7 +39,7 @@ def load_artifacts():
                 company = data.get('company')
                 items = data.get('items', [])
                 if company and items:
-                    results[company] = [ContentItem(**item) for item in items]
+                    results[company] = [ContentItem.from_dict(item) for item in items]
                     print(f"  ✓ Loaded {company}: {len(items)} 条")
         except Exception as e:
             print(f"  ✗ Error loading {json_file}: {e}")
@@ -121,22 +121,9 @@ def main():
         try:
             summarizer = Summarizer()
             
-            for i, item in enumerate(competitor_items, 1):
-                print(f"  [{i}/{len(competitor_items)}] {item.title[:35]}...")
-                try:
-                    item.summary = summarizer.summarize(item.title, item.summary)
-                    print(f"      ✓ {len(item.summary)} 字")
-                except Exception as e:
-                    print(f"      ✗ 失败: {e}")
-            
-            for module, items in industry_items.items():
-                for item in items:
-                    print(f"  [行业-{module}] {item.title[:35]}...")
-                    try:
-                        item.summary = summarizer.summarize(item.title, item.summary)
-                        print(f"      ✓ {len(item.summary)} 字")
-                    except Exception as e:
-                        print(f"      ✗ 失败: {e}")
+            industry_list = [item for items in industry_items.values() for item in items]
+            # 生成失败的条目保留原文
+            summarizer.summarize_items(competitor_items + industry_list, keep_original=True)
         except Exception as e:
             print(f"❌ 摘要生成失败: {e}")
     else:
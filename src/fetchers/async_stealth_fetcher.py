@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+异步 Stealth 抓取器 - 基于 playwright.async_api，并发抓取同一列表下的详情页
+
+列表页解析、详情页解析复用 StealthFetcher 的方法，输出与同步版本相同的 ContentItem 列表。
+对同一站点的并发详情页数量由 BROWSER_CONFIG["per_host_limit"] 限制。
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Dict, Optional
+from urllib.parse import urljoin, urlparse
+
+from .base import ContentItem
+from .browser_pool import LAUNCH_ARGS, CONTEXT_PROFILES
+from .readiness import AsyncPageReadiness, get_ready_condition
+from .listing import passed_window, is_sorted_listing
+from .stealth_fetcher import StealthFetcher, CRITEO_NEWS_URL, CRITEO_DETAIL_SELECTORS
+
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+from config.settings import COMPETITOR_SOURCES, BROWSER_CONFIG
+
+
+class _AsyncRun:
+    """一次 fetch_companies 的事件循环内状态（浏览器上下文、并发名额），不在多次调用间共享"""
+
+    def __init__(self, context, max_pages: int, per_host_limit: int):
+        self.context = context
+        self.page_slots = asyncio.Semaphore(max_pages)
+        self.per_host_limit = per_host_limit
+        self.host_slots: Dict[str, asyncio.Semaphore] = {}
+
+    def host_slot(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc
+        return self.host_slots.setdefault(host, asyncio.Semaphore(self.per_host_limit))
+
+
+class AsyncStealthFetcher(StealthFetcher):
+    """详情页并发抓取的 Stealth 抓取器"""
+
+    # 使用异步引擎的公司 -> 协程方法名
+    ASYNC_COMPANIES = {
+        "Criteo": "_fetch_criteo_async",
+        "Moloco": "_fetch_moloco_async",
+        "BIGO Ads": "_fetch_bigo_ads_async",
+        "Taboola": "_fetch_taboola_async",
+    }
+
+    def __init__(self, per_host_limit: int = None, max_pages: int = None):
+        super().__init__()
+        self.per_host_limit = per_host_limit or BROWSER_CONFIG["per_host_limit"]
+        self.max_pages = max_pages or BROWSER_CONFIG["max_pages"]
+
+    def fetch_companies(self, keys: List[str], window_start: datetime, window_end: datetime) -> Dict[str, List[ContentItem]]:
+        """
+        并发抓取多家公司（共用一个异步浏览器）
+        每次调用有独立的事件循环和 _AsyncRun，可以在多个线程中同时调用
+        :param keys: ASYNC_COMPANIES 中的公司 key
+        :return: {key: items}
+        """
+        keys = [k for k in keys if k in self.ASYNC_COMPANIES]
+        if not keys:
+            return {}
+
+        # 同步 Playwright 所在线程不能再运行事件循环，放到独立线程执行
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(asyncio.run, self._run(keys, window_start, window_end))
+            return future.result()
+
+    async def _run(self, keys: List[str], window_start: datetime, window_end: datetime) -> Dict[str, List[ContentItem]]:
+        results = {key: [] for key in keys}
+
+        try:
+            from playwright.async_api import async_playwright
+        except ImportError:
+            print("  [!] Playwright 不可用，跳过异步抓取")
+            return results
+
+        spec = CONTEXT_PROFILES[self.profile]
+        try:
+            async with async_playwright() as pw:
+                browser = await pw.chromium.launch(headless=BROWSER_CONFIG["headless"], args=LAUNCH_ARGS)
+                try:
+                    context = await browser.new_context(**spec["options"])
+                    if spec["init_script"]:
+                        await context.add_init_script(spec["init_script"])
+                    run = _AsyncRun(context, self.max_pages, self.per_host_limit)
+
+                    outcomes = await asyncio.gather(
+                        *[getattr(self, self.ASYNC_COMPANIES[key])(run, window_start, window_end) for key in keys],
+                        return_exceptions=True
+                    )
+                    for key, outcome in zip(keys, outcomes):
+                        if isinstance(outcome, Exception):
+                            print(f"    ✗ {key} 错误: {outcome}")
+                        else:
+                            results[key] = outcome
+                finally:
+                    await browser.close()
+        except Exception as e:
+            print(f"  [!] 异步浏览器启动失败: {e}")
+
+        return results
+
+    async def _load_html(self, run: _AsyncRun, url: str, source: str, detail: bool = False,
+                         wait_until: str = "domcontentloaded", timeout: int = 30000) -> Optional[str]:
+        """在并发名额内打开页面，等待就绪后返回 HTML，失败返回 None"""
+        async with run.host_slot(url), run.page_slots:
+            page = await run.context.new_page()
+            try:
+                readiness = AsyncPageReadiness(page, get_ready_condition(source, detail))
+                response = await page.goto(url, wait_until=wait_until, timeout=timeout)
+                if detail:
+                    self.crawl_state.record_status(url, response.status if response else None)
+                waited = await readiness.wait()
+                self.wait_log.add(url, source, waited, readiness.met)
+                return await page.content()
+            except Exception as e:
+                print(f"    [Async] 错误: {url[:50]}... {e}")
+                return None
+            finally:
+                await page.close()
+
+    async def _load_many(self, run: _AsyncRun, urls: List[str], source: str) -> List[Optional[str]]:
+        """并发加载多个详情页，结果与 urls 顺序一致"""
+        return await asyncio.gather(*[self._load_html(run, u, source, detail=True) for u in urls])
+
+    async def _load_details(self, run: _AsyncRun, urls: List[str], source: str,
+                            window_start: datetime, window_end: datetime) -> List[tuple]:
+        """
+        并发加载详情页，增量抓取状态中已知的链接不再打开
+        :return: 与 urls 顺序一致的 (known, item, html)
+        """
+        seen = [self._seen_item(u, source, window_start, window_end) for u in urls]
+        pending = [u for u, (known, _) in zip(urls, seen) if not known]
+        loaded = dict(zip(pending, await self._load_many(run, pending, source)))
+        return [(known, item, loaded.get(u)) for u, (known, item) in zip(urls, seen)]
+
+    async def _fetch_criteo_async(self, run: _AsyncRun, window_start: datetime, window_end: datetime) -> List[ContentItem]:
+        items = []
+        print("  [Async] 抓取 Criteo...")
+
+        html = await self._load_html(run, CRITEO_NEWS_URL, "Criteo", timeout=60000)
+        if not html:
+            return items
+
+        candidates = self._criteo_candidates(html, CRITEO_NEWS_URL, window_start, window_end)
+        # 以前打开过的详情页直接使用记录的正文和日期
+        entries = {c[0]: self.crawl_state.get(c[0]) or {} for c in candidates}
+
+        # 按 per_host_limit 分批打开详情页，凑满 3 条后不再打开
+        batch_size = self.per_host_limit or 1
+        for start in range(0, len(candidates), batch_size):
+            batch = candidates[start:start + batch_size]
+            pending = [c[0] for c in batch if not entries[c[0]].get("summary")]
+            loaded = dict(zip(pending, await self._load_many(run, pending, "Criteo")))
+
+            for detail_url, title, date_str in batch:
+                try:
+                    content, detail_date = "", ""
+                    entry = entries[detail_url]
+                    if entry.get("summary"):
+                        content, detail_date = entry["summary"], entry.get("date", "")
+                    elif loaded.get(detail_url):
+                        content, detail_date = self._parse_detail_content(loaded[detail_url], detail_url, CRITEO_DETAIL_SELECTORS)
+                        self.crawl_state.remember(detail_url, detail_date, None, content)
+                    item = self._criteo_item(detail_url, title, date_str, content, detail_date, window_start, window_end)
+                    if item:
+                        items.append(item)
+                except Exception as e:
+                    continue
+
+                # 限制最多3条
+                if len(items) >= 3:
+                    break
+            if len(items) >= 3:
+                break
+
+        print(f"    Criteo: {len(items)} 条")
+        return items
+
+    async def _fetch_moloco_async(self, run: _AsyncRun, window_start: datetime, window_end: datetime) -> List[ContentItem]:
+        items = []
+        url = COMPETITOR_SOURCES["Moloco"]["url"]
+        print("  [Async] 抓取 Moloco...")
+
+        html = await self._load_html(run, url, "Moloco", wait_until="load", timeout=120000)
+        if not html:
+            return items
+
+        detail_urls = []
+        for href in self._moloco_detail_links(html)[:10]:
+            detail_url = urljoin(url, href)
+            if detail_url not in detail_urls:
+                detail_urls.append(detail_url)
+
+        # 列表按日期倒序时分批打开详情页，某批出现早于窗口起点的日期后停止
+        batch_size = self.per_host_limit if is_sorted_listing("Moloco") else len(detail_urls)
+        passed = False
+        for start in range(0, len(detail_urls), batch_size or 1):
+            batch = detail_urls[start:start + batch_size]
+            details = await self._load_details(run, batch, "Moloco", window_start, window_end)
+            for detail_url, (known, seen_item, detail_html) in zip(batch, details):
+                item = seen_item
+                if not known and detail_html:
+                    try:
+                        item = self._moloco_item(detail_html, detail_url, len(items), window_start, window_end)
+                    except Exception as e:
+                        print(f" ✗ 详情页错误: {e}")
+                if item:
+                    items.append(item)
+                if passed_window("Moloco", self.crawl_state.known_date(detail_url), window_start):
+                    passed = True
+                    break
+            if passed:
+                break
+
+        print(f"    Moloco: {len(items)} 条")
+        return items
+
+    async def _fetch_bigo_ads_async(self, run: _AsyncRun, window_start: datetime, window_end: datetime) -> List[ContentItem]:
+        items = []
+        url = COMPETITOR_SOURCES["BIGO Ads"]["url"]
+        print("  [Async] 抓取 BIGO Ads...")
+
+        html = await self._load_html(run, url, "BIGO Ads", wait_until="load", timeout=120000)
+        if not html:
+            return items
+
+        detail_urls = []
+        for href in self._bigo_detail_links(html)[:3]:
+            detail_url = urljoin(url, href)
+            if detail_url not in detail_urls:
+                detail_urls.append(detail_url)
+
+        details = await self._load_details(run, detail_urls, "BIGO Ads", window_start, window_end)
+        for detail_url, (known, seen_item, detail_html) in zip(detail_urls, details):
+            if known:
+                if seen_item:
+                    items.append(seen_item)
+                continue
+            if not detail_html:
+                continue
+            try:
+                item = self._bigo_item(detail_html, detail_url, window_start, window_end)
+                if item:
+                    items.append(item)
+            except Exception as e:
+                print(f"        ✗ 详情页错误: {e}")
+
+        print(f"    BIGO Ads: {len(items)} 条")
+        return items
+
+    async def _fetch_taboola_async(self, run: _AsyncRun, window_start: datetime, window_end: datetime) -> List[ContentItem]:
+        items = []
+        url = COMPETITOR_SOURCES["Taboola"]["url"]
+        print("  [Async] 抓取 Taboola...")
+
+        html = await self._load_html(run, url, "Taboola", timeout=60000)
+        if not html:
+            return items
+
+        candidates = self._taboola_candidates(html, url)
+        details = await self._load_details(run, [c[0] for c in candidates], "Taboola", window_start, window_end)
+
+        for (detail_url, title), (known, seen_item, detail_html) in zip(candidates, details):
+            if known:
+                if seen_item:
+                    items.append(seen_item)
+                continue
+            if not detail_html:
+                continue
+            try:
+                item = self._taboola_item(detail_html, detail_url, title, window_start, window_end)
+                if item:
+                    items.append(item)
+            except Exception as e:
+                continue
+
+        print(f"    Taboola: {len(items)} 条")
+        return items
+
+    # 同步入口：与 StealthFetcher 接口保持一致
+
+    def fetch_criteo(self, window_start: datetime, window_end: datetime) -> List[ContentItem]:
+        return self.fetch_companies(["Criteo"], window_start, window_end).get("Criteo", [])
+
+    def fetch_moloco(self, window_start: datetime, window_end: datetime) -> List[ContentItem]:
+        return self.fetch_companies(["Moloco"], window_start, window_end).get("Moloco", [])
+
+    def fetch_bigo_ads(self, window_start: datetime, window_end: datetime) -> List[ContentItem]:
+        return self.fetch_companies(["BIGO Ads"], window_start, window_end).get("BIGO Ads", [])
+
+    def fetch_taboola(self, window_start: datetime, window_end: datetime) -> List[ContentItem]:
+        return self.fetch_companies(["Taboola"], window_start, window_end).get("Taboola", [])
@@ -4,14 +4,16 @@
 
 import re
 import time
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
-import requests
 from bs4 import BeautifulSoup
 
+from .transport import Transport, get_transport
+from .http_cache import get_http_cache
+from .dates import parse_date
+
 import sys
 import os
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -19,33 +21,94 @@ sys.path.insert(0, project_root)
 from config.settings import SCRAPER_CONFIG
 
 
-@dataclass
+_date_fromisoformat = date.fromisoformat
+
+
+def _to_day(value) -> Optional[date]:
+    """YYYY-MM-DD（月、日可不补零，如 2026-2-9）/ date / datetime 转为 date，无效时返回 None"""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        # 补零的标准格式走 fromisoformat，其余按 %Y-%m-%d 解析后统一格式
+        if len(value) == 10 and value[4] == '-' and value[7] == '-':
+            return _date_fromisoformat(value)
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
 class ContentItem:
-    """内容条目"""
-    title: str
-    summary: str
-    date: str  # YYYY-MM-DD
-    url: str
-    source: str
+    """
+    内容条目
+    使用 __slots__，日期以 datetime.date 保存，.date 读取时格式化为 YYYY-MM-DD（无效日期为空字符串）；
+    source（公司 / 来源名）在进程内驻留，同名条目共享一个字符串。
+    """
+    __slots__ = ('title', 'summary', 'day', 'url', 'source')
     
-    def __post_init__(self):
-        # 验证日期格式
-        if self.date:
-            try:
-                datetime.strptime(self.date, "%Y-%m-%d")
-            except ValueError:
-                self.date = ""
+    def __init__(self, title: str, summary: str, date: str, url: str, source: str):
+        self.title = title
+        self.summary = summary
+        self.day = _to_day(date)
+        self.url = url
+        self.source = sys.intern(source) if source else source
+    
+    @property
+    def date(self) -> str:
+        return self.day.isoformat() if self.day else ""
+    
+    @date.setter
+    def date(self, value):
+        self.day = _to_day(value)
+    
+    @classmethod
+    def trusted(cls, title: str, summary: str, date: str, url: str, source: str) -> 'ContentItem':
+        """
+        从可信数据（自己写出的 artifacts / 存储）构建，跳过 __init__
+        日期同样经 _to_day 规范化：旧版本写出的 artifacts 中可能有不补零的日期（如 2026-2-9）
+        """
+        item = cls.__new__(cls)
+        item.title = title
+        item.summary = summary
+        item.day = _to_day(date)
+        item.url = url
+        item.source = sys.intern(source) if source else source
+        return item
+    
+    @classmethod
+    def from_dict(cls, data: dict, trusted: bool = True) -> 'ContentItem':
+        """从 to_dict() 的结果构建"""
+        build = cls.trusted if trusted else cls
+        return build(data['title'], data['summary'], data['date'], data['url'], data['source'])
+    
+    def to_dict(self) -> dict:
+        return {'title': self.title, 'summary': self.summary, 'date': self.date,
+                'url': self.url, 'source': self.source}
+    
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.title, self.summary, self.day, self.url, self.source) == \
+               (other.title, other.summary, other.day, other.url, other.source)
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        return (f"ContentItem(title={self.title!r}, summary={self.summary!r}, date={self.date!r}, "
+                f"url={self.url!r}, source={self.source!r})")
 
 
 class BaseFetcher:
     """抓取器基类"""
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": SCRAPER_CONFIG["user_agent"],
-            **SCRAPER_CONFIG["headers"]
-        })
+    def __init__(self, transport: Transport = None):
+        # 共享连接池；session 保留为旧代码使用的别名
+        self.transport = transport or get_transport()
+        self.session = self.transport
+        self.http_cache = get_http_cache()
         self.timeout = SCRAPER_CONFIG["timeout"]
         self.retry_times = SCRAPER_CONFIG["retry_times"]
         self.retry_delay = SCRAPER_CONFIG["retry_delay"]
@@ -56,14 +119,29 @@ class BaseFetcher:
         :param url: 目标 URL
         :return: HTML 内容或 None
         """
+        # 已缓存的页面发送条件请求，304 时直接使用磁盘内容
+        caller_headers = kwargs.pop("headers", None) or {}
+        conditional = self.http_cache.conditional_headers(url) if self.http_cache else {}
+        
         for attempt in range(self.retry_times):
             try:
-                response = self.session.get(
+                headers = {**conditional, **caller_headers}
+                response = self.transport.get(
                     url, 
                     timeout=self.timeout,
+                    headers=headers or None,
                     **kwargs
                 )
+                if response.status_code == 304 and conditional:
+                    cached = self.http_cache.load(url)
+                    if cached is not None:
+                        return cached
+                    # 缓存文件丢失，去掉条件头重新请求
+                    conditional = {}
+                    continue
                 response.raise_for_status()
+                if self.http_cache:
+                    self.http_cache.store(url, response)
                 return response.text
             except Exception as e:
                 print(f"    [!] 请求失败 (尝试 {attempt + 1}/{self.retry_times}): {str(e)[:80]}")
@@ -79,44 +157,7 @@ class BaseFetcher:
         :param date_str: 日期字符串
         :return: YYYY-MM-DD 或 None
         """
-        if not date_str:
-            return None
-        
-        date_str = date_str.strip()
-        
-        # 常见日期格式
-        patterns = [
-            (r"(\d{4})-(\d{1,2})-(\d{1,2})", lambda m: f"{m.group(1)}-{int(m.group(2)):02d}-{int(m.group(3)):02d}"),
-            (r"(\d{1,2})/(\d{1,2})/(\d{4})", lambda m: f"{m.group(3)}-{int(m.group(1)):02d}-{int(m.group(2)):02d}"),
-            (r"(\d{1,2})-(\d{1,2})-(\d{4})", lambda m: f"{m.group(3)}-{int(m.group(1)):02d}-{int(m.group(2)):02d}"),
-            (r"(\d{4})/(\d{1,2})/(\d{1,2})", lambda m: f"{m.group(1)}-{int(m.group(2)):02d}-{int(m.group(3)):02d}"),
-            (r"(\d{4})\.(\d{1,2})\.(\d{1,2})", lambda m: f"{m.group(1)}-{int(m.group(2)):02d}-{int(m.group(3)):02d}"),
-            # 英文月份格式
-            (r"(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(\d{4})", 
-             lambda m: f"{m.group(3)}-{self._month_abbr_to_num(m.group(2)):02d}-{int(m.group(1)):02d}"),
-            (r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(\d{1,2}),?\s+(\d{4})", 
-             lambda m: f"{m.group(3)}-{self._month_abbr_to_num(m.group(1)):02d}-{int(m.group(2)):02d}"),
-            # ISO 格式
-            (r"(\d{4}-\d{2}-\d{2})T", lambda m: m.group(1)),
-        ]
-        
-        for pattern, formatter in patterns:
-            match = re.search(pattern, date_str, re.IGNORECASE)
-            if match:
-                try:
-                    return formatter(match)
-                except:
-                    continue
-        
-        return None
-    
-    def _month_abbr_to_num(self, month_abbr: str) -> int:
-        """月份缩写转数字"""
-        months = {
-            'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
-            'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-        }
-        return months.get(month_abbr.lower()[:3], 1)
+        return parse_date(date_str)
     
     def is_in_date_window(self, date_str: str, window_start: datetime, window_end: datetime) -> bool:
         """
@@ -0,0 +1,243 @@
+"""
+共享浏览器池 - PlaywrightFetcher / StealthFetcher / IndustryFetcher 共用同一个 Chromium
+
+Playwright 同步 API 的对象绑定在创建它的线程上，因此池按线程持有浏览器实例：
+同一线程内的所有抓取器共享一个浏览器，页面并发数由全局信号量统一限制。
+"""
+
+import atexit
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+from config.settings import BROWSER_CONFIG
+
+
+# Chromium 启动参数（原 StealthFetcher / PlaywrightFetcher.fetch_applovin 使用的参数）
+LAUNCH_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-background-timer-throttling',
+    '--disable-breakpad',
+    '--disable-features=TranslateUI',
+    '--disable-ipc-flooding-protection',
+    '--disable-renderer-backgrounding',
+    '--enable-features=NetworkService',
+    '--force-color-profile=srgb',
+    '--metrics-recording-only',
+    '--mute-audio',
+]
+
+STEALTH_INIT_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+    window.chrome = {runtime: {}, loadTimes: function() {}, csi: function() {}, app: {}};
+    Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
+"""
+
+# 上下文配置：default 供普通 Playwright / 行业抓取使用，stealth 用于绕过反爬
+CONTEXT_PROFILES = {
+    "default": {
+        "options": {
+            "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            "viewport": {"width": 1280, "height": 800},
+        },
+        "init_script": None,
+    },
+    "stealth": {
+        "options": {
+            "viewport": {"width": 1920, "height": 1080},
+            "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+            "locale": "en-US",
+            "timezone_id": "America/New_York",
+        },
+        "init_script": STEALTH_INIT_SCRIPT,
+    },
+}
+
+
+class _BrowserHandle:
+    """单个线程持有的 Playwright 驱动、浏览器及其上下文"""
+
+    def __init__(self, pw, browser):
+        self.pw = pw
+        self.browser = browser
+        self.contexts: Dict[str, object] = {}
+
+    def close(self):
+        for context in self.contexts.values():
+            try:
+                context.close()
+            except Exception:
+                pass
+        self.contexts = {}
+        try:
+            self.browser.close()
+        except Exception:
+            pass
+        try:
+            self.pw.stop()
+        except Exception:
+            pass
+
+
+class BrowserPool:
+    """进程级浏览器池：按需启动浏览器，按配置租用上下文和页面"""
+
+    def __init__(self, max_pages: int = None, headless: bool = None, page_wait_timeout: float = None):
+        self.max_pages = max_pages or BROWSER_CONFIG["max_pages"]
+        self.headless = BROWSER_CONFIG["headless"] if headless is None else headless
+        self.page_wait_timeout = page_wait_timeout or BROWSER_CONFIG["page_wait_timeout"]
+        self._page_slots = threading.BoundedSemaphore(self.max_pages)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._handles: Dict[int, _BrowserHandle] = {}
+        self._leased = set()
+        self.launch_count = 0
+
+    def _get_handle(self) -> Optional[_BrowserHandle]:
+        """获取当前线程的浏览器，首次调用时启动"""
+        handle = getattr(self._local, "handle", None)
+        if handle is not None:
+            return handle
+
+        try:
+            from playwright.sync_api import sync_playwright
+            pw = sync_playwright().start()
+            try:
+                browser = pw.chromium.launch(headless=self.headless, args=LAUNCH_ARGS)
+            except Exception:
+                pw.stop()
+                raise
+        except Exception as e:
+            print(f"  [!] 浏览器启动失败: {e}")
+            return None
+
+        handle = _BrowserHandle(pw, browser)
+        self._local.handle = handle
+        with self._lock:
+            self._handles[threading.get_ident()] = handle
+            self.launch_count += 1
+        return handle
+
+    def is_available(self) -> bool:
+        """确保当前线程的浏览器已启动"""
+        return self._get_handle() is not None
+
+    def get_context(self, profile: str = "default"):
+        """
+        获取（必要时创建）指定配置的浏览器上下文
+        :param profile: CONTEXT_PROFILES 中的配置名
+        :return: BrowserContext 或 None
+        """
+        handle = self._get_handle()
+        if handle is None:
+            return None
+
+        context = handle.contexts.get(profile)
+        if context is None:
+            spec = CONTEXT_PROFILES[profile]
+            context = handle.browser.new_context(**spec["options"])
+            if spec["init_script"]:
+                context.add_init_script(spec["init_script"])
+            handle.contexts[profile] = context
+        return context
+
+    def acquire_page(self, profile: str = "default"):
+        """
+        租用一个页面，占用一个并发名额
+        :param profile: 上下文配置名
+        :return: Page
+        """
+        if not self._page_slots.acquire(timeout=self.page_wait_timeout):
+            raise RuntimeError(f"等待浏览器页面超时（上限 {self.max_pages} 个并发页面）")
+        try:
+            context = self.get_context(profile)
+            if context is None:
+                raise RuntimeError("浏览器不可用")
+            page = context.new_page()
+        except Exception:
+            self._page_slots.release()
+            raise
+
+        with self._lock:
+            self._leased.add(id(page))
+        return page
+
+    def release_page(self, page):
+        """关闭并归还页面，重复调用是安全的"""
+        if page is None:
+            return
+        with self._lock:
+            if id(page) not in self._leased:
+                return
+            self._leased.discard(id(page))
+        try:
+            page.close()
+        except Exception:
+            pass
+        finally:
+            self._page_slots.release()
+
+    @contextmanager
+    def page(self, profile: str = "default"):
+        """以上下文管理器形式租用页面"""
+        page = self.acquire_page(profile)
+        try:
+            yield page
+        finally:
+            self.release_page(page)
+
+    def close_current_thread(self):
+        """关闭当前线程持有的浏览器（工作线程退出前调用）"""
+        handle = getattr(self._local, "handle", None)
+        if handle is None:
+            return
+        self._local.handle = None
+        with self._lock:
+            self._handles.pop(threading.get_ident(), None)
+        handle.close()
+
+    def shutdown(self):
+        """
+        关闭当前线程的浏览器，并丢弃其他线程的浏览器引用
+        同步 Playwright 对象只能由创建它的线程关闭，跨线程调用可能抛错或挂起；
+        工作线程应在退出前自行调用 close_current_thread()，遗留的浏览器进程随 Playwright 驱动退出
+        """
+        self.close_current_thread()
+        with self._lock:
+            orphaned = len(self._handles)
+            self._handles = {}
+        if orphaned:
+            print(f"  [!] {orphaned} 个浏览器属于其他线程，未关闭（仅丢弃引用）")
+
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """获取进程级共享浏览器池"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool()
+            atexit.register(_pool.shutdown)
+        return _pool
+
+
+def shutdown_browser_pool():
+    """关闭共享浏览器池（下次使用时会重新启动）"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        atexit.unregister(pool.shutdown)
+        pool.shutdown()
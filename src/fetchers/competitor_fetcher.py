@@ -8,9 +8,9 @@ from datetime import datetime
 from typing import List, Optional, Dict, Callable
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
-
 from .base import BaseFetcher, ContentItem
+from .parsing import make_soup
+from .document import Document
 
 import sys
 import os
@@ -70,7 +70,7 @@ class CompetitorFetcher(BaseFetcher):
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         items = []
         
         # TTD press room 结构
@@ -125,7 +125,7 @@ class CompetitorFetcher(BaseFetcher):
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         items = []
         
         # Criteo investor room 结构
@@ -174,7 +174,7 @@ class CompetitorFetcher(BaseFetcher):
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         items = []
         
         # Taboola press releases
@@ -221,7 +221,7 @@ class CompetitorFetcher(BaseFetcher):
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         items = []
         
         articles = soup.find_all('article') or soup.find_all('div', class_=re.compile('press|news|card'))
@@ -267,7 +267,7 @@ class CompetitorFetcher(BaseFetcher):
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         items = []
         
         articles = soup.find_all('article') or soup.find_all('div', class_=re.compile('news|post|card'))
@@ -313,7 +313,7 @@ class CompetitorFetcher(BaseFetcher):
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         items = []
         
         articles = soup.find_all('article') or soup.find_all('div', class_=re.compile('blog|post|card|entry'))
@@ -359,7 +359,7 @@ class CompetitorFetcher(BaseFetcher):
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         items = []
         
         articles = soup.find_all('article') or soup.find_all('div', class_=re.compile('press|news|card|entry'))
@@ -405,7 +405,7 @@ class CompetitorFetcher(BaseFetcher):
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         items = []
         
         articles = soup.find_all('article') or soup.find_all('div', class_=re.compile('blog|post|card|entry'))
@@ -451,7 +451,7 @@ class CompetitorFetcher(BaseFetcher):
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         items = []
         
         articles = soup.find_all('article') or soup.find_all('div', class_=re.compile('news|post|card|entry'))
@@ -497,7 +497,7 @@ class CompetitorFetcher(BaseFetcher):
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         items = []
         
         articles = soup.find_all('article') or soup.find_all('div', class_=re.compile('press|news|release'))
@@ -543,7 +543,7 @@ class CompetitorFetcher(BaseFetcher):
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         items = []
         
         rows = soup.find_all('tr', class_=re.compile('item')) or soup.find_all('div', class_=re.compile('item|news'))
@@ -588,7 +588,7 @@ class CompetitorFetcher(BaseFetcher):
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         items = []
         
         articles = soup.find_all('article') or soup.find_all('div', class_=re.compile('news|release|item'))
@@ -634,7 +634,7 @@ class CompetitorFetcher(BaseFetcher):
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         items = []
         
         articles = soup.find_all('article') or soup.find_all('div', class_=re.compile('press|release|news|item'))
@@ -680,12 +680,6 @@ class CompetitorFetcher(BaseFetcher):
         :param url: 页面 URL（用于识别网站类型）
         :return: 正文文本
         """
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # 移除脚本和样式
-        for script in soup(["script", "style", "nav", "header", "footer"]):
-            script.decompose()
-        
         # 尝试找到主要内容区域
         content_selectors = [
             'main',
@@ -700,17 +694,5 @@ class CompetitorFetcher(BaseFetcher):
             '.container',
         ]
         
-        content_elem = None
-        for selector in content_selectors:
-            content_elem = soup.select_one(selector)
-            if content_elem:
-                break
-        
-        if not content_elem:
-            content_elem = soup.body
-        
-        if content_elem:
-            text = content_elem.get_text(separator=' ', strip=True)
-            return self.clean_text(text)
-        
-        return ""
+        # 找不到时取 body 文本；逐个读取文本节点，达到字符预算后停止
+        return Document(html, url).content(content_selectors, body_fallback=True)
@@ -10,9 +10,12 @@ from typing import List, Optional, Dict
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
 
 from .base import BaseFetcher, ContentItem
+from .crawl_state import get_crawl_state
+from .listing import passed_window
+from .document import Document
+from .parsing import make_soup
 
 import sys
 import os
@@ -27,6 +30,7 @@ class CompetitorFetcherV2(BaseFetcher):
     def __init__(self):
         super().__init__()
         self.debug = True
+        self.crawl_state = get_crawl_state()
         
     def log(self, msg):
         if self.debug:
@@ -36,6 +40,17 @@ class CompetitorFetcherV2(BaseFetcher):
         """抓取所有竞品资讯"""
         results = {}
         
+        for company_key, config in COMPETITOR_SOURCES.items():
+            items = self.fetch_company(company_key, window_start, window_end)
+            if items:
+                results[config['name']] = items
+            time.sleep(0.5)  # 礼貌请求间隔
+            
+        return results
+    
+    def fetch_company(self, company_key: str, window_start: datetime, window_end: datetime) -> List[ContentItem]:
+        """抓取单个公司，失败时返回空列表"""
+        config = COMPETITOR_SOURCES[company_key]
         fetchers_map = {
             "TTD": self._fetch_ttd,
             "Criteo": self._fetch_criteo,
@@ -52,24 +67,20 @@ class CompetitorFetcherV2(BaseFetcher):
             "Magnite": self._fetch_magnite,
         }
         
-        for company_key, config in COMPETITOR_SOURCES.items():
-            print(f"  [抓取] {config['name']}...")
-            try:
-                fetch_func = fetchers_map.get(company_key)
-                if fetch_func:
-                    items = fetch_func(config["url"], window_start, window_end)
-                    if items:
-                        results[config['name']] = items
-                        print(f"    ✓ 找到 {len(items)} 条")
-                    else:
-                        print(f"    - 无符合条件的内容")
-                else:
-                    print(f"    ✗ 无抓取函数")
-            except Exception as e:
-                print(f"    ✗ 错误: {str(e)[:80]}")
-            time.sleep(0.5)  # 礼貌请求间隔
-            
-        return results
+        print(f"  [抓取] {config['name']}...")
+        try:
+            fetch_func = fetchers_map.get(company_key)
+            if fetch_func:
+                items = fetch_func(config["url"], window_start, window_end)
+                if items:
+                    print(f"    ✓ 找到 {len(items)} 条")
+                    return items
+                print(f"    - 无符合条件的内容")
+            else:
+                print(f"    ✗ 无抓取函数")
+        except Exception as e:
+            print(f"    ✗ 错误: {str(e)[:80]}")
+        return []
     
     def _fetch_ttd(self, base_url: str, window_start: datetime, window_end: datetime) -> List[ContentItem]:
         """抓取 TTD - thetradedesk.com
@@ -81,7 +92,7 @@ class CompetitorFetcherV2(BaseFetcher):
             print("    ✗ 无法获取页面")
             return items
             
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         
         # TTD 使用 <time> 标签存储日期
         # 查找所有 time 标签
@@ -136,6 +147,10 @@ class CompetitorFetcherV2(BaseFetcher):
                 
                 print(f"    [{len(items)+1}] {title[:50]}... | 日期: {date_str}")
                 
+                # 列表按日期倒序：早于窗口起点后不再继续
+                if passed_window("TTD", date_str, window_start):
+                    break
+                
                 # 检查日期是否在窗口内
                 if self.is_in_date_window(date_str, window_start, window_end):
                     # 获取详情页内容（如果还没有获取）
@@ -166,7 +181,7 @@ class CompetitorFetcherV2(BaseFetcher):
             print("    ✗ 无法获取页面")
             return items
             
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         
         # Criteo IR 网站通常是表格或列表形式
         selectors = [
@@ -218,6 +233,10 @@ class CompetitorFetcherV2(BaseFetcher):
                 
                 print(f"    处理: {title[:50]}... | 日期: {date_str or '未找到'}")
                 
+                # 列表按日期倒序：早于窗口起点后不再继续
+                if passed_window("Criteo", date_str, window_start):
+                    break
+                
                 # 暂时忽略日期窗口限制，先收集所有内容
                 if date_str:  # 只要有日期就处理
                     content = self._fetch_detail_content(detail_url)
@@ -249,7 +268,7 @@ class CompetitorFetcherV2(BaseFetcher):
         if not html:
             return items
             
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         
         # Taboola 博客结构
         articles = soup.find_all('article') or soup.select('.post, .entry, .blog-post')
@@ -299,7 +318,7 @@ class CompetitorFetcherV2(BaseFetcher):
         if not html:
             return items
             
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         
         # 尝试多种选择器
         selectors = ['.card', 'article', '.press-item', '.news-item', '.post']
@@ -361,7 +380,7 @@ class CompetitorFetcherV2(BaseFetcher):
         if not html:
             return items
             
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         
         # 尝试多种选择器
         selectors = ['.news-item', 'article', '.post', '.card', '[class*="news"]', '[class*="press"]']
@@ -395,6 +414,10 @@ class CompetitorFetcherV2(BaseFetcher):
                     from datetime import datetime
                     date_str = datetime.now().strftime('%Y-%m-%d')
                 
+                # 列表按日期倒序：早于窗口起点后不再继续
+                if passed_window("AppLovin", date_str, window_start):
+                    break
+                
                 if self.is_in_date_window(date_str, window_start, window_end):
                     content = self._fetch_detail_content(detail_url)
                     if content:
@@ -419,7 +442,7 @@ class CompetitorFetcherV2(BaseFetcher):
         if not html:
             return items
             
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         
         # Unity - 尝试多种选择器
         selectors = ['[data-testid="article-card"]', 'article', '.news-item', '.post', '.card']
@@ -478,7 +501,7 @@ class CompetitorFetcherV2(BaseFetcher):
         if not html:
             return items
             
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         
         # Zeta IR 网站 - 尝试多种选择器
         selectors = ['table tr', '.item', '.news-item', '.release-item']
@@ -510,6 +533,10 @@ class CompetitorFetcherV2(BaseFetcher):
                 if not date_str:
                     continue
                 
+                # 列表按日期倒序：早于窗口起点后不再继续
+                if passed_window("Zeta Global", date_str, window_start):
+                    break
+                
                 if self.is_in_date_window(date_str, window_start, window_end):
                     content = self._fetch_detail_content(detail_url)
                     if content:
@@ -534,7 +561,7 @@ class CompetitorFetcherV2(BaseFetcher):
         if not html:
             return items
             
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         articles = soup.find_all('article') or soup.select('.blog-post, .post, .entry')
         
         for article in articles[:10]:
@@ -575,7 +602,7 @@ class CompetitorFetcherV2(BaseFetcher):
         if not html:
             return items
             
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         
         # 尝试多种选择器
         selectors = ['article', '.press-item', '.news-item', '.post', '.card', '[class*="press"]', '[class*="news"]']
@@ -609,6 +636,10 @@ class CompetitorFetcherV2(BaseFetcher):
                     from datetime import datetime
                     date_str = datetime.now().strftime('%Y-%m-%d')
                 
+                # 列表按日期倒序：早于窗口起点后不再继续
+                if passed_window("Moloco", date_str, window_start):
+                    break
+                
                 if self.is_in_date_window(date_str, window_start, window_end):
                     content = self._fetch_detail_content(detail_url)
                     if content:
@@ -633,7 +664,7 @@ class CompetitorFetcherV2(BaseFetcher):
         if not html:
             return items
             
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         articles = soup.find_all('article') or soup.select('.blog-post, .post')
         
         for article in articles[:10]:
@@ -674,7 +705,7 @@ class CompetitorFetcherV2(BaseFetcher):
         if not html:
             return items
             
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         articles = soup.find_all('article') or soup.select('.press-item, .news-item')
         
         for article in articles[:10]:
@@ -715,7 +746,7 @@ class CompetitorFetcherV2(BaseFetcher):
         if not html:
             return items
             
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         articles = soup.find_all('article') or soup.select('.news-item, .press-item')
         
         for article in articles[:10]:
@@ -733,6 +764,10 @@ class CompetitorFetcherV2(BaseFetcher):
                 if date_elem:
                     date_str = self.parse_date(date_elem.get_text()) or self.parse_date(date_elem.get('datetime', ''))
                 
+                # 列表按日期倒序：早于窗口起点后不再继续
+                if passed_window("PubMatic", date_str, window_start):
+                    break
+                
                 if date_str and self.is_in_date_window(date_str, window_start, window_end):
                     content = self._fetch_detail_content(detail_url)
                     if content:
@@ -756,7 +791,7 @@ class CompetitorFetcherV2(BaseFetcher):
         if not html:
             return items
             
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         
         # 尝试多种选择器
         selectors = ['article', '.press-item', '.news-item', '.post', 'table tr']
@@ -789,6 +824,10 @@ class CompetitorFetcherV2(BaseFetcher):
                 if not date_str:
                     continue
                 
+                # 列表按日期倒序：早于窗口起点后不再继续
+                if passed_window("Magnite", date_str, window_start):
+                    break
+                
                 if self.is_in_date_window(date_str, window_start, window_end):
                     content = self._fetch_detail_content(detail_url)
                     if content:
@@ -847,17 +886,21 @@ class CompetitorFetcherV2(BaseFetcher):
         return None
     
     def _fetch_detail_content(self, url: str) -> str:
-        """获取详情页内容"""
+        """获取详情页内容（以前打开过的详情页直接使用记录的正文）"""
+        entry = self.crawl_state.get(url)
+        if entry and entry.get("summary"):
+            return entry["summary"]
+        
+        content = self._extract_detail_content(url)
+        self.crawl_state.remember(url, None, None, content)
+        return content
+    
+    def _extract_detail_content(self, url: str) -> str:
+        """下载并提取详情页正文"""
         html = self.fetch(url)
         if not html:
             return ""
         
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # 移除脚本和样式
-        for script in soup(["script", "style", "nav", "header", "footer"]):
-            script.decompose()
-        
         # 尝试找到主要内容
         content_selectors = [
             'main article',
@@ -872,15 +915,5 @@ class CompetitorFetcherV2(BaseFetcher):
             'main',
         ]
         
-        for selector in content_selectors:
-            content_elem = soup.select_one(selector)
-            if content_elem:
-                text = content_elem.get_text(separator=' ', strip=True)
-                return self.clean_text(text)
-        
-        # 如果找不到特定容器，获取body文本
-        body = soup.body
-        if body:
-            return self.clean_text(body.get_text(separator=' ', strip=True))
-        
-        return ""
+        # 找不到特定容器时取 body 文本
+        return Document(html, url).content(content_selectors, body_fallback=True)
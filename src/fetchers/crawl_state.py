@@ -0,0 +1,124 @@
+"""
+增量抓取状态 - 跨运行记录已打开过的详情页
+
+按规范化 URL 保存详情页的日期、标题、正文哈希和摘要（正文前 600 字），
+抓取器据此判断链接是否在时间窗口内，无需再次打开详情页。
+浏览器打开详情页时同时记录响应状态码，验证器只把状态码成功的记录视为链接可用。
+"""
+
+import atexit
+import hashlib
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from .state_file import JsonStateFile
+
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+from config.settings import CACHE_CONFIG
+
+
+# 规范化时去掉的跟踪参数
+TRACKING_PARAMS = ("utm_", "gclid", "fbclid", "mc_cid", "mc_eid")
+
+
+def canonical_url(url: str) -> str:
+    """规范化 URL：小写协议和主机、去掉片段、跟踪参数和末尾斜杠"""
+    parts = urlsplit(url.strip())
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if not k.lower().startswith(TRACKING_PARAMS)]
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+
+class CrawlState:
+    """
+    结构：{canonical_url: {"date": "YYYY-MM-DD", "title": str, "content_hash": str,
+                          "summary": str, "status": int, "seen_at": float}}
+    """
+
+    def __init__(self, state_file: JsonStateFile = None, max_age_days: int = None):
+        self.state_file = state_file or JsonStateFile(CACHE_CONFIG["crawl_state_file"])
+        self.max_age = (max_age_days or CACHE_CONFIG["crawl_state_max_age_days"]) * 86400
+        self.entries: Dict[str, Dict] = self.state_file.load()
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    def get(self, url: str) -> Optional[Dict]:
+        """已记录的详情页信息，未见过时返回 None"""
+        with self._lock:
+            entry = self.entries.get(canonical_url(url))
+            return dict(entry) if entry else None
+
+    def known_date(self, url: str) -> Optional[str]:
+        entry = self.get(url)
+        return entry.get("date") if entry else None
+
+    def remember(self, url: str, date: str, title: str = None, content: str = None):
+        """
+        记录详情页结果
+        :param date: 详情页日期（YYYY-MM-DD），未知时传 None
+        :param content: 正文，只保存哈希和前 600 字
+        """
+        if not date and not content:
+            return
+        key = canonical_url(url)
+        with self._lock:
+            entry = dict(self.entries.get(key, {}))
+            entry["seen_at"] = time.time()
+            if date:
+                entry["date"] = date
+            if title:
+                entry["title"] = title
+            if content:
+                entry["content_hash"] = hashlib.sha1(content.encode("utf-8")).hexdigest()
+                entry["summary"] = content[:600]
+            self.entries[key] = entry
+            self._dirty = True
+
+    def record_status(self, url: str, status: Optional[int]):
+        """记录打开详情页时的响应状态码（没有响应时传 None）"""
+        key = canonical_url(url)
+        with self._lock:
+            entry = dict(self.entries.get(key, {}))
+            entry["seen_at"] = time.time()
+            entry["status"] = status
+            self.entries[key] = entry
+            self._dirty = True
+
+    def ok_since(self, url: str, cutoff: float) -> bool:
+        """cutoff 之后打开过该 URL 且响应成功（状态码 < 400）"""
+        entry = self.get(url)
+        if not entry or entry.get("seen_at", 0) < cutoff:
+            return False
+        status = entry.get("status")
+        return status is not None and status < 400
+
+    def save(self):
+        """保存并清理过期记录"""
+        with self._lock:
+            if not self._dirty:
+                return
+            cutoff = time.time() - self.max_age
+            self.entries = {k: v for k, v in self.entries.items() if v.get("seen_at", 0) >= cutoff}
+            snapshot = dict(self.entries)
+            self._dirty = False
+        self.state_file.save(snapshot)
+
+
+_state: Optional[CrawlState] = None
+_state_lock = threading.Lock()
+
+
+def get_crawl_state() -> CrawlState:
+    """获取进程级共享抓取状态，进程退出时自动保存"""
+    global _state
+    with _state_lock:
+        if _state is None:
+            _state = CrawlState()
+            atexit.register(_state.save)
+        return _state
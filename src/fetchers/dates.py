@@ -0,0 +1,150 @@
+"""
+日期解析 - 所有抓取器共用
+
+正则在模块加载时编译一次；支持数字格式（YYYY-MM-DD / MM/DD/YYYY 等，含 ISO 时间戳）、
+英文全称和缩写月份、RSS 日期。列表页逐个元素调用，短字符串的结果用 LRU 缓存。
+"""
+
+import re
+from datetime import date
+from email.utils import parsedate
+from functools import lru_cache
+from typing import Optional
+
+# 英文月份（全称、缩写，及 Sept）
+MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6, 'jul': 7, 'aug': 8,
+    'sep': 9, 'sept': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+_MONTH = r"(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?"
+_DAY = r"(\d{1,2})(?:st|nd|rd|th)?"
+
+# "February 11, 2026" / "Feb 05 2026" / "Sept. 3rd, 2026"
+MONTH_DAY_YEAR = re.compile(r"\b" + _MONTH + r"\s+" + _DAY + r",?\s+(\d{4})\b", re.IGNORECASE)
+# "11 February 2026" / "Mon, 09 Feb 2026 10:00:00 GMT"
+DAY_MONTH_YEAR = re.compile(r"\b" + _DAY + r"\s+" + _MONTH + r",?\s+(\d{4})\b", re.IGNORECASE)
+# YYYY-MM-DD 开头（含 ISO 时间戳）
+ISO_DATE_PREFIX = re.compile(r"^\s*(\d{4})-(\d{2})-(\d{2})")
+ISO_DATE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+# Taboola 的 datetime 属性 "2026-Feb-Thu"（日在标签文本中）
+YEAR_MONTH_WEEKDAY = re.compile(r"^(\d{4})-([A-Za-z]{3})-[A-Za-z]{3}")
+DAY_NUMBER = re.compile(r"(\d{1,2})")
+# URL 中的 /YYYY/MM/DD/
+URL_DATE = re.compile(r"/(\d{4})/(\d{2})/(\d{2})/")
+
+# (正则, 年/月/日所在分组)，按优先级排列
+_PATTERNS = [
+    (re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})"), (1, 2, 3)),
+    (re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})"), (3, 1, 2)),
+    (re.compile(r"(\d{1,2})-(\d{1,2})-(\d{4})"), (3, 1, 2)),
+    (re.compile(r"(\d{4})/(\d{1,2})/(\d{1,2})"), (1, 2, 3)),
+    (re.compile(r"(\d{4})\.(\d{1,2})\.(\d{1,2})"), (1, 2, 3)),
+    (DAY_MONTH_YEAR, (3, 2, 1)),
+    (MONTH_DAY_YEAR, (3, 1, 2)),
+]
+
+_YEAR = re.compile(r"\d{4}")
+
+# 超过该长度的字符串（正文片段等）不进缓存
+MEMO_MAX_LEN = 120
+
+
+def month_number(name: str) -> Optional[int]:
+    """英文月份名（全称或缩写）转数字，无法识别时返回 None"""
+    return MONTHS.get(name.lower().rstrip('.')) or MONTHS.get(name.lower()[:3])
+
+
+def format_ymd(year, month, day) -> Optional[str]:
+    """组装 YYYY-MM-DD，日期无效时返回 None"""
+    try:
+        return date(int(year), int(month), int(day)).strftime("%Y-%m-%d")
+    except (TypeError, ValueError):
+        return None
+
+
+def _from_match(match, groups) -> Optional[str]:
+    year, month, day = (match.group(i) for i in groups)
+    if not month.isdigit():
+        month = month_number(month)
+    return format_ymd(year, month, day)
+
+
+def _parse(text: str) -> Optional[str]:
+    if not _YEAR.search(text):
+        return None
+    for pattern, groups in _PATTERNS:
+        match = pattern.search(text)
+        if match:
+            parsed = _from_match(match, groups)
+            if parsed:
+                return parsed
+    return None
+
+
+_parse_memo = lru_cache(maxsize=4096)(_parse)
+
+
+def parse_date(text: str) -> Optional[str]:
+    """
+    解析日期字符串
+    :param text: 任意包含日期的文本
+    :return: YYYY-MM-DD 或 None
+    """
+    if not text:
+        return None
+    text = text.strip()
+    if len(text) > MEMO_MAX_LEN:
+        return _parse(text)
+    return _parse_memo(text)
+
+
+def parse_named_month_date(text: str) -> Optional[str]:
+    """只识别英文月份格式（"February 11, 2026" / "11 Feb 2026"），用于在正文中查找日期"""
+    if not text:
+        return None
+    for pattern, groups in ((MONTH_DAY_YEAR, (3, 1, 2)), (DAY_MONTH_YEAR, (3, 2, 1))):
+        match = pattern.search(text)
+        if match:
+            parsed = _from_match(match, groups)
+            if parsed:
+                return parsed
+    return None
+
+
+def parse_iso_date(text: str) -> Optional[str]:
+    """提取 YYYY-MM-DD（datetime 属性、ISO 时间戳）"""
+    if not text:
+        return None
+    match = ISO_DATE.search(text)
+    return format_ymd(*match.groups()) if match else None
+
+
+def parse_url_date(url: str) -> Optional[str]:
+    """从 URL 的 /YYYY/MM/DD/ 提取日期；第二段大于 12 时按 /YYYY/DD/MM/ 处理"""
+    match = URL_DATE.search(url or "")
+    if not match:
+        return None
+    year, part2, part3 = match.groups()
+    if int(part2) > 12:
+        return format_ymd(year, part3, part2)
+    return format_ymd(year, part2, part3)
+
+
+def parse_rss_date(text: str) -> Optional[str]:
+    """解析 RSS pubDate（RFC 822，如 "Mon, 09 Feb 2026 10:00:00 GMT"），失败时按通用格式解析"""
+    if not text:
+        return None
+    parts = parsedate(text.strip())
+    if parts:
+        parsed = format_ymd(*parts[:3])
+        if parsed:
+            return parsed
+    return parse_date(text)
+
+
+def cache_info():
+    """LRU 缓存命中统计"""
+    return _parse_memo.cache_info()
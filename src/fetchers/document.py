@@ -0,0 +1,198 @@
+"""
+解析后的详情页 - 每个响应只解析一次
+
+日期、标题、正文按需计算并缓存，同一页面的各个提取函数共享一棵树。
+正文按文档顺序逐个读取文本节点，跳过模板区块（脚本、导航、页眉页脚），
+累计到字符预算后停止，不拼接整个 <main> / <body> 的文本。
+strip_boilerplate 会修改树，因此去除前先算好日期和标题。
+"""
+
+import re
+from typing import Dict, Iterator, Optional, Sequence
+
+from bs4 import BeautifulSoup
+from bs4.element import CData, NavigableString, Tag
+
+from .dates import parse_date, parse_iso_date, parse_url_date
+from .parsing import make_soup, squash, use_selectolax, selectolax_content
+
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+from config.settings import CONTENT_CONFIG
+
+# 正文提取时跳过的区块
+BOILERPLATE_TAGS = ("script", "style", "nav", "header", "footer")
+# 日期元素的 class
+DATE_CLASS = re.compile('date|time|published', re.I)
+# get_text() 默认收集的文本节点类型（不含注释、脚本、样式）
+TEXT_TYPES = (NavigableString, CData)
+
+
+def iter_text(elem: Tag, skip: Sequence[str] = ()) -> Iterator[str]:
+    """按文档顺序产出 elem 下的文本节点，跳过 skip 中的子树"""
+    stack = [iter(elem.children)]
+    while stack:
+        for child in stack[-1]:
+            if isinstance(child, Tag):
+                if child.name not in skip:
+                    stack.append(iter(child.children))
+                    break
+            elif type(child) in TEXT_TYPES:
+                yield child
+        else:
+            stack.pop()
+
+
+def element_text(elem: Tag, skip: Sequence[str] = (), budget: int = None) -> str:
+    """
+    等同于 squash(elem.get_text(separator=' ', strip=True))，但跳过 skip 中的子树，
+    累计到 budget 个字符后停止
+    """
+    parts = []
+    total = 0
+    for node in iter_text(elem, skip):
+        text = squash(node)
+        if not text:
+            continue
+        parts.append(text)
+        total += len(text) + 1
+        if budget and total > budget:
+            break
+    text = ' '.join(parts)
+    return text[:budget].rstrip() if budget else text
+
+
+class Document:
+    """
+    用法：
+        doc = Document(html, url)
+        doc.date / doc.title            # 懒计算，基于完整文档
+        doc.content(selectors)          # 按选择器取正文（跳过模板区块，受字符预算限制）
+        doc.soup                        # 站点专用的查找（需在 strip_boilerplate 之前）
+    """
+
+    def __init__(self, html: str, url: str = "", backend: str = None):
+        self.html = html or ""
+        self.url = url
+        self.backend = backend
+        self._soup = None
+        self._date: Optional[str] = None
+        self._title: Optional[str] = None
+        self._stripped = set()
+        self._content: Dict[tuple, str] = {}
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        if self._soup is None:
+            self._soup = make_soup(self.html, self.backend)
+        return self._soup
+
+    @property
+    def date(self) -> str:
+        """页面日期（YYYY-MM-DD），找不到时为空字符串"""
+        if self._date is None:
+            self._date = self._find_date()
+        return self._date
+
+    @property
+    def title(self) -> str:
+        """页面标题：h1，其次 og:title，最后 <title>"""
+        if self._title is None:
+            self._title = self._find_title()
+        return self._title
+
+    def _find_date(self) -> str:
+        soup = self.soup
+        # time 标签的 datetime 属性，其次是文本
+        time_tag = soup.find('time')
+        if time_tag:
+            date_str = parse_iso_date(time_tag.get('datetime', '')) or parse_date(time_tag.get_text(strip=True))
+            if date_str:
+                return date_str
+
+        # 日期类元素
+        for elem in soup.find_all(['span', 'div', 'p'], class_=DATE_CLASS):
+            date_str = parse_date(elem.get_text(strip=True))
+            if date_str:
+                return date_str
+
+        # URL 中的日期
+        return parse_url_date(self.url) or ""
+
+    def _find_title(self) -> str:
+        soup = self.soup
+        h1 = soup.find('h1')
+        if h1:
+            title = squash(h1.get_text())
+            if title:
+                return title
+        og_title = soup.find('meta', attrs={'property': 'og:title'})
+        if og_title and og_title.get('content'):
+            return squash(og_title['content'])
+        if soup.title and soup.title.string:
+            return squash(soup.title.string)
+        return ""
+
+    def strip_boilerplate(self, tags: Sequence[str] = BOILERPLATE_TAGS):
+        """去除模板区块（修改树），之前先算好依赖完整文档的日期和标题"""
+        pending = [tag for tag in tags if tag not in self._stripped]
+        if not pending:
+            return
+        _ = (self.date, self.title)
+        for elem in self.soup(pending):
+            elem.decompose()
+        self._stripped.update(pending)
+
+    def text(self, budget: int = None, skip: Sequence[str] = BOILERPLATE_TAGS) -> str:
+        """整页可见文本（前 budget 个字符）"""
+        root = self.soup.body or self.soup
+        return element_text(root, skip, budget)
+
+    def content(self, selectors: Sequence[str], min_length: int = None,
+                strip: Sequence[str] = BOILERPLATE_TAGS, body_fallback: bool = False,
+                budget: int = None) -> str:
+        """
+        按选择器优先级提取正文，不修改文档树
+        :param selectors: 内容选择器列表
+        :param min_length: 正文需超过的长度，None 表示取第一个命中的元素
+        :param strip: 跳过的区块（位于这些区块内的命中元素也被忽略）
+        :param body_fallback: 未命中时是否退回到 body 文本
+        :param budget: 最多提取的字符数，默认 CONTENT_CONFIG["detail_text_budget"]
+        """
+        if budget is None:
+            budget = CONTENT_CONFIG["detail_text_budget"]
+        key = (tuple(selectors), min_length, tuple(strip), body_fallback, budget)
+        if key in self._content:
+            return self._content[key]
+
+        if use_selectolax():
+            text = selectolax_content(self.html, selectors, min_length, strip, body_fallback)
+            text = text[:budget] if budget else text
+            self._content[key] = text
+            return text
+
+        text = ""
+        for selector in selectors:
+            elem = self._select_outside(selector, strip)
+            if elem is not None:
+                candidate = element_text(elem, strip, budget)
+                if min_length is None or len(candidate) > min_length:
+                    text = candidate
+                    break
+
+        if not text and body_fallback and self.soup.body:
+            text = element_text(self.soup.body, strip, budget)
+
+        self._content[key] = text
+        return text
+
+    def _select_outside(self, selector: str, skip: Sequence[str]) -> Optional[Tag]:
+        """第一个不在 skip 区块内的命中元素"""
+        for elem in self.soup.css.iselect(selector):
+            if elem.name in skip:
+                continue
+            if not any(parent.name in skip for parent in elem.parents):
+                return elem
+        return None
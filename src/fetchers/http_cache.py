@@ -0,0 +1,189 @@
+"""
+HTTP 响应磁盘缓存 - 为 BaseFetcher.fetch 提供条件请求
+
+保存响应的 ETag / Last-Modified，下次请求带上 If-None-Match / If-Modified-Since，
+服务器返回 304 时直接使用磁盘上的内容，并刷新条目的校验时间和使用时间（写回元数据）。
+缓存总大小和条目寿命（距最近一次 200 / 304 的时间）受 CACHE_CONFIG 限制，超出时按最近使用时间淘汰。
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+from config.settings import CACHE_CONFIG
+
+
+class HttpCache:
+    """
+    每个 URL 对应两个文件：<key>.json（元数据）和 <key>.body（响应正文）
+    元数据：{"url", "etag", "last_modified", "stored_at", "validated_at", "used_at", "size"}
+    validated_at 为最近一次 200 或 304 的时间，条目寿命按它计算（旧元数据没有时取 stored_at）
+    """
+
+    def __init__(self, cache_dir: str = None, max_bytes: int = None, max_age: float = None):
+        self.cache_dir = cache_dir or os.path.join(CACHE_CONFIG["cache_dir"], CACHE_CONFIG["http_cache_dir"])
+        self.max_bytes = max_bytes or CACHE_CONFIG["http_cache_max_mb"] * 1024 * 1024
+        self.max_age = max_age or CACHE_CONFIG["http_cache_max_age_days"] * 86400
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict] = {}
+        self.stats = {"revalidated": 0, "stored": 0, "evicted": 0}
+        self._load_index()
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str):
+        return os.path.join(self.cache_dir, f"{key}.json"), os.path.join(self.cache_dir, f"{key}.body")
+
+    def _load_index(self):
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.cache_dir, name), "r", encoding="utf-8") as f:
+                    self._index[name[:-5]] = json.load(f)
+            except (OSError, ValueError):
+                continue
+
+    @staticmethod
+    def _age(meta: Dict, now: float) -> float:
+        return now - meta.get("validated_at", meta["stored_at"])
+
+    def _write_meta(self, key: str, meta: Dict):
+        """写入元数据文件（调用方持有锁）"""
+        meta_path, _ = self._paths(key)
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+    def _remove(self, key: str):
+        self._index.pop(key, None)
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """返回该 URL 的条件请求头，无可用缓存时返回空字典"""
+        key = self._key(url)
+        with self._lock:
+            meta = self._index.get(key)
+            if not meta:
+                return {}
+            if self._age(meta, time.time()) > self.max_age:
+                self._remove(key)
+                return {}
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def last_used(self, url: str) -> Optional[float]:
+        """该 URL 最近一次成功取得响应（200 或 304）的时间，没有缓存时返回 None"""
+        with self._lock:
+            meta = self._index.get(self._key(url))
+            return meta["used_at"] if meta else None
+
+    def load(self, url: str) -> Optional[str]:
+        """读取缓存正文（收到 304 后调用），刷新校验时间和使用时间并写回元数据"""
+        key = self._key(url)
+        _, body_path = self._paths(key)
+        try:
+            with open(body_path, "r", encoding="utf-8") as f:
+                text = f.read()
+        except OSError:
+            with self._lock:
+                self._remove(key)
+            return None
+
+        with self._lock:
+            meta = self._index.get(key)
+            if meta:
+                now = time.time()
+                meta["validated_at"] = now
+                meta["used_at"] = now
+                try:
+                    self._write_meta(key, meta)
+                except OSError as e:
+                    print(f"  [!] HTTP 缓存元数据写入失败: {e}")
+            self.stats["revalidated"] += 1
+        return text
+
+    def store(self, url: str, response):
+        """保存带校验信息（ETag / Last-Modified）的 200 响应"""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code != 200 or not (etag or last_modified):
+            return
+
+        text = response.text
+        key = self._key(url)
+        _, body_path = self._paths(key)
+        now = time.time()
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": now,
+            "validated_at": now,
+            "used_at": now,
+            "size": len(text.encode("utf-8")),
+        }
+        if meta["size"] > self.max_bytes:
+            return
+
+        with self._lock:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                with open(body_path, "w", encoding="utf-8") as f:
+                    f.write(text)
+                self._write_meta(key, meta)
+            except OSError as e:
+                print(f"  [!] HTTP 缓存写入失败: {e}")
+                return
+            self._index[key] = meta
+            self.stats["stored"] += 1
+            self._evict()
+
+    def _evict(self):
+        """淘汰过期条目，超出总大小时按最近使用时间淘汰（调用方持有锁）"""
+        now = time.time()
+        for key in [k for k, m in self._index.items() if self._age(m, now) > self.max_age]:
+            self._remove(key)
+            self.stats["evicted"] += 1
+
+        total = sum(m["size"] for m in self._index.values())
+        if total <= self.max_bytes:
+            return
+        for key, meta in sorted(self._index.items(), key=lambda kv: kv[1]["used_at"]):
+            self._remove(key)
+            self.stats["evicted"] += 1
+            total -= meta["size"]
+            if total <= self.max_bytes:
+                break
+
+
+_cache: Optional[HttpCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """获取进程级共享 HTTP 缓存，配置关闭时返回 None"""
+    global _cache
+    if not CACHE_CONFIG["http_cache_enabled"]:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = HttpCache()
+        return _cache
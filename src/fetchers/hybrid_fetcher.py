@@ -1,143 +1,263 @@
 """
 混合抓取器 - 结合 Requests、Playwright 和 Stealth 模式
+
+三层以流水线方式并发执行：某公司 HTTP 抓取为空后立即进入 Playwright 队列，
+再为空则进入 Stealth 队列，每层有独立的线程池。
+每家公司从历史上成功的层开始（见 TierOutcomeStore），定期重新从 HTTP 层探测；
+起始层为空时本次运行内回退到跳过的较便宜的层（HTTP 优先）。
 """
 
+import queue
+import threading
+import time
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from .base import ContentItem
+from .browser_pool import get_browser_pool
 from .competitor_fetcher_v2 import CompetitorFetcherV2
 from .playwright_fetcher import PlaywrightFetcher
-from .stealth_fetcher import StealthFetcher
+from .async_stealth_fetcher import AsyncStealthFetcher
+from .tier_outcomes import TierOutcomeStore
+from .crawl_state import get_crawl_state
 
 import sys
 import os
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, project_root)
-from config.settings import COMPETITOR_SOURCES
+from config.settings import COMPETITOR_SOURCES, PIPELINE_CONFIG
+
+
+TIERS = ("http", "playwright", "stealth")
+
+TIER_LABELS = {
+    "http": "HTTP",
+    "playwright": "Playwright",
+    "stealth": "Stealth",
+}
+
+# Playwright 层支持的公司 -> 方法名
+PLAYWRIGHT_METHODS = {
+    "AppLovin": "fetch_applovin",
+    "Unity": "fetch_unity",
+    "Taboola": "fetch_taboola",
+    "Teads": "fetch_teads",
+    "Zeta Global": "fetch_zeta",
+    "Criteo": "fetch_criteo",
+}
+
+# Stealth 层的专用方法，其余公司使用 fetch_generic
+STEALTH_METHODS = {
+    "Criteo": "fetch_criteo",
+    "Teads": "fetch_teads",
+    "AppLovin": "fetch_applovin",
+    "Unity": "fetch_unity",
+    "Zeta Global": "fetch_zeta",
+    "Moloco": "fetch_moloco",
+    "Magnite": "fetch_magnite",
+    "PubMatic": "fetch_pubmatic",
+    "Taboola": "fetch_taboola",
+    "mobvista": "fetch_mobvista",
+    "BIGO Ads": "fetch_bigo_ads",
+}
 
 
 class HybridCompetitorFetcher:
     """混合竞品抓取器"""
-    
-    def __init__(self):
+
+    def __init__(self, outcome_store: TierOutcomeStore = None):
         self.requests_fetcher = CompetitorFetcherV2()
         self.pw_fetcher = None
         self.stealth_fetcher = None
-    
+        self.outcome_store = outcome_store or TierOutcomeStore()
+        self._lock = threading.Lock()
+
     def _get_pw_fetcher(self):
-        if self.pw_fetcher is None:
-            try:
-                self.pw_fetcher = PlaywrightFetcher()
-            except Exception as e:
-                print(f"  [!] Playwright 初始化失败: {e}")
-        return self.pw_fetcher
-    
+        with self._lock:
+            if self.pw_fetcher is None:
+                try:
+                    self.pw_fetcher = PlaywrightFetcher()
+                except Exception as e:
+                    print(f"  [!] Playwright 初始化失败: {e}")
+            return self.pw_fetcher
+
     def _get_stealth_fetcher(self):
-        if self.stealth_fetcher is None:
-            try:
-                self.stealth_fetcher = StealthFetcher()
-            except Exception as e:
-                print(f"  [!] Stealth 初始化失败: {e}")
-        return self.stealth_fetcher
-    
+        with self._lock:
+            if self.stealth_fetcher is None:
+                try:
+                    self.stealth_fetcher = AsyncStealthFetcher()
+                except Exception as e:
+                    print(f"  [!] Stealth 初始化失败: {e}")
+            return self.stealth_fetcher
+
+    def _fetch_http(self, key: str, window_start: datetime, window_end: datetime) -> List[ContentItem]:
+        return self.requests_fetcher.fetch_company(key, window_start, window_end)
+
+    def _fetch_playwright(self, key: str, window_start: datetime, window_end: datetime) -> List[ContentItem]:
+        pw = self._get_pw_fetcher()
+        if not pw:
+            return []
+        return getattr(pw, PLAYWRIGHT_METHODS[key])(window_start, window_end)
+
+    def _fetch_stealth(self, key: str, window_start: datetime, window_end: datetime) -> List[ContentItem]:
+        stealth = self._get_stealth_fetcher()
+        if not stealth:
+            return []
+        method = STEALTH_METHODS.get(key)
+        if method:
+            return getattr(stealth, method)(window_start, window_end)
+        return stealth.fetch_generic(key, window_start, window_end)
+
+    def _fetch_stealth_batch(self, keys: List[str], window_start: datetime, window_end: datetime) -> Dict[str, List[ContentItem]]:
+        """异步引擎支持的公司合并为一次 fetch_companies（共用一个浏览器，详情页并发加载）"""
+        stealth = self._get_stealth_fetcher()
+        if not stealth:
+            return {}
+        return stealth.fetch_companies(keys, window_start, window_end)
+
+    def _start_tier(self, key: str) -> str:
+        """根据历史结果选择起始层"""
+        tier = self.outcome_store.start_tier(key)
+        if tier == "playwright" and key not in PLAYWRIGHT_METHODS:
+            tier = "stealth"
+        if tier != "http":
+            print(f"  [路由] {COMPETITOR_SOURCES[key]['name']}: 直接从 {TIER_LABELS[tier]} 层开始")
+        return tier
+
+    def _next_tier(self, key: str, tried: set) -> Optional[str]:
+        """
+        已尝试的层都为空时的下一层：按 HTTP → Playwright → Stealth 取第一个未尝试的层，
+        从学到的起始层开始的公司据此回退到跳过的较便宜的层
+        :return: 下一层，None 表示已无可用层
+        """
+        for tier in TIERS:
+            if tier in tried or (tier == "playwright" and key not in PLAYWRIGHT_METHODS):
+                continue
+            return tier
+        return None
+
     def fetch_all(self, window_start: datetime, window_end: datetime) -> Dict[str, List[ContentItem]]:
         """抓取所有竞品资讯"""
-        results = {}
-        
-        # Phase 1: HTTP 抓取
-        print("\n[1/3] 抓取竞品资讯 (HTTP)...")
-        results = self.requests_fetcher.fetch_all(window_start, window_end)
-        
-        # 找出未抓到的公司
-        missing = []
-        for key in COMPETITOR_SOURCES.keys():
+        print("\n[抓取] 竞品资讯流水线 (HTTP → Playwright → Stealth)...")
+        start = time.time()
+
+        queues = {tier: queue.Queue() for tier in TIERS}
+        found: Dict[str, List[ContentItem]] = {}
+        state = {"remaining": len(COMPETITOR_SOURCES)}
+        all_done = threading.Event()
+        start_tiers = {key: self._start_tier(key) for key in COMPETITOR_SOURCES}
+        tried = {key: set() for key in COMPETITOR_SOURCES}
+
+        def finish(key: str, items: List[ContentItem]):
+            with self._lock:
+                if items:
+                    found[key] = items
+                state["remaining"] -= 1
+                if state["remaining"] == 0:
+                    all_done.set()
+
+        def advance(key: str, tier: str, items: List[ContentItem], elapsed: float):
+            """进入下一层，或记录结果并计为完成（出错时也计为完成，避免 all_done 永远等不到）"""
             name = COMPETITOR_SOURCES[key]["name"]
-            if name not in results or not results[name]:
-                missing.append((key, name))
-        
-        if not missing:
-            print("  所有公司已通过 HTTP 抓取成功")
-            return results
-        
-        print(f"  {len(missing)} 家公司需要进一步抓取")
-        
-        # Phase 2: Playwright 抓取
-        still_missing = []
-        print("\n[2/3] 抓取竞品资讯 (Playwright)...")
-        pw = self._get_pw_fetcher()
-        if pw:
-            for key, name in missing:
+            try:
+                tried[key].add(tier)
+                if items:
+                    print(f"    ✓ {name}: {len(items)} 条 ({TIER_LABELS[tier]})")
+                else:
+                    next_tier = self._next_tier(key, tried[key])
+                    if next_tier:
+                        if TIERS.index(next_tier) < TIERS.index(tier):
+                            print(f"  [路由] {name}: {TIER_LABELS[tier]} 层为空，回退到 {TIER_LABELS[next_tier]} 层")
+                        queues[next_tier].put(key)
+                        return
+                self.outcome_store.record(key, tier if items else None, elapsed, probed="http" in tried[key])
+            except Exception as e:
+                print(f"    ✗ {name} 记录抓取结果失败: {e}")
+            finish(key, items)
+
+        fetch_funcs = {
+            "http": self._fetch_http,
+            "playwright": self._fetch_playwright,
+            "stealth": self._fetch_stealth,
+        }
+
+        def take_async_batch(key: str) -> List[str]:
+            """取出 Stealth 队列中其余走异步引擎的公司，与 key 合并为一批"""
+            batch, others = [key], []
+            while True:
                 try:
-                    items = []
-                    if key == "AppLovin":
-                        items = pw.fetch_applovin(window_start, window_end)
-                    elif key == "Unity":
-                        items = pw.fetch_unity(window_start, window_end)
-                    elif key == "Taboola":
-                        items = pw.fetch_taboola(window_start, window_end)
-                    elif key == "Teads":
-                        items = pw.fetch_teads(window_start, window_end)
-                    elif key == "Zeta Global":
-                        items = pw.fetch_zeta(window_start, window_end)
-                    elif key == "Criteo":
-                        items = pw.fetch_criteo(window_start, window_end)
-                    
-                    if items:
-                        results[name] = items
-                        print(f"    ✓ {name}: {len(items)} 条")
-                    else:
-                        still_missing.append((key, name))
-                except Exception as e:
-                    print(f"    ✗ {name}: {e}")
-                    still_missing.append((key, name))
-            pw.close()
+                    queued = queues["stealth"].get_nowait()
+                except queue.Empty:
+                    break
+                if queued in AsyncStealthFetcher.ASYNC_COMPANIES:
+                    batch.append(queued)
+                else:
+                    others.append(queued)
+            for queued in others:
+                queues["stealth"].put(queued)
+            return batch
+
+        def worker(tier: str):
+            try:
+                while True:
+                    key = queues[tier].get()
+                    if key is None:
+                        break
+                    keys, results = [key], {}
+                    tier_start = time.time()
+                    try:
+                        if tier == "stealth" and key in AsyncStealthFetcher.ASYNC_COMPANIES:
+                            keys = take_async_batch(key)
+                            results = self._fetch_stealth_batch(keys, window_start, window_end)
+                        else:
+                            results = {key: fetch_funcs[tier](key, window_start, window_end)}
+                    except Exception as e:
+                        names = ", ".join(COMPETITOR_SOURCES[k]["name"] for k in keys)
+                        print(f"    ✗ {names} ({TIER_LABELS[tier]}): {e}")
+                    finally:
+                        # 取出的每家公司都必须推进，否则 remaining 不会归零
+                        elapsed = time.time() - tier_start
+                        for batch_key in keys:
+                            advance(batch_key, tier, results.get(batch_key) or [], elapsed)
+            finally:
+                # 浏览器绑定在线程上，需在本线程内关闭
+                if tier != "http":
+                    get_browser_pool().close_current_thread()
+
+        threads = []
+        for tier in TIERS:
+            for i in range(PIPELINE_CONFIG[f"{tier}_workers"]):
+                t = threading.Thread(target=worker, args=(tier,), name=f"{tier}-{i}", daemon=True)
+                t.start()
+                threads.append((tier, t))
+
+        for key in COMPETITOR_SOURCES:
+            queues[start_tiers[key]].put(key)
+
+        finished = all_done.wait(PIPELINE_CONFIG["timeout"])
+        for tier, _ in threads:
+            queues[tier].put(None)
+        if finished:
+            for _, t in threads:
+                t.join()
         else:
-            still_missing = missing
-        
-        if not still_missing:
-            return results
-        
-        # Phase 3: Stealth 模式抓取
-        print("\n[3/3] 抓取竞品资讯 (Stealth)...")
-        stealth = self._get_stealth_fetcher()
-        if stealth:
-            for key, name in still_missing:
-                try:
-                    items = []
-                    if key == "Criteo":
-                        items = stealth.fetch_criteo(window_start, window_end)
-                    elif key == "Teads":
-                        items = stealth.fetch_teads(window_start, window_end)
-                    elif key == "AppLovin":
-                        items = stealth.fetch_applovin(window_start, window_end)
-                    elif key == "Unity":
-                        items = stealth.fetch_unity(window_start, window_end)
-                    elif key == "Zeta Global":
-                        items = stealth.fetch_zeta(window_start, window_end)
-                    elif key == "Moloco":
-                        items = stealth.fetch_moloco(window_start, window_end)
-                    elif key == "Magnite":
-                        items = stealth.fetch_magnite(window_start, window_end)
-                    elif key == "PubMatic":
-                        items = stealth.fetch_pubmatic(window_start, window_end)
-                    elif key == "Taboola":
-                        items = stealth.fetch_taboola(window_start, window_end)
-                    elif key == "mobvista":
-                        items = stealth.fetch_mobvista(window_start, window_end)
-                    elif key == "BIGO Ads":
-                        items = stealth.fetch_bigo_ads(window_start, window_end)
-                    elif key == "Unity":
-                        items = stealth.fetch_unity(window_start, window_end)
-                    else:
-                        items = stealth.fetch_generic(key, window_start, window_end)
-                    
-                    if items:
-                        results[name] = items
-                        print(f"    ✓ {name}: {len(items)} 条 (Stealth)")
-                except Exception as e:
-                    print(f"    ✗ {name}: {e}")
-            
-            stealth.close()
-        
+            # 仍在抓取的线程为守护线程，不再等待，直接返回已完成的公司
+            with self._lock:
+                pending = [COMPETITOR_SOURCES[k]["name"] for k in COMPETITOR_SOURCES if k not in found]
+            print(f"  [!] 流水线超过 {PIPELINE_CONFIG['timeout']}s 未完成，"
+                  f"剩余 {state['remaining']} 家，未抓到: {', '.join(pending)}")
+        self.outcome_store.save()
+        get_crawl_state().save()
+
+        if self.pw_fetcher:
+            print(f"  Playwright 页面等待: {self.pw_fetcher.wait_log.summary()}")
+        if self.stealth_fetcher:
+            print(f"  Stealth 页面等待: {self.stealth_fetcher.wait_log.summary()}")
+        print(f"  流水线完成，用时 {time.time() - start:.1f}s")
+
+        # 按配置顺序输出
+        results = {}
+        for key, config in COMPETITOR_SOURCES.items():
+            if key in found:
+                results[config["name"]] = found[key]
         return results
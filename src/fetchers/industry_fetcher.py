@@ -8,9 +8,12 @@ from datetime import datetime
 from typing import List, Dict, Optional
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
-
 from .base import BaseFetcher, ContentItem
+from .browser_pool import get_browser_pool
+from .dates import parse_iso_date, parse_rss_date, MONTH_DAY_YEAR
+from .document import Document, BOILERPLATE_TAGS
+from .parsing import make_soup
+from .readiness import PageReadiness, get_ready_condition
 
 import sys
 import os
@@ -18,6 +21,9 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(_
 sys.path.insert(0, project_root)
 from config.settings import INDUSTRY_SOURCES
 
+# 行业文章正文提取前去掉的区块（含侧栏）
+ARTICLE_BOILERPLATE = BOILERPLATE_TAGS + ("aside",)
+
 
 class IndustryFetcher(BaseFetcher):
     """行业资讯抓取器 - 简化版"""
@@ -27,9 +33,10 @@ class IndustryFetcher(BaseFetcher):
         抓取所有行业资讯
         :param window_start: 窗口开始日期
         :param window_end: 窗口结束日期
-        :return: {子模块名称: 内容列表}
+        :return: {子模块名称: 内容列表}，抓取出错的子模块记入 self.failed
         """
         results = {}
+        self.failed = []
         
         # 抓取 AdExchanger Popular
         print(f"  [行业] AdExchanger Popular...")
@@ -40,6 +47,7 @@ class IndustryFetcher(BaseFetcher):
         except Exception as e:
             print(f"    ✗ 失败: {str(e)[:80]}")
             results['AdExchanger'] = []
+            self.failed.append('AdExchanger')
         
         # 抓取 Search Engine Land 最新
         print(f"  [行业] Search Engine Land...")
@@ -50,6 +58,7 @@ class IndustryFetcher(BaseFetcher):
         except Exception as e:
             print(f"    ✗ 失败: {str(e)[:80]}")
             results['Search Engine Land'] = []
+            self.failed.append('Search Engine Land')
         
         return results
     
@@ -60,7 +69,7 @@ class IndustryFetcher(BaseFetcher):
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         items = []
         
         # 找 Popular 区块
@@ -108,7 +117,9 @@ class IndustryFetcher(BaseFetcher):
                 if not detail_html:
                     continue
                 
-                date_str = self._extract_adexchanger_date(detail_html)
+                # 日期和正文共用一次解析
+                doc = Document(detail_html, detail_url)
+                date_str = self._extract_adexchanger_date(doc)
                 if not date_str:
                     continue
                 
@@ -117,7 +128,7 @@ class IndustryFetcher(BaseFetcher):
                     print(f"      - 日期 {date_str} 不在窗口内")
                     continue
                 
-                content = self._extract_adexchanger_content(detail_html)
+                content = self._extract_adexchanger_content(doc)
                 if content:
                     # 在标题前加上分类
                     full_title = f"[{category}] {title}" if category else title
@@ -135,18 +146,16 @@ class IndustryFetcher(BaseFetcher):
         
         return items
     
-    def _extract_adexchanger_date(self, html: str) -> str:
+    def _extract_adexchanger_date(self, doc: Document) -> str:
         """从 AdExchanger 详情页提取日期"""
-        soup = BeautifulSoup(html, 'html.parser')
-        
         # 方法1: time 标签
-        time_elem = soup.find('time')
+        time_elem = doc.soup.find('time')
         if time_elem:
             datetime_attr = time_elem.get('datetime', '')
             if datetime_attr:
-                match = re.match(r'(\d{4}-\d{2}-\d{2})', datetime_attr)
-                if match:
-                    return match.group(1)
+                parsed = parse_iso_date(datetime_attr)
+                if parsed:
+                    return parsed
             date_text = time_elem.get_text()
             parsed = self.parse_date(date_text)
             if parsed:
@@ -154,12 +163,10 @@ class IndustryFetcher(BaseFetcher):
         
         return ""
     
-    def _extract_adexchanger_content(self, html: str) -> str:
+    def _extract_adexchanger_content(self, doc: Document) -> str:
         """提取 AdExchanger 详情页内容"""
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        for script in soup(["script", "style", "nav", "header", "footer", "aside"]):
-            script.decompose()
+        doc.strip_boilerplate(ARTICLE_BOILERPLATE)
+        soup = doc.soup
         
         content_elem = (
             soup.find('div', class_=re.compile('entry-content|post-content|article-content')) or
@@ -179,28 +186,16 @@ class IndustryFetcher(BaseFetcher):
         
         return ""
     
-    def _fetch_with_playwright(self, url: str) -> Optional[str]:
-        """使用 Playwright 抓取页面（用于反爬网站）"""
+    def _fetch_with_playwright(self, url: str, source: str = None) -> Optional[str]:
+        """使用 Playwright 抓取详情页（用于反爬网站），按 INDUSTRY_SOURCES[source]["detail_ready"] 等待就绪"""
         try:
-            from playwright.sync_api import sync_playwright
-            
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    viewport={'width': 1280, 'height': 800}
-                )
-                page = context.new_page()
-                
+            with get_browser_pool().page() as page:
                 # 增加超时到 60 秒，使用 domcontentloaded 而不是 networkidle
+                readiness = PageReadiness(page, get_ready_condition(source, detail=True))
                 page.goto(url, wait_until='domcontentloaded', timeout=60000)
+                readiness.wait()
                 
-                # 额外等待 3 秒让内容加载
-                page.wait_for_timeout(3000)
-                
-                html = page.content()
-                browser.close()
-                return html
+                return page.content()
         except Exception as e:
             print(f"    Playwright 抓取失败: {str(e)[:100]}")
             return None
@@ -216,12 +211,11 @@ class IndustryFetcher(BaseFetcher):
         rss_url = f"https://news.google.com/rss/search?q={query}&hl=en-US&gl=US&ceid=US:en"
         
         try:
-            response = self.session.get(rss_url, timeout=30)
+            response = self.transport.get(rss_url, timeout=30)
             response.raise_for_status()
             
             # 解析 RSS
             import xml.etree.ElementTree as ET
-            from email.utils import parsedate_to_datetime
             
             root = ET.fromstring(response.content)
             channel = root.find('.//channel')
@@ -242,11 +236,7 @@ class IndustryFetcher(BaseFetcher):
                     pub_date = rss_item.find('pubDate')
                     date_str = ""
                     if pub_date is not None and pub_date.text:
-                        try:
-                            dt = parsedate_to_datetime(pub_date.text)
-                            date_str = dt.strftime('%Y-%m-%d')
-                        except:
-                            date_str = self.parse_date(pub_date.text) or ""
+                        date_str = parse_rss_date(pub_date.text) or ""
                     
                     if not title or not detail_url:
                         continue
@@ -295,37 +285,28 @@ class IndustryFetcher(BaseFetcher):
     def _fetch_sel_content_with_playwright(self, url: str) -> Optional[str]:
         """使用 Playwright 获取 SEL 文章内容"""
         try:
-            from playwright.sync_api import sync_playwright
-            
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    viewport={'width': 1280, 'height': 800}
-                )
-                page = context.new_page()
+            with get_browser_pool().page() as page:
+                readiness = PageReadiness(page, get_ready_condition('Search Engine Land', detail=True))
                 page.goto(url, wait_until='domcontentloaded', timeout=60000)
-                page.wait_for_timeout(2000)
-                
+                readiness.wait()
                 html = page.content()
-                browser.close()
-                
-                # 提取内容
-                soup = BeautifulSoup(html, 'html.parser')
-                for script in soup(["script", "style", "nav", "header", "footer", "aside"]):
-                    script.decompose()
-                
-                content_elem = (
-                    soup.find('article') or
-                    soup.find('div', class_=re.compile('content|entry')) or
-                    soup.find('main')
-                )
-                
-                if content_elem:
-                    text = content_elem.get_text(separator=' ', strip=True)
-                    return self.clean_text(text)[:500]
-                
-                return ""
+            
+            # 提取内容
+            doc = Document(html, url)
+            doc.strip_boilerplate(ARTICLE_BOILERPLATE)
+            soup = doc.soup
+            
+            content_elem = (
+                soup.find('article') or
+                soup.find('div', class_=re.compile('content|entry')) or
+                soup.find('main')
+            )
+            
+            if content_elem:
+                text = content_elem.get_text(separator=' ', strip=True)
+                return self.clean_text(text)[:500]
+            
+            return ""
         except Exception as e:
             print(f"    Playwright获取详情失败: {str(e)[:50]}")
             return ""
@@ -361,10 +342,10 @@ class IndustryFetcher(BaseFetcher):
                 # 获取详情页内容（先尝试普通请求，失败用 Playwright）
                 detail_html = self.fetch(detail_url)
                 if not detail_html:
-                    detail_html = self._fetch_with_playwright(detail_url)
+                    detail_html = self._fetch_with_playwright(detail_url, 'Search Engine Land')
                 
                 if detail_html:
-                    content = self._extract_sel_content(detail_html)
+                    content = self._extract_sel_content(Document(detail_html, detail_url))
                     if content:
                         items.append(ContentItem(
                             title=title,
@@ -387,16 +368,15 @@ class IndustryFetcher(BaseFetcher):
         if time_elem:
             datetime_attr = time_elem.get('datetime', '')
             if datetime_attr:
-                match = re.search(r'(\d{4}-\d{2}-\d{2})', datetime_attr)
-                if match:
-                    return match.group(1)
+                parsed = parse_iso_date(datetime_attr)
+                if parsed:
+                    return parsed
             parsed = self.parse_date(time_elem.get_text())
             if parsed:
                 return parsed
         
         # 方法2: 查找文本日期
-        date_pattern = r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4}'
-        date_matches = article.find_all(string=re.compile(date_pattern, re.IGNORECASE))
+        date_matches = article.find_all(string=MONTH_DAY_YEAR)
         for match in date_matches:
             date_text = match.strip()
             if date_text:
@@ -413,12 +393,10 @@ class IndustryFetcher(BaseFetcher):
         
         return ""
     
-    def _extract_sel_content(self, html: str) -> str:
+    def _extract_sel_content(self, doc: Document) -> str:
         """提取 Search Engine Land 详情页内容"""
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        for script in soup(["script", "style", "nav", "header", "footer", "aside"]):
-            script.decompose()
+        doc.strip_boilerplate(ARTICLE_BOILERPLATE)
+        soup = doc.soup
         
         content_elem = (
             soup.find('div', class_=re.compile('entry-content|post-content|article-body')) or
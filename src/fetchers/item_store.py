@@ -0,0 +1,160 @@
+"""
+条目历史库 - 追加写入每次抓取到的 ContentItem
+
+SQLite 单文件，按日期、分组（公司 / 行业模块）和 URL 哈希建索引。
+周报、月度汇总和补抓都可以用日期范围查询得到，无需重新抓取；
+同一 URL 多次抓到时查询返回最近一次的记录。
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+from .base import ContentItem
+from .crawl_state import canonical_url
+
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+from config.settings import ITEM_STORE_CONFIG
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    section TEXT NOT NULL,
+    group_key TEXT NOT NULL,
+    day INTEGER,
+    url_hash TEXT NOT NULL,
+    url TEXT,
+    source TEXT,
+    title TEXT,
+    summary TEXT,
+    run_id INTEGER,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_items_day ON items (section, day);
+CREATE INDEX IF NOT EXISTS idx_items_group_day ON items (group_key, day);
+CREATE INDEX IF NOT EXISTS idx_items_url ON items (url_hash);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    section TEXT NOT NULL,
+    window_start INTEGER NOT NULL,
+    window_end INTEGER NOT NULL,
+    groups TEXT NOT NULL,
+    complete INTEGER NOT NULL,
+    finished_at REAL NOT NULL
+);
+"""
+
+
+def url_hash(url: str) -> str:
+    return hashlib.sha1(canonical_url(url).encode("utf-8")).hexdigest() if url else ""
+
+
+def _ordinal(value) -> int:
+    if isinstance(value, datetime):
+        value = value.date()
+    return value.toordinal()
+
+
+class ItemStore:
+    """
+    section: "competitor"（分组为公司 key）或 "industry"（分组为行业模块）
+    runs 表记录每次写入的窗口和分组，用于判断库中数据能否直接生成本次报告
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path or ITEM_STORE_CONFIG["path"]
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.executescript(SCHEMA)
+
+    def record_run(self, section: str, results: Dict[str, List[ContentItem]],
+                   window_start: datetime, window_end: datetime, complete: bool = True) -> int:
+        """
+        追加一次抓取结果
+        :param results: {分组: [ContentItem]}（未抓到条目的分组也应包含，值为空列表）
+        :param complete: 抓取是否完整（超时等中断的结果不用于直接生成报告）
+        :return: run id
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO runs (section, window_start, window_end, groups, complete, finished_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (section, _ordinal(window_start), _ordinal(window_end),
+                 json.dumps(list(results.keys()), ensure_ascii=False), int(complete), now),
+            )
+            run_id = cursor.lastrowid
+            self._conn.executemany(
+                "INSERT INTO items (section, group_key, day, url_hash, url, source, title, summary, run_id, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(section, group, item.day.toordinal() if item.day else None, url_hash(item.url),
+                  item.url, item.source, item.title, item.summary, run_id, now)
+                 for group, items in results.items() for item in items],
+            )
+        return run_id
+
+    def items_between(self, section: str, start, end, groups: List[str] = None) -> Dict[str, List[ContentItem]]:
+        """
+        日期范围内的条目（含首尾），同一 URL 只取最近一次记录，组内按日期倒序
+        :param groups: 返回的分组及顺序，默认为库中出现过的分组
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT group_key, title, summary, day, url, source FROM items "
+                "WHERE id IN (SELECT MAX(id) FROM items WHERE section = ? AND day BETWEEN ? AND ? GROUP BY url_hash) "
+                "ORDER BY day DESC, id",
+                (section, _ordinal(start), _ordinal(end)),
+            ).fetchall()
+
+        results: Dict[str, List[ContentItem]] = {group: [] for group in (groups or [])}
+        for group, title, summary, day, url, source in rows:
+            if groups is not None and group not in results:
+                continue
+            results.setdefault(group, []).append(
+                ContentItem.trusted(title, summary, date.fromordinal(day).isoformat(), url, source)
+            )
+        return results
+
+    def covering_run(self, section: str, window_start: datetime, window_end: datetime,
+                     groups: List[str], max_age_hours: float = None) -> Optional[Dict]:
+        """
+        最近 max_age_hours 内、窗口覆盖本次窗口且分组相同的完整抓取记录，没有时返回 None
+        """
+        max_age = (max_age_hours if max_age_hours is not None else ITEM_STORE_CONFIG["reuse_hours"]) * 3600
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, window_start, window_end, groups, finished_at FROM runs "
+                "WHERE section = ? AND complete = 1 AND finished_at >= ? "
+                "AND window_start <= ? AND window_end >= ? ORDER BY finished_at DESC",
+                (section, time.time() - max_age, _ordinal(window_start), _ordinal(window_end)),
+            ).fetchall()
+        for run_id, start, end, stored_groups, finished_at in rows:
+            if set(json.loads(stored_groups)) == set(groups):
+                return {"id": run_id, "finished_at": finished_at}
+        return None
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_store: Optional[ItemStore] = None
+_store_lock = threading.Lock()
+
+
+def get_item_store() -> ItemStore:
+    """获取进程级共享条目库"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ItemStore()
+        return _store
@@ -0,0 +1,45 @@
+"""
+排序列表提前终止 - COMPETITOR_SOURCES 中标记 "sorted_listing" 的来源按日期倒序排列，
+遇到早于窗口起点的条目后，后面的条目只会更早，可以停止遍历，不再打开详情页。
+"""
+
+from datetime import datetime
+
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+from config.settings import COMPETITOR_SOURCES
+
+
+def is_sorted_listing(source: str) -> bool:
+    return COMPETITOR_SOURCES.get(source, {}).get("sorted_listing", False)
+
+
+def passed_window(source: str, date_str: str, window_start: datetime) -> bool:
+    """
+    排序列表中的条目是否已早于窗口起点
+    :param source: COMPETITOR_SOURCES 中的公司 key
+    :param date_str: YYYY-MM-DD，无法解析时返回 False
+    """
+    if not date_str or not is_sorted_listing(source):
+        return False
+    try:
+        passed = datetime.strptime(date_str, "%Y-%m-%d").date() < window_start.date()
+    except ValueError:
+        return False
+    if passed:
+        print(f"    - {source} 列表已早于窗口起点 ({date_str})，停止遍历")
+    return passed
+
+
+def passed_window_month(source: str, year: int, month: int, window_start: datetime) -> bool:
+    """
+    排序列表中只知道年月的条目（如 URL 中的 /YYYY/MM/）是否已早于窗口起点所在月份
+    """
+    if not is_sorted_listing(source):
+        return False
+    passed = (year, month) < (window_start.year, window_start.month)
+    if passed:
+        print(f"    - {source} 列表已早于窗口起点 ({year}-{month:02d})，停止遍历")
+    return passed
@@ -0,0 +1,97 @@
+"""
+HTML 解析后端 - 抓取器统一通过 make_soup 构建 BeautifulSoup
+
+默认使用 lxml（C 实现，比 html.parser 快数倍），未安装时退回 html.parser。
+可选的 selectolax（lexbor 引擎）只用于正文提取：PARSER_CONFIG["content_engine"]
+为 "selectolax" 时 Document.content 直接在原始 HTML 上取文本，不经过 BeautifulSoup。
+"""
+
+import importlib.util
+import re
+from typing import List, Optional, Sequence
+
+from bs4 import BeautifulSoup
+
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+from config.settings import PARSER_CONFIG
+
+FALLBACK_BACKEND = "html.parser"
+
+_WHITESPACE = re.compile(r'\s+')
+_warned = set()
+
+
+def squash(text: str) -> str:
+    """合并空白"""
+    return _WHITESPACE.sub(' ', text).strip() if text else ""
+
+
+def _has_module(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+def available_backends() -> List[str]:
+    """当前环境可用的 BeautifulSoup 解析后端"""
+    backends = [FALLBACK_BACKEND]
+    if _has_module("lxml"):
+        backends.append("lxml")
+    if _has_module("html5lib"):
+        backends.append("html5lib")
+    return backends
+
+
+def parser_name(backend: str = None) -> str:
+    """解析后端名称，配置的后端不可用时退回 html.parser"""
+    backend = backend or PARSER_CONFIG["backend"]
+    if backend in available_backends():
+        return backend
+    if backend not in _warned:
+        _warned.add(backend)
+        print(f"  [!] 解析后端 {backend} 不可用，使用 {FALLBACK_BACKEND}")
+    return FALLBACK_BACKEND
+
+
+def make_soup(html: str, backend: str = None) -> BeautifulSoup:
+    """按配置的后端解析 HTML"""
+    return BeautifulSoup(html or "", parser_name(backend))
+
+
+def selectolax_available() -> bool:
+    return _has_module("selectolax")
+
+
+def use_selectolax() -> bool:
+    """正文提取是否使用 selectolax"""
+    if PARSER_CONFIG["content_engine"] != "selectolax":
+        return False
+    if selectolax_available():
+        return True
+    if "selectolax" not in _warned:
+        _warned.add("selectolax")
+        print("  [!] 未安装 selectolax，正文提取使用 BeautifulSoup")
+    return False
+
+
+def selectolax_content(html: str, selectors: Sequence[str], min_length: int = None,
+                       strip: Sequence[str] = (), body_fallback: bool = False) -> str:
+    """
+    用 selectolax 提取正文，参数与 Document.content 相同
+    """
+    from selectolax.parser import HTMLParser
+
+    tree = HTMLParser(html or "")
+    if strip:
+        tree.strip_tags(list(strip))
+    for selector in selectors:
+        node = tree.css_first(selector)
+        if node is not None:
+            text = squash(node.text(separator=' ', strip=True))
+            if min_length is None or len(text) > min_length:
+                return text
+
+    if body_fallback and tree.body is not None:
+        return squash(tree.body.text(separator=' ', strip=True))
+    return ""
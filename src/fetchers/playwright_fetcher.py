@@ -7,9 +7,13 @@ from datetime import datetime
 from typing import List, Dict, Optional
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
-
 from .base import ContentItem
+from .browser_pool import get_browser_pool
+from .readiness import PageReadiness, WaitLog, get_ready_condition
+from .document import Document
+from .dates import (parse_date, parse_named_month_date, parse_iso_date, month_number,
+                    format_ymd, YEAR_MONTH_WEEKDAY, DAY_NUMBER)
+from .parsing import make_soup
 
 import sys
 import os
@@ -17,101 +21,77 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(_
 sys.path.insert(0, project_root)
 from config.settings import COMPETITOR_SOURCES
 
+# Criteo 日历控件中的日期按钮
+CRITEO_DATE_BUTTON = "button.wd_wai_dateButton"
+
 
 class PlaywrightFetcher:
     """使用 Playwright 的抓取器"""
     
     def __init__(self):
-        self.browser = None
-        self.context = None
+        self.pool = get_browser_pool()
+        self.profile = "default"
+        self.wait_log = WaitLog()
     
     def _init_browser(self):
-        """初始化浏览器"""
-        if self.browser is None:
-            try:
-                from playwright.sync_api import sync_playwright
-                self.pw = sync_playwright().start()
-                self.browser = self.pw.chromium.launch(headless=True)
-                self.context = self.browser.new_context(
-                    user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                )
-            except ImportError:
-                print("  [!] Playwright 未安装，使用 requests 模式")
-                return False
+        """确保共享池中的浏览器可用"""
+        if not self.pool.is_available():
+            print("  [!] Playwright 不可用，使用 requests 模式")
+            return False
         return True
     
-    def fetch_page(self, url: str, wait_for: str = None, timeout: int = 30000) -> str:
+    def _new_page(self, profile: str = None):
+        return self.pool.acquire_page(profile or self.profile)
+    
+    def _close_page(self, page):
+        self.pool.release_page(page)
+    
+    def _goto_ready(self, page, url: str, source: str = None, detail: bool = False, wait_for: str = None,
+                    wait_until: str = "domcontentloaded", timeout: int = 30000) -> float:
+        """
+        打开页面并等待就绪条件满足
+        :return: 实际等待秒数（已记入 wait_log）
+        """
+        readiness = PageReadiness(page, get_ready_condition(source, detail, wait_for))
+        page.goto(url, wait_until=wait_until, timeout=timeout)
+        waited = readiness.wait()
+        self.wait_log.add(url, source, waited, readiness.met)
+        return waited
+    
+    def fetch_page(self, url: str, wait_for: str = None, timeout: int = 30000,
+                   source: str = None, detail: bool = False) -> str:
         """
         使用 Playwright 获取页面
         :param url: URL
-        :param wait_for: 等待特定选择器
+        :param wait_for: 等待特定选择器（覆盖配置中的就绪选择器）
         :param timeout: 超时时间
+        :param source: 公司 key，用于读取 COMPETITOR_SOURCES 中的就绪条件
+        :param detail: 是否为详情页
         :return: HTML 内容
         """
         if not self._init_browser():
             return None
         
-        page = self.context.new_page()
+        page = self._new_page()
         try:
-            page.goto(url, wait_until="networkidle", timeout=timeout)
-            
-            if wait_for:
-                page.wait_for_selector(wait_for, timeout=10000)
-            
-            # 等待 JavaScript 渲染
-            page.wait_for_timeout(3000)
+            # 等待 JavaScript 渲染：就绪条件满足即返回
+            self._goto_ready(page, url, source, detail, wait_for, timeout=timeout)
             
             html = page.content()
-            page.close()
+            self._close_page(page)
             return html
         except Exception as e:
             print(f"    [!] Playwright 错误: {e}")
-            page.close()
+            self._close_page(page)
             return None
     
     def close(self):
-        """关闭浏览器"""
-        if self.browser:
-            self.browser.close()
-        if hasattr(self, 'pw'):
-            self.pw.stop()
+        """浏览器由共享池管理，进程退出时统一关闭"""
+        pass
     
     def parse_date(self, date_str: str) -> Optional[str]:
         """解析日期"""
-        if not date_str:
-            return None
-        
-        date_str = date_str.strip()
-        
-        # 常见日期格式
-        patterns = [
-            (r"(\d{4})-(\d{1,2})-(\d{1,2})", lambda m: f"{m.group(1)}-{int(m.group(2)):02d}-{int(m.group(3)):02d}"),
-            (r"(\d{1,2})/(\d{1,2})/(\d{4})", lambda m: f"{m.group(3)}-{int(m.group(1)):02d}-{int(m.group(2)):02d}"),
-            (r"(\d{4})/(\d{1,2})/(\d{1,2})", lambda m: f"{m.group(1)}-{int(m.group(2)):02d}-{int(m.group(3)):02d}"),
-            (r"(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(\d{4})", 
-             lambda m: f"{m.group(3)}-{self._month_abbr_to_num(m.group(2)):02d}-{int(m.group(1)):02d}"),
-            (r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(\d{1,2}),?\s+(\d{4})", 
-             lambda m: f"{m.group(3)}-{self._month_abbr_to_num(m.group(1)):02d}-{int(m.group(2)):02d}"),
-            (r"(\d{4}-\d{2}-\d{2})T", lambda m: m.group(1)),
-        ]
-        
-        for pattern, formatter in patterns:
-            match = re.search(pattern, date_str, re.IGNORECASE)
-            if match:
-                try:
-                    return formatter(match)
-                except:
-                    continue
-        
-        return None
-    
-    def _month_abbr_to_num(self, month_abbr: str) -> int:
-        """月份缩写转数字"""
-        months = {
-            'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
-            'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-        }
-        return months.get(month_abbr.lower()[:3], 1)
+        return parse_date(date_str)
     
     def is_in_date_window(self, date_str: str, window_start: datetime, window_end: datetime) -> bool:
         """检查日期是否在窗口内"""
@@ -131,17 +111,12 @@ class PlaywrightFetcher:
         text = text.replace('\n', ' ').replace('\r', ' ').replace('\t', ' ')
         return text.strip()
     
-    def _fetch_detail(self, url: str) -> str:
+    def _fetch_detail(self, url: str, source: str = None) -> str:
         """获取详情页内容"""
-        html = self.fetch_page(url, timeout=20000)
+        html = self.fetch_page(url, timeout=20000, source=source, detail=True)
         if not html:
             return ""
         
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        for script in soup(["script", "style", "nav", "header", "footer"]):
-            script.decompose()
-        
         content_selectors = [
             'article',
             '.content',
@@ -149,13 +124,7 @@ class PlaywrightFetcher:
             '.post-content',
             'main',
         ]
-        
-        for selector in content_selectors:
-            elem = soup.select_one(selector)
-            if elem:
-                return self.clean_text(elem.get_text(separator=' ', strip=True))
-        
-        return ""
+        return Document(html, url).content(content_selectors)
     
     def fetch_criteo(self, window_start: datetime, window_end: datetime) -> List[ContentItem]:
         """抓取 Criteo - 使用日历控件（增强版）"""
@@ -167,24 +136,25 @@ class PlaywrightFetcher:
         if not self._init_browser():
             return items
         
-        page = self.context.new_page()
+        page = self._new_page()
         # 用于去重
         processed_urls = set()
         
         try:
             # 增加超时到 120 秒
             print(f"    访问 {url}...")
-            page.goto(url, wait_until="domcontentloaded", timeout=120000)
-            page.wait_for_timeout(8000)  # 等待日历控件加载
+            # 等待日历控件出现
+            self._goto_ready(page, url, "Criteo", wait_for=CRITEO_DATE_BUTTON, timeout=120000)
             
-            # 检查是否有 Cloudflare 挑战
+            # 检查是否有 Cloudflare 挑战：挑战通过后日历控件出现即继续
             content = page.content()
             if 'cloudflare' in content.lower() or 'checking your browser' in content.lower():
                 print("    ⚠️ 检测到 Cloudflare，等待挑战完成...")
-                page.wait_for_timeout(10000)
+                readiness = PageReadiness(page, {"selector": CRITEO_DATE_BUTTON, "max_wait_ms": 10000})
+                self.wait_log.add(url, "Criteo", readiness.wait(), readiness.met)
             
             # 查找所有可点击的日期按钮
-            date_buttons = page.query_selector_all('button.wd_wai_dateButton:not([disabled])')
+            date_buttons = page.query_selector_all(f'{CRITEO_DATE_BUTTON}:not([disabled])')
             print(f"    找到 {len(date_buttons)} 个可点击日期")
             
             for i, button in enumerate(date_buttons[:20]):  # 处理前20个日期
@@ -204,13 +174,14 @@ class PlaywrightFetcher:
                     
                     print(f"    [{i+1}] 处理日期: {date_str}")
                     
-                    # 使用 evaluate 点击（带有 scrollIntoView）
+                    # 使用 evaluate 点击（带有 scrollIntoView），等待新闻请求结束
+                    readiness = PageReadiness(page, get_ready_condition())
                     button.evaluate('el => { el.scrollIntoView({block: "center"}); setTimeout(() => el.click(), 100); }')
-                    page.wait_for_timeout(4000)  # 等待新闻加载
+                    self.wait_log.add(url, "Criteo", readiness.wait(), readiness.met)
                     
                     # 获取显示的新闻
                     html = page.content()
-                    soup = BeautifulSoup(html, 'html.parser')
+                    soup = make_soup(html)
                     
                     # 查找新闻链接 - 更宽松的选择器
                     news_links = soup.find_all('a', href=re.compile(r'202[0-9]'))
@@ -235,13 +206,12 @@ class PlaywrightFetcher:
                         print(f"      处理新闻: {title[:50]}...")
                         
                         # 获取详情内容 - 尝试更多选择器
-                        detail_page = self.context.new_page()
+                        detail_page = self._new_page()
                         try:
-                            detail_page.goto(detail_url, wait_until="domcontentloaded", timeout=30000)
-                            detail_page.wait_for_timeout(3000)
+                            self._goto_ready(detail_page, detail_url, "Criteo", detail=True, timeout=30000)
                             
                             detail_html = detail_page.content()
-                            detail_soup = BeautifulSoup(detail_html, 'html.parser')
+                            detail_soup = make_soup(detail_html)
                             
                             content = ""
                             for selector in ['article', '.content', '.main-content', 'main', '.wd_body', '.wd_content', '.press-release', '.news-content', 'body']:
@@ -268,7 +238,7 @@ class PlaywrightFetcher:
                         except Exception as e:
                             print(f"        ✗ 获取详情失败: {e}")
                         finally:
-                            detail_page.close()
+                            self._close_page(detail_page)
                             
                 except Exception as e:
                     print(f"    处理日期出错: {e}")
@@ -277,7 +247,7 @@ class PlaywrightFetcher:
         except Exception as e:
             print(f"    ✗ Playwright 错误: {e}")
         finally:
-            page.close()
+            self._close_page(page)
         
         print(f"    Criteo: {len(items)} 条（去重后）")
         return items
@@ -291,60 +261,19 @@ class PlaywrightFetcher:
         
         print("  [Playwright] 抓取 AppLovin...")
         
-        # 独立启动 Stealth 浏览器（需要特殊参数绕过 Cloudflare）
-        try:
-            from playwright.sync_api import sync_playwright
-            pw = sync_playwright().start()
-            browser = pw.chromium.launch(
-                headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-gpu',
-                    '--disable-extensions',
-                    '--disable-background-networking',
-                    '--disable-background-timer-throttling',
-                    '--disable-breakpad',
-                    '--disable-features=TranslateUI',
-                    '--disable-ipc-flooding-protection',
-                    '--disable-renderer-backgrounding',
-                    '--enable-features=NetworkService',
-                    '--force-color-profile=srgb',
-                    '--metrics-recording-only',
-                    '--mute-audio',
-                ]
-            )
-            context = browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-                locale='en-US',
-                timezone_id='America/New_York',
-            )
-            # 注入 stealth 脚本
-            context.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-                window.chrome = {runtime: {}, loadTimes: function() {}, csi: function() {}, app: {}};
-                Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
-            """)
-        except Exception as e:
-            print(f"    ✗ 浏览器启动失败: {e}")
+        # 使用共享池中的 stealth 上下文（需要特殊参数绕过 Cloudflare）
+        if not self._init_browser():
             return items
         
-        page = context.new_page()
+        page = self._new_page("stealth")
         processed_urls = set()
         
         try:
-            # 使用 domcontentloaded + 等待特定元素
-            page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            try:
-                page.wait_for_selector(".evergreen-item-date-time", timeout=15000)
-            except:
-                pass
-            page.wait_for_timeout(3000)
+            # 使用 domcontentloaded + 等待日期元素出现
+            self._goto_ready(page, url, "AppLovin", wait_for=".evergreen-item-date-time", timeout=60000)
             
             html = page.content()
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = make_soup(html)
             
             # 查找日期元素 (evergreen-item-date-time 或 evergreen-news-date)
             date_divs = soup.find_all('div', class_=re.compile('evergreen-item-date-time|evergreen-news-date'))
@@ -355,15 +284,10 @@ class PlaywrightFetcher:
                     date_text = date_div.get_text(strip=True)
                     
                     # 解析日期 "February 11, 2026" -> "2026-02-11"
-                    match = re.match(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})', date_text, re.IGNORECASE)
-                    if not match:
+                    date_str = parse_named_month_date(date_text)
+                    if not date_str:
                         continue
                     
-                    months = {'january': '01', 'february': '02', 'march': '03', 'april': '04', 'may': '05', 'june': '06',
-                             'july': '07', 'august': '08', 'september': '09', 'october': '10', 'november': '11', 'december': '12'}
-                    month_num = months.get(match.group(1).lower(), '01')
-                    date_str = f"{match.group(3)}-{month_num}-{match.group(2).zfill(2)}"
-                    
                     # 查找对应的新闻标题和链接
                     parent = date_div.find_parent()
                     if not parent:
@@ -401,13 +325,12 @@ class PlaywrightFetcher:
                         continue
                     
                     # 进入详情页获取内容
-                    detail_page = context.new_page()
+                    detail_page = self._new_page("stealth")
                     try:
-                        detail_page.goto(detail_url, wait_until="domcontentloaded", timeout=30000)
-                        detail_page.wait_for_timeout(3000)
+                        self._goto_ready(detail_page, detail_url, "AppLovin", detail=True, timeout=30000)
                         
                         detail_html = detail_page.content()
-                        detail_soup = BeautifulSoup(detail_html, 'html.parser')
+                        detail_soup = make_soup(detail_html)
                         
                         # 提取内容
                         content = ""
@@ -439,11 +362,11 @@ class PlaywrightFetcher:
                         else:
                             print(f" ✗ 无法提取内容")
                         
-                        detail_page.close()
+                        self._close_page(detail_page)
                     except Exception as e:
                         print(f" ✗ 详情页错误: {e}")
                         try:
-                            detail_page.close()
+                            self._close_page(detail_page)
                         except:
                             pass
                         continue
@@ -454,9 +377,7 @@ class PlaywrightFetcher:
         except Exception as e:
             print(f"    ✗ AppLovin 错误: {e}")
         finally:
-            page.close()
-            browser.close()
-            pw.stop()
+            self._close_page(page)
         
         print(f"    AppLovin: {len(items)} 条")
         return items
@@ -467,11 +388,11 @@ class PlaywrightFetcher:
         url = COMPETITOR_SOURCES["Unity"]["url"]
         
         print("  [Playwright] 抓取 Unity...")
-        html = self.fetch_page(url, wait_for="article, .news-item")
+        html = self.fetch_page(url, wait_for="article, .news-item", source="Unity")
         if not html:
             return items
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         articles = soup.find_all('article') or soup.select('.news-item, .post')
         
         print(f"    找到 {len(articles)} 篇文章")
@@ -492,7 +413,7 @@ class PlaywrightFetcher:
                     date_str = self.parse_date(date_elem.get_text()) or self.parse_date(date_elem.get('datetime', ''))
                 
                 if date_str and self.is_in_date_window(date_str, window_start, window_end):
-                    content = self._fetch_detail(detail_url)
+                    content = self._fetch_detail(detail_url, "Unity")
                     if content:
                         items.append(ContentItem(
                             title=title,
@@ -513,11 +434,11 @@ class PlaywrightFetcher:
         url = COMPETITOR_SOURCES["Criteo"]["url"]
         
         print("  [Playwright] 抓取 Criteo...")
-        html = self.fetch_page(url, wait_for="table, .item, .release")
+        html = self.fetch_page(url, wait_for="table, .item, .release", source="Criteo")
         if not html:
             return items
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         rows = soup.find_all('tr') or soup.select('.item, .release-item')
         
         print(f"    找到 {len(rows)} 行")
@@ -537,7 +458,7 @@ class PlaywrightFetcher:
                     date_str = self.parse_date(date_elem.get_text())
                 
                 if date_str and self.is_in_date_window(date_str, window_start, window_end):
-                    content = self._fetch_detail(detail_url)
+                    content = self._fetch_detail(detail_url, "Criteo")
                     if content:
                         items.append(ContentItem(
                             title=title,
@@ -561,15 +482,14 @@ class PlaywrightFetcher:
         if not self._init_browser():
             return items
         
-        page = self.context.new_page()
+        page = self._new_page()
         processed_urls = set()
         
         try:
-            page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            page.wait_for_timeout(5000)
+            self._goto_ready(page, url, "Taboola", timeout=60000)
             
             html = page.content()
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = make_soup(html)
             
             articles = soup.find_all('article') or soup.select('.post, .entry')
             print(f"    找到 {len(articles)} 篇文章")
@@ -591,13 +511,12 @@ class PlaywrightFetcher:
                         continue
                     
                     # 进入详情页获取日期
-                    detail_page = self.context.new_page()
+                    detail_page = self._new_page()
                     try:
-                        detail_page.goto(detail_url, wait_until="domcontentloaded", timeout=30000)
-                        detail_page.wait_for_timeout(3000)
+                        self._goto_ready(detail_page, detail_url, "Taboola", detail=True, timeout=30000)
                         
                         detail_html = detail_page.content()
-                        detail_soup = BeautifulSoup(detail_html, 'html.parser')
+                        detail_soup = make_soup(detail_html)
                         
                         # 提取日期 - Taboola 使用非标准格式 "2026-Feb-Thu"
                         date_str = None
@@ -608,26 +527,16 @@ class PlaywrightFetcher:
                             time_text = time_elem.get_text(strip=True)
                             
                             # 尝试标准格式
-                            match = re.search(r'(\d{4})-(\d{2})-(\d{2})', datetime_attr)
-                            if match:
-                                date_str = f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
-                            # 尝试非标准格式 "2026-Feb-Thu"
-                            elif re.match(r'\d{4}-[A-Za-z]{3}-[A-Za-z]{3}', datetime_attr):
-                                match = re.match(r'(\d{4})-([A-Za-z]{3})', datetime_attr)
-                                if match:
-                                    months = {'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04', 'may': '05', 'jun': '06',
-                                             'jul': '07', 'aug': '08', 'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'}
-                                    month_num = months.get(match.group(2).lower(), '01')
-                                    day_match = re.search(r'(\d{1,2})', time_text)
-                                    if day_match:
-                                        date_str = f"{match.group(1)}-{month_num}-{day_match.group(1).zfill(2)}"
+                            date_str = parse_iso_date(datetime_attr)
+                            # 尝试非标准格式 "2026-Feb-Thu"（日在文本中）
+                            if not date_str:
+                                match = YEAR_MONTH_WEEKDAY.match(datetime_attr)
+                                day_match = DAY_NUMBER.search(time_text) if match else None
+                                if day_match:
+                                    date_str = format_ymd(match.group(1), month_number(match.group(2)), day_match.group(1))
                             # 尝试文本格式 "Feb 05 2026"
-                            elif not date_str:
-                                match = re.match(r'([A-Za-z]{3})\s+(\d{1,2})\s+(\d{4})', time_text, re.IGNORECASE)
-                                if match:
-                                    months = {'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04', 'may': '05', 'jun': '06',
-                                             'jul': '07', 'aug': '08', 'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'}
-                                    date_str = f"{match.group(3)}-{months.get(match.group(1).lower(), '01')}-{match.group(2).zfill(2)}"
+                            if not date_str:
+                                date_str = parse_named_month_date(time_text)
                         
                         if date_str and self.is_in_date_window(date_str, window_start, window_end):
                             # 直接从详情页提取内容（已经在详情页了）
@@ -650,10 +559,10 @@ class PlaywrightFetcher:
                                 ))
                                 print(f"    ✓ {title[:40]}... ({date_str})")
                         
-                        detail_page.close()
+                        self._close_page(detail_page)
                     except Exception as e:
                         try:
-                            detail_page.close()
+                            self._close_page(detail_page)
                         except:
                             pass
                         continue
@@ -664,7 +573,7 @@ class PlaywrightFetcher:
         except Exception as e:
             print(f"    ✗ Taboola 错误: {e}")
         finally:
-            page.close()
+            self._close_page(page)
         
         print(f"    Taboola: {len(items)} 条")
         return items
@@ -678,15 +587,14 @@ class PlaywrightFetcher:
         if not self._init_browser():
             return items
         
-        page = self.context.new_page()
+        page = self._new_page()
         processed_urls = set()
         
         try:
-            page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            page.wait_for_timeout(5000)
+            self._goto_ready(page, url, "Teads", timeout=60000)
             
             html = page.content()
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = make_soup(html)
             
             # Teads 使用 .card 类
             articles = soup.select('.card')
@@ -720,13 +628,12 @@ class PlaywrightFetcher:
                             continue
                     
                     # 进入详情页获取日期
-                    detail_page = self.context.new_page()
+                    detail_page = self._new_page()
                     try:
-                        detail_page.goto(detail_url, wait_until="domcontentloaded", timeout=30000)
-                        detail_page.wait_for_timeout(3000)
+                        self._goto_ready(detail_page, detail_url, "Teads", detail=True, timeout=30000)
                         
                         detail_html = detail_page.content()
-                        detail_soup = BeautifulSoup(detail_html, 'html.parser')
+                        detail_soup = make_soup(detail_html)
                         
                         # 提取日期 - Teads 使用 "February 5, 2026" 格式
                         date_str = None
@@ -736,30 +643,14 @@ class PlaywrightFetcher:
                             datetime_attr = time_elem.get('datetime', '')
                             time_text = time_elem.get_text(strip=True)
                             
-                            # 尝试标准格式 datetime="2026-02-05"
-                            match = re.search(r'(\d{4})-(\d{2})-(\d{2})', datetime_attr)
-                            if match:
-                                date_str = f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
-                            # 尝试文本格式 "February 5, 2026"
-                            elif not date_str and time_text:
-                                match = re.match(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})', time_text, re.IGNORECASE)
-                                if match:
-                                    months = {'january': '01', 'february': '02', 'march': '03', 'april': '04', 'may': '05', 'june': '06',
-                                             'july': '07', 'august': '08', 'september': '09', 'october': '10', 'november': '11', 'december': '12'}
-                                    month_num = months.get(match.group(1).lower(), '01')
-                                    date_str = f"{match.group(3)}-{month_num}-{match.group(2).zfill(2)}"
+                            # 尝试标准格式 datetime="2026-02-05"，再尝试文本格式 "February 5, 2026"
+                            date_str = parse_iso_date(datetime_attr) or parse_named_month_date(time_text)
                         
                         # 备选：查找日期类元素
                         if not date_str:
                             date_elem = detail_soup.find(class_=re.compile('date|published|time'))
                             if date_elem:
-                                date_text = date_elem.get_text(strip=True)
-                                match = re.match(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})', date_text, re.IGNORECASE)
-                                if match:
-                                    months = {'january': '01', 'february': '02', 'march': '03', 'april': '04', 'may': '05', 'june': '06',
-                                             'july': '07', 'august': '08', 'september': '09', 'october': '10', 'november': '11', 'december': '12'}
-                                    month_num = months.get(match.group(1).lower(), '01')
-                                    date_str = f"{match.group(3)}-{month_num}-{match.group(2).zfill(2)}"
+                                date_str = parse_named_month_date(date_elem.get_text(strip=True))
                         
                         if date_str:
                             print(f"    [{len(items)+1}] {title[:50]}... | 日期: {date_str}", end="")
@@ -797,11 +688,11 @@ class PlaywrightFetcher:
                         else:
                             print(f"    无法提取日期: {title[:40]}...")
                         
-                        detail_page.close()
+                        self._close_page(detail_page)
                     except Exception as e:
                         print(f"    详情页错误: {e}")
                         try:
-                            detail_page.close()
+                            self._close_page(detail_page)
                         except:
                             pass
                         continue
@@ -813,7 +704,7 @@ class PlaywrightFetcher:
         except Exception as e:
             print(f"    ✗ Teads 错误: {e}")
         finally:
-            page.close()
+            self._close_page(page)
         
         print(f"    Teads: {len(items)} 条")
         return items
@@ -824,11 +715,11 @@ class PlaywrightFetcher:
         url = COMPETITOR_SOURCES["Zeta Global"]["url"]
         
         print("  [Playwright] 抓取 Zeta Global...")
-        html = self.fetch_page(url, wait_for="table, .item")
+        html = self.fetch_page(url, wait_for="table, .item", source="Zeta Global")
         if not html:
             return items
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         rows = soup.find_all('tr') or soup.select('.item')
         
         print(f"    找到 {len(rows)} 行")
@@ -848,7 +739,7 @@ class PlaywrightFetcher:
                     date_str = self.parse_date(date_elem.get_text())
                 
                 if date_str and self.is_in_date_window(date_str, window_start, window_end):
-                    content = self._fetch_detail(detail_url)
+                    content = self._fetch_detail(detail_url, "Zeta Global")
                     if content:
                         items.append(ContentItem(
                             title=title,
@@ -0,0 +1,163 @@
+"""
+页面就绪等待 - 用就绪条件替代固定 sleep，条件满足即返回并记录实际等待时间
+
+就绪条件来自 COMPETITOR_SOURCES / INDUSTRY_SOURCES[key]["ready"]（列表页）/ ["detail_ready"]（详情页），字段：
+- selector: 选择器出现即视为就绪
+- network_idle_ms: 没有进行中的请求且持续该毫秒数视为就绪
+- max_wait_ms: 最长等待时间，超时后按当前 DOM 继续
+同时配置 selector 和 network_idle_ms 时两者都满足才算就绪；未配置时使用 BROWSER_CONFIG["default_ready"]。
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+from config.settings import COMPETITOR_SOURCES, INDUSTRY_SOURCES, BROWSER_CONFIG
+
+
+POLL_INTERVAL_MS = 50
+
+
+def get_ready_condition(source: str = None, detail: bool = False, wait_for: str = None) -> Dict:
+    """
+    获取就绪条件
+    :param source: COMPETITOR_SOURCES 中的公司 key 或 INDUSTRY_SOURCES 中的来源 key
+    :param detail: 是否为详情页
+    :param wait_for: 调用方指定的选择器，覆盖配置中的 selector
+    :return: 就绪条件字典
+    """
+    default = BROWSER_CONFIG["default_ready"]
+    config = (COMPETITOR_SOURCES.get(source) or INDUSTRY_SOURCES.get(source) or {}) if source else {}
+    condition = dict(config.get("detail_ready" if detail else "ready") or default)
+    condition.setdefault("max_wait_ms", default["max_wait_ms"])
+    if wait_for:
+        condition["selector"] = wait_for
+    return condition
+
+
+class _NetworkTracker:
+    """统计页面进行中的请求数和最近一次网络活动时间"""
+
+    def __init__(self, page, condition: Dict):
+        self.page = page
+        self.condition = condition
+        self.max_wait_ms = condition.get("max_wait_ms", BROWSER_CONFIG["default_ready"]["max_wait_ms"])
+        self.idle_ms = condition.get("network_idle_ms")
+        self.inflight = 0
+        self.last_activity = time.monotonic()
+        self.met = False
+        if self.idle_ms:
+            page.on("request", self._on_request)
+            page.on("requestfinished", self._on_done)
+            page.on("requestfailed", self._on_done)
+
+    def _on_request(self, request):
+        self.inflight += 1
+        self.last_activity = time.monotonic()
+
+    def _on_done(self, request):
+        # 监听前发出的请求也会触发完成事件，计数不能为负
+        self.inflight = max(0, self.inflight - 1)
+        self.last_activity = time.monotonic()
+
+    def _is_idle(self) -> bool:
+        return self.inflight == 0 and (time.monotonic() - self.last_activity) * 1000 >= self.idle_ms
+
+    def _remaining_ms(self, deadline: float) -> int:
+        return max(0, int((deadline - time.monotonic()) * 1000))
+
+    def detach(self):
+        if not self.idle_ms:
+            return
+        for event, handler in (("request", self._on_request),
+                               ("requestfinished", self._on_done),
+                               ("requestfailed", self._on_done)):
+            try:
+                self.page.remove_listener(event, handler)
+            except Exception:
+                pass
+
+
+class PageReadiness(_NetworkTracker):
+    """
+    同步页面就绪等待，需在 goto 之前创建以便统计请求：
+
+        readiness = PageReadiness(page, condition)
+        page.goto(url, wait_until="domcontentloaded")
+        waited = readiness.wait()
+    """
+
+    def wait(self) -> float:
+        """等待就绪，返回实际等待秒数"""
+        start = time.monotonic()
+        deadline = start + self.max_wait_ms / 1000
+        try:
+            selector_ok = True
+            selector = self.condition.get("selector")
+            if selector:
+                try:
+                    self.page.wait_for_selector(selector, state="attached", timeout=self._remaining_ms(deadline) or 1)
+                except Exception:
+                    selector_ok = False
+
+            idle_ok = not self.idle_ms
+            while selector_ok and not idle_ok and time.monotonic() < deadline:
+                # 同步 API 只在调用期间分发事件，用短等待驱动请求回调
+                self.page.wait_for_timeout(POLL_INTERVAL_MS)
+                idle_ok = self._is_idle()
+
+            self.met = selector_ok and idle_ok
+        finally:
+            self.detach()
+        return time.monotonic() - start
+
+
+class AsyncPageReadiness(_NetworkTracker):
+    """PageReadiness 的 playwright.async_api 版本"""
+
+    async def wait(self) -> float:
+        """等待就绪，返回实际等待秒数"""
+        start = time.monotonic()
+        deadline = start + self.max_wait_ms / 1000
+        try:
+            selector_ok = True
+            selector = self.condition.get("selector")
+            if selector:
+                try:
+                    await self.page.wait_for_selector(selector, state="attached", timeout=self._remaining_ms(deadline) or 1)
+                except Exception:
+                    selector_ok = False
+
+            idle_ok = not self.idle_ms
+            while selector_ok and not idle_ok and time.monotonic() < deadline:
+                await asyncio.sleep(POLL_INTERVAL_MS / 1000)
+                idle_ok = self._is_idle()
+
+            self.met = selector_ok and idle_ok
+        finally:
+            self.detach()
+        return time.monotonic() - start
+
+
+class WaitLog:
+    """记录每次页面加载的实际等待时间"""
+
+    def __init__(self):
+        self.records: List[Dict] = []
+
+    def add(self, url: str, source: Optional[str], waited: float, met: bool):
+        self.records.append({"url": url, "source": source, "waited": round(waited, 3), "met": met})
+
+    @property
+    def total(self) -> float:
+        return sum(r["waited"] for r in self.records)
+
+    def summary(self) -> str:
+        if not self.records:
+            return "无页面等待"
+        timeouts = sum(1 for r in self.records if not r["met"])
+        return f"{len(self.records)} 次页面加载，共等待 {self.total:.1f}s，{timeouts} 次超时"
@@ -0,0 +1,42 @@
+"""
+本地 JSON 状态文件 - 跨运行保存的小型状态（抓取层结果、缓存索引等）
+
+读取失败（文件不存在或损坏）时返回空状态；写入先写临时文件再替换，避免中断时留下半个文件。
+"""
+
+import json
+import os
+import threading
+from typing import Dict
+
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+from config.settings import CACHE_CONFIG
+
+
+class JsonStateFile:
+    """缓存目录下的一个 JSON 文件"""
+
+    def __init__(self, filename: str, cache_dir: str = None):
+        self.path = os.path.join(cache_dir or CACHE_CONFIG["cache_dir"], filename)
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def save(self, data: Dict):
+        with self._lock:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"  [!] 状态文件写入失败 {self.path}: {e}")
@@ -3,8 +3,6 @@
 Stealth Playwright 抓取器 - 模拟真人浏览器绕过反爬虫检测
 """
 import re
-import time
-import random
 from datetime import datetime
 from typing import List, Dict, Optional
 from urllib.parse import urljoin
@@ -12,6 +10,15 @@ from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 
 from .base import ContentItem
+from .browser_pool import get_browser_pool
+from .transport import get_transport
+from .crawl_state import get_crawl_state
+from .listing import passed_window, passed_window_month
+from .readiness import PageReadiness, WaitLog, get_ready_condition
+from .dates import (parse_date, parse_named_month_date, parse_iso_date, parse_rss_date, month_number,
+                    parse_url_date, format_ymd, ISO_DATE_PREFIX, YEAR_MONTH_WEEKDAY, DAY_NUMBER)
+from .document import Document
+from .parsing import make_soup
 
 import sys
 import os
@@ -20,119 +27,71 @@ sys.path.insert(0, project_root)
 from config.settings import COMPETITOR_SOURCES
 
 
+CRITEO_NEWS_URL = "https://www.criteo.com/news/"
+# Criteo 新闻 URL 中的日期：/news/press-releases/YYYY/MM/slug，个别为 /YYYY/MM/DD/
+CRITEO_URL_DATE = re.compile(r'/news/press-releases/(\d{4})/(\d{2})/(?:(\d{2})/)?')
+CRITEO_DETAIL_SELECTORS = ['.press-release', '.entry-content', '.content', 'article', 'main']
+
+
 class StealthFetcher:
     """使用 stealth 技术的抓取器"""
     
     def __init__(self):
-        self.browser = None
-        self.context = None
-        self.pw = None
+        self.pool = get_browser_pool()
+        self.profile = "stealth"
+        self.wait_log = WaitLog()
+        self.transport = get_transport()
+        self.crawl_state = get_crawl_state()
     
     def _init_browser(self):
-        """初始化 stealth 浏览器"""
-        if self.browser is None:
-            try:
-                from playwright.sync_api import sync_playwright
-                self.pw = sync_playwright().start()
-                
-                self.browser = self.pw.chromium.launch(
-                    headless=True,
-                    args=[
-                        '--no-sandbox',
-                        '--disable-setuid-sandbox',
-                        '--disable-dev-shm-usage',
-                        '--disable-gpu',
-                        '--disable-extensions',
-                        '--disable-background-networking',
-                        '--disable-background-timer-throttling',
-                        '--disable-breakpad',
-                        '--disable-features=TranslateUI',
-                        '--disable-ipc-flooding-protection',
-                        '--disable-renderer-backgrounding',
-                        '--enable-features=NetworkService',
-                        '--force-color-profile=srgb',
-                        '--metrics-recording-only',
-                        '--mute-audio',
-                    ]
-                )
-                
-                self.context = self.browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-                    locale='en-US',
-                    timezone_id='America/New_York',
-                )
-                
-                # 注入 stealth 脚本
-                self.context.add_init_script("""
-                    Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-                    window.chrome = {runtime: {}, loadTimes: function() {}, csi: function() {}, app: {}};
-                    Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
-                """)
-                
-            except Exception as e:
-                print(f"  [!] Stealth 初始化失败: {e}")
-                return False
-        return True
+        """确保共享池中的 stealth 浏览器可用"""
+        return self.pool.is_available()
+    
+    def _new_page(self):
+        return self.pool.acquire_page(self.profile)
+    
+    def _close_page(self, page):
+        self.pool.release_page(page)
     
-    def _random_delay(self, min_ms=1000, max_ms=3000):
-        time.sleep(random.uniform(min_ms, max_ms) / 1000)
+    def _goto_ready(self, page, url: str, source: str = None, detail: bool = False, wait_for: str = None,
+                    wait_until: str = "domcontentloaded", timeout: int = 60000) -> float:
+        """
+        打开页面并等待就绪条件满足，详情页的响应状态码记入抓取状态
+        :return: 实际等待秒数（已记入 wait_log）
+        """
+        readiness = PageReadiness(page, get_ready_condition(source, detail, wait_for))
+        response = page.goto(url, wait_until=wait_until, timeout=timeout)
+        if detail:
+            self.crawl_state.record_status(url, response.status if response else None)
+        waited = readiness.wait()
+        self.wait_log.add(url, source, waited, readiness.met)
+        return waited
     
-    def fetch_page(self, url: str, wait_for: str = None, timeout: int = 60000) -> str:
+    def fetch_page(self, url: str, wait_for: str = None, timeout: int = 60000,
+                   source: str = None, detail: bool = False) -> str:
         if not self._init_browser():
             return None
         
-        page = self.context.new_page()
+        page = self._new_page()
         try:
             print(f"    [Stealth] 访问: {url[:50]}...")
-            page.goto(url, wait_until="domcontentloaded", timeout=timeout)
-            self._random_delay(3000, 5000)
-            
-            if wait_for:
-                try:
-                    page.wait_for_selector(wait_for, timeout=10000)
-                except:
-                    pass
+            waited = self._goto_ready(page, url, source, detail, wait_for, timeout=timeout)
+            print(f"    [Stealth] 就绪: {waited:.1f}s")
             
             html = page.content()
-            page.close()
+            self._close_page(page)
             return html
         except Exception as e:
             print(f"    [Stealth] 错误: {e}")
-            page.close()
+            self._close_page(page)
             return None
     
     def close(self):
-        if self.browser:
-            self.browser.close()
-        if self.pw:
-            self.pw.stop()
+        """浏览器由共享池管理，进程退出时统一关闭"""
+        pass
     
     def parse_date(self, date_str: str) -> Optional[str]:
-        if not date_str:
-            return None
-        date_str = date_str.strip()
-        patterns = [
-            (r"(\d{4})-(\d{1,2})-(\d{1,2})", lambda m: f"{m.group(1)}-{int(m.group(2)):02d}-{int(m.group(3)):02d}"),
-            (r"(\d{1,2})/(\d{1,2})/(\d{4})", lambda m: f"{m.group(3)}-{int(m.group(1)):02d}-{int(m.group(2)):02d}"),
-            (r"(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(\d{4})", 
-             lambda m: f"{m.group(3)}-{self._month_abbr_to_num(m.group(2)):02d}-{int(m.group(1)):02d}"),
-            (r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(\d{1,2}),?\s+(\d{4})", 
-             lambda m: f"{m.group(3)}-{self._month_abbr_to_num(m.group(1)):02d}-{int(m.group(2)):02d}"),
-        ]
-        for pattern, formatter in patterns:
-            match = re.search(pattern, date_str, re.IGNORECASE)
-            if match:
-                try:
-                    return formatter(match)
-                except:
-                    continue
-        return None
-    
-    def _month_abbr_to_num(self, month_abbr: str) -> int:
-        months = {'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
-                  'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12}
-        return months.get(month_abbr.lower()[:3], 1)
+        return parse_date(date_str)
     
     def is_in_date_window(self, date_str: str, window_start: datetime, window_end: datetime) -> bool:
         if not date_str:
@@ -148,35 +107,69 @@ class StealthFetcher:
             return ""
         return re.sub(r'\s+', ' ', text).strip()
     
-    def _fetch_detail(self, url: str) -> str:
-        html = self.fetch_page(url, timeout=30000)
+    def _seen_item(self, detail_url: str, source: str, window_start: datetime, window_end: datetime) -> tuple:
+        """
+        查询增量抓取状态，判断是否需要打开详情页
+        :return: (known, item) - known 为 True 时无需打开；item 为可直接复用的条目（不在窗口时为 None）
+        """
+        entry = self.crawl_state.get(detail_url)
+        if not entry or not entry.get("date"):
+            return False, None
+        if not self.is_in_date_window(entry["date"], window_start, window_end):
+            return True, None
+        if entry.get("title") and entry.get("summary"):
+            return True, ContentItem(
+                title=entry["title"], summary=entry["summary"], date=entry["date"],
+                url=detail_url, source=source
+            )
+        return False, None
+    
+    def _fetch_detail(self, url: str, source: str = None) -> str:
+        html = self.fetch_page(url, timeout=30000, source=source, detail=True)
         if not html:
             return ""
-        soup = BeautifulSoup(html, 'html.parser')
-        for script in soup(["script", "style", "nav", "header", "footer"]):
-            script.decompose()
-        for selector in ['article', '.content', '.main-content', 'main']:
-            elem = soup.select_one(selector)
-            if elem:
-                return self.clean_text(elem.get_text(separator=' ', strip=True))
-        return ""
+        return Document(html, url).content(['article', '.content', '.main-content', 'main'])
     
     def fetch_criteo(self, window_start: datetime, window_end: datetime) -> List[ContentItem]:
         """抓取 Criteo - 使用官网新闻列表"""
         items = []
-        url = "https://www.criteo.com/news/"
+        url = CRITEO_NEWS_URL
         print("  [Stealth] 抓取 Criteo...")
         
-        html = self.fetch_page(url, timeout=60000)
+        html = self.fetch_page(url, timeout=60000, source="Criteo")
         if not html:
             return items
         
-        soup = BeautifulSoup(html, 'html.parser')
+        for detail_url, title, date_str in self._criteo_candidates(html, url, window_start, window_end):
+            try:
+                # 尝试从详情页获取内容（更准确的日期和内容）
+                content, detail_date = self._fetch_detail_content(detail_url, CRITEO_DETAIL_SELECTORS, "Criteo")
+                item = self._criteo_item(detail_url, title, date_str, content, detail_date, window_start, window_end)
+                if item:
+                    items.append(item)
+                
+                # 限制最多3条
+                if len(items) >= 3:
+                    break
+                    
+            except Exception as e:
+                continue
+        
+        print(f"    Criteo: {len(items)} 条")
+        return items
+    
+    def _criteo_candidates(self, html: str, url: str, window_start: datetime, window_end: datetime) -> List[tuple]:
+        """
+        解析 Criteo 新闻列表，按 URL 日期和主体过滤
+        :return: [(detail_url, title, date_str), ...]，URL 只含年月时 date_str 为空
+        """
+        soup = make_soup(html)
         
         # 查找新闻链接 - 基于实际页面结构
         news_links = soup.find_all('a', href=re.compile(r'/news/press-releases/\d{4}/\d{2}/'))
         print(f"    找到 {len(news_links)} 个新闻链接")
         
+        candidates = []
         processed_urls = set()
         
         for link in news_links[:10]:
@@ -208,19 +201,24 @@ class StealthFetcher:
                         title = slug.replace('-', ' ').title()
                         print(f"      从URL生成标题: {title[:50]}...")
                 
-                # 如果标题是 "Read More" 或类似，需要从详情页获取真实标题
-                is_read_more = 'read more' in title.lower() or len(title) < 20
-                
-                # 从URL提取日期 /2026/02/09/ -> 2026-02-09
-                date_match = re.search(r'/(\d{4})/(\d{2})/(\d{2})/', href)
-                if date_match:
-                    date_str = f"{date_match.group(1)}-{date_match.group(2)}-{date_match.group(3)}"
-                else:
-                    date_str = datetime.now().strftime('%Y-%m-%d')
+                # 从URL提取年月 /news/press-releases/2026/02/slug（个别带日 /2026/02/09/）
+                date_match = CRITEO_URL_DATE.search(href)
+                if not date_match:
+                    print(f"      - URL 中无日期")
+                    continue
+                year, month, day = int(date_match.group(1)), int(date_match.group(2)), date_match.group(3)
                 
-                print(f"      日期: {date_str}")
+                # 列表按日期倒序：所在月份早于窗口起点月份后不再继续
+                if passed_window_month("Criteo", year, month, window_start):
+                    break
+                if (year, month) > (window_end.year, window_end.month):
+                    print(f"      - 月份晚于窗口")
+                    continue
                 
-                if not self.is_in_date_window(date_str, window_start, window_end):
+                # 只有年月时日期留空，由详情页日期决定是否在窗口内
+                date_str = f"{year}-{month:02d}-{day}" if day else ""
+                print(f"      日期: {date_str or f'{year}-{month:02d}（待详情页确认）'}")
+                if date_str and not self.is_in_date_window(date_str, window_start, window_end):
                     print(f"      - 日期不在窗口")
                     continue
                 
@@ -229,46 +227,40 @@ class StealthFetcher:
                     print(f"      - 跳过(非主体): {title[:50]}...")
                     continue
                 
-                # 尝试从详情页获取内容（更准确的日期和内容）
-                content, detail_date = self._fetch_detail_content(
-                    detail_url, 
-                    ['.press-release', '.entry-content', '.content', 'article', 'main']
-                )
-                
-                # 如果详情页获取到日期，使用详情页的日期（更准确）
-                if detail_date:
-                    date_str = detail_date
-                    print(f"      详情页日期: {date_str}")
-                
-                # 再次检查日期窗口（使用详情页的准确日期）
-                if not self.is_in_date_window(date_str, window_start, window_end):
-                    print(f"      - 日期不在窗口: {date_str}")
-                    continue
-                
-                # 使用详情页内容，如果没有则使用标题
-                if content:
-                    summary = content[:600]
-                    print(f"      ✓ 从详情页获取内容: {len(content)} 字符")
-                else:
-                    # 详情页失败，使用标题作为摘要
-                    summary = f"Criteo: {title}"
-                    print(f"      ! 详情页获取失败，使用标题")
-                
-                print(f"      ✓ 成功: {title[:50]}...")
-                items.append(ContentItem(
-                    title=title, summary=summary, date=date_str,
-                    url=detail_url, source="Criteo"
-                ))
-                
-                # 限制最多3条
-                if len(items) >= 3:
-                    break
+                candidates.append((detail_url, title, date_str))
                     
             except Exception as e:
                 continue
         
-        print(f"    Criteo: {len(items)} 条")
-        return items
+        return candidates
+    
+    def _criteo_item(self, detail_url: str, title: str, date_str: str, content: str, detail_date: str,
+                     window_start: datetime, window_end: datetime) -> Optional[ContentItem]:
+        """根据详情页结果生成 Criteo 条目，日期不在窗口时返回 None"""
+        # 如果详情页获取到日期，使用详情页的日期（更准确）
+        if detail_date:
+            date_str = detail_date
+            print(f"      详情页日期: {date_str}")
+        
+        # 再次检查日期窗口（使用详情页的准确日期）
+        if not self.is_in_date_window(date_str, window_start, window_end):
+            print(f"      - 日期不在窗口: {date_str}")
+            return None
+        
+        # 使用详情页内容，如果没有则使用标题
+        if content:
+            summary = content[:600]
+            print(f"      ✓ 从详情页获取内容: {len(content)} 字符")
+        else:
+            # 详情页失败，使用标题作为摘要
+            summary = f"Criteo: {title}"
+            print(f"      ! 详情页获取失败，使用标题")
+        
+        print(f"      ✓ 成功: {title[:50]}...")
+        return ContentItem(
+            title=title, summary=summary, date=date_str,
+            url=detail_url, source="Criteo"
+        )
     
     def _fetch_google_search_summary(self, title: str, company: str) -> str:
         """使用 Google 搜索标题获取摘要 - 通过搜索结果页面"""
@@ -283,10 +275,10 @@ class StealthFetcher:
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
             }
             
-            response = self.session.get(search_url, headers=headers, timeout=30)
+            response = self.transport.get(search_url, headers=headers, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = make_soup(response.text)
             
             # 查找搜索结果的摘要文本
             # 尝试多种可能的选择器
@@ -316,11 +308,11 @@ class StealthFetcher:
         url = "https://www.teads.com/blog/"
         
         try:
-            html = self.fetch_page(url, timeout=60000)
+            html = self.fetch_page(url, timeout=60000, source="Teads")
             if not html:
                 return items
             
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = make_soup(html)
             
             # 查找 blog 文章链接 (格式: /blog/title-slug/1234/)
             news_links = soup.find_all('a', href=re.compile(r'/blog/[^/]+/\d+'))
@@ -354,7 +346,8 @@ class StealthFetcher:
                     # 尝试从详情页获取内容和日期
                     content, detail_date = self._fetch_detail_content(
                         detail_url,
-                        ['.blog-content', '.entry-content', 'article', '.content', 'main']
+                        ['.blog-content', '.entry-content', 'article', '.content', 'main'],
+                        "Teads"
                     )
                     
                     # 使用详情页日期，如果没有则使用当前日期
@@ -408,17 +401,16 @@ class StealthFetcher:
         if not self._init_browser():
             return items
         
-        page = self.context.new_page()
+        page = self._new_page()
         processed_urls = set()
         
         try:
             # 使用较长超时和 load 等待，确保 Cloudflare 验证完成
             print("    访问投资者页面...")
-            page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            page.wait_for_timeout(5000)
+            self._goto_ready(page, url, "AppLovin", timeout=60000)
             
             html = page.content()
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = make_soup(html)
             
             # 查找日期元素
             date_divs = soup.find_all('div', class_=re.compile('evergreen-item-date-time|evergreen-news-date'))
@@ -429,15 +421,10 @@ class StealthFetcher:
                     date_text = date_div.get_text(strip=True)
                     
                     # 解析日期 "February 11, 2026" -> "2026-02-11"
-                    match = re.match(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})', date_text, re.IGNORECASE)
-                    if not match:
+                    date_str = parse_named_month_date(date_text)
+                    if not date_str:
                         continue
                     
-                    months = {'january': '01', 'february': '02', 'march': '03', 'april': '04', 'may': '05', 'june': '06',
-                             'july': '07', 'august': '08', 'september': '09', 'october': '10', 'november': '11', 'december': '12'}
-                    month_num = months.get(match.group(1).lower(), '01')
-                    date_str = f"{match.group(3)}-{month_num}-{match.group(2).zfill(2)}"
-                    
                     # 查找对应的新闻标题和链接
                     parent = date_div.find_parent()
                     if not parent:
@@ -463,12 +450,16 @@ class StealthFetcher:
                     
                     print(f"    [{len(items)+1}] {title[:50]}... | 日期: {date_str}", end="")
                     
+                    # 列表按日期倒序：早于窗口起点后不再继续
+                    if passed_window("AppLovin", date_str, window_start):
+                        break
+                    
                     if not self.is_in_date_window(date_str, window_start, window_end):
                         print(f" - 不在时间窗口")
                         continue
                     
                     # 获取详情
-                    content = self._fetch_detail(detail_url)
+                    content = self._fetch_detail(detail_url, "AppLovin")
                     if content:
                         items.append(ContentItem(
                             title=title, summary=content[:600], date=date_str,
@@ -488,7 +479,7 @@ class StealthFetcher:
         except Exception as e:
             print(f"    ✗ AppLovin 错误: {e}")
         finally:
-            page.close()
+            self._close_page(page)
         
         print(f"    AppLovin: {len(items)} 条")
         return items
@@ -568,16 +559,15 @@ class StealthFetcher:
         if not self._init_browser():
             return items
         
-        page = self.context.new_page()
+        page = self._new_page()
         processed_urls = set()
         
         try:
             print("    访问 Zeta Global 投资者页面...")
-            page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            page.wait_for_timeout(5000)
+            self._goto_ready(page, url, "Zeta Global", timeout=60000)
             
             html = page.content()
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = make_soup(html)
             
             # 查找新闻项 - 使用多种可能的选择器
             news_items = soup.find_all('div', class_=re.compile('news|press|item|release'))
@@ -617,6 +607,10 @@ class StealthFetcher:
                     if not date_str:
                         continue
                     
+                    # 列表按日期倒序：早于窗口起点后不再继续
+                    if passed_window("Zeta Global", date_str, window_start):
+                        break
+                    
                     if not self.is_in_date_window(date_str, window_start, window_end):
                         continue
                     
@@ -648,7 +642,7 @@ class StealthFetcher:
         except Exception as e:
             print(f"    ✗ Zeta Global 错误: {e}")
         finally:
-            page.close()
+            self._close_page(page)
         
         print(f"    Zeta Global: {len(items)} 条")
         return items
@@ -664,31 +658,14 @@ class StealthFetcher:
         if not self._init_browser():
             return items
         
-        page = self.context.new_page()
+        page = self._new_page()
         processed_urls = set()
         
         try:
             # 访问列表页
-            page.goto(url, wait_until="load", timeout=120000)
-            page.wait_for_timeout(5000)
-            
-            html = page.content()
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # 查找博客链接
-            blog_links = soup.find_all('a', href=re.compile('/resources/blog/\\d+'))
-            print(f"    找到 {len(blog_links)} 个博客链接")
-            
-            # 去重并只取前3个
-            seen_urls = set()
-            unique_links = []
-            for link in blog_links:
-                href = link.get('href', '')
-                if href and href not in seen_urls:
-                    seen_urls.add(href)
-                    unique_links.append(href)
+            self._goto_ready(page, url, "BIGO Ads", wait_until="load", timeout=120000)
             
-            print(f"    去重后: {len(unique_links)} 个，检查前3个")
+            unique_links = self._bigo_detail_links(page.content())
             
             for i, href in enumerate(unique_links[:3]):
                 try:
@@ -701,90 +678,20 @@ class StealthFetcher:
                     
                     print(f"\n    [{i+1}] 访问: {href}")
                     
+                    known, item = self._seen_item(detail_url, "BIGO Ads", window_start, window_end)
+                    if known:
+                        if item:
+                            items.append(item)
+                        continue
+                    
                     # 进入详情页
-                    detail_page = self.context.new_page()
                     try:
-                        detail_page.goto(detail_url, wait_until="domcontentloaded", timeout=30000)
-                        detail_page.wait_for_timeout(3000)
-                        
-                        detail_html = detail_page.content()
-                        detail_soup = BeautifulSoup(detail_html, 'html.parser')
-                        
-                        # 获取标题
-                        title = ""
-                        h1 = detail_soup.find('h1')
-                        if h1:
-                            title = self.clean_text(h1.get_text())
-                        else:
-                            title_elem = detail_soup.find('title')
-                            if title_elem:
-                                title = title_elem.get_text(strip=True).replace(' - BIGO Ads', '')
-                        
-                        if not title:
-                            detail_page.close()
-                            continue
-                        
-                        # 获取日期 - 查找 YYYY-MM-DD 格式
-                        date_str = ""
-                        for elem in detail_soup.find_all(['span', 'time', 'div']):
-                            text = elem.get_text(strip=True)
-                            match = re.match(r'(\d{4})-(\d{2})-(\d{2})', text)
-                            if match:
-                                date_str = text
-                                break
-                        
-                        if not date_str:
-                            detail_page.close()
-                            continue
-                        
-                        print(f"        标题: {title[:50]}...")
-                        print(f"        日期: {date_str}", end="")
-                        
-                        # 检查日期窗口
-                        if not self.is_in_date_window(date_str, window_start, window_end):
-                            print(f" - 不在窗口")
-                            detail_page.close()
-                            continue
-                        
-                        print(f" ✅ 在窗口内")
-                        
-                        # 获取内容
-                        content = ""
-                        for selector in ['article', '.content', 'main', '.blog-content']:
-                            elem = detail_soup.select_one(selector)
-                            if elem:
-                                text = elem.get_text(separator=' ', strip=True)
-                                if len(text) > 200:
-                                    content = self.clean_text(text)
-                                    break
-                        
-                        if not content:
-                            for script in detail_soup(["script", "style", "nav", "header"]):
-                                script.decompose()
-                            body = detail_soup.find('body')
-                            if body:
-                                content = self.clean_text(body.get_text(separator=' ', strip=True))
-                        
-                        if content:
-                            items.append(ContentItem(
-                                title=title,
-                                summary=content[:600],
-                                date=date_str,
-                                url=detail_url,
-                                source="BIGO Ads"
-                            ))
-                            print(f"        ✓ 已添加")
-                        else:
-                            print(f"        ✗ 无法提取内容")
-                        
-                        detail_page.close()
-                        
+                        detail_html = self._load_detail_html(detail_url, "BIGO Ads")
+                        item = self._bigo_item(detail_html, detail_url, window_start, window_end)
+                        if item:
+                            items.append(item)
                     except Exception as e:
                         print(f"        ✗ 详情页错误: {e}")
-                        try:
-                            detail_page.close()
-                        except:
-                            pass
                         continue
                         
                 except Exception as e:
@@ -793,11 +700,89 @@ class StealthFetcher:
         except Exception as e:
             print(f"    ✗ BIGO Ads 错误: {e}")
         finally:
-            page.close()
+            self._close_page(page)
         
         print(f"\n    BIGO Ads: {len(items)} 条")
         return items
     
+    def _bigo_detail_links(self, html: str) -> List[str]:
+        """解析 BIGO Ads 博客列表，返回去重后的详情页链接"""
+        soup = make_soup(html)
+        
+        # 查找博客链接
+        blog_links = soup.find_all('a', href=re.compile('/resources/blog/\\d+'))
+        print(f"    找到 {len(blog_links)} 个博客链接")
+        
+        # 去重并只取前3个
+        seen_urls = set()
+        unique_links = []
+        for link in blog_links:
+            href = link.get('href', '')
+            if href and href not in seen_urls:
+                seen_urls.add(href)
+                unique_links.append(href)
+        
+        print(f"    去重后: {len(unique_links)} 个，检查前3个")
+        return unique_links
+    
+    def _bigo_item(self, detail_html: str, detail_url: str,
+                   window_start: datetime, window_end: datetime) -> Optional[ContentItem]:
+        """解析 BIGO Ads 详情页，不在窗口或无内容时返回 None"""
+        doc = Document(detail_html, detail_url)
+        detail_soup = doc.soup
+        
+        # 获取标题
+        title = ""
+        h1 = detail_soup.find('h1')
+        if h1:
+            title = self.clean_text(h1.get_text())
+        else:
+            title_elem = detail_soup.find('title')
+            if title_elem:
+                title = title_elem.get_text(strip=True).replace(' - BIGO Ads', '')
+        
+        if not title:
+            return None
+        
+        # 获取日期 - 查找以 YYYY-MM-DD 开头的文本节点（只扫描一遍文档，不逐个拼接元素文本）
+        date_str = ""
+        for text in detail_soup.find_all(string=ISO_DATE_PREFIX):
+            if text.parent.name in ('span', 'time', 'div'):
+                date_str = parse_iso_date(text)
+                if date_str:
+                    break
+        
+        if not date_str:
+            return None
+        
+        print(f"        标题: {title[:50]}...")
+        print(f"        日期: {date_str}", end="")
+        
+        # 检查日期窗口
+        if not self.is_in_date_window(date_str, window_start, window_end):
+            print(f" - 不在窗口")
+            self.crawl_state.remember(detail_url, date_str, title)
+            return None
+        
+        print(f" ✅ 在窗口内")
+        
+        # 获取内容
+        content = self._extract_body_text(doc, ['article', '.content', 'main', '.blog-content'])
+        self.crawl_state.remember(detail_url, date_str, title, content)
+        
+        if not content:
+            print(f"        ✗ 无法提取内容")
+            return None
+        
+        print(f"        ✓ 已添加")
+        return ContentItem(
+            title=title,
+            summary=content[:600],
+            date=date_str,
+            url=detail_url,
+            source="BIGO Ads"
+        )
+    
     def fetch_moloco(self, window_start: datetime, window_end: datetime) -> List[ContentItem]:
         """抓取 Moloco - 从 newsroom 页面获取 press-releases 链接
         日期在详情页 time 标签中，格式 "January 21, 2026"
@@ -809,34 +794,16 @@ class StealthFetcher:
         if not self._init_browser():
             return items
         
-        page = self.context.new_page()
+        page = self._new_page()
         processed_urls = set()
         
         try:
-            page.goto(url, wait_until="load", timeout=120000)
-            self._random_delay(5000, 8000)
-            
-            html = page.content()
-            soup = BeautifulSoup(html, 'html.parser')
+            self._goto_ready(page, url, "Moloco", wait_until="load", timeout=120000)
             
-            # 查找所有 press-releases 链接
-            all_links = soup.find_all('a', href=True)
-            press_links = [l for l in all_links if '/press-releases/' in l.get('href', '')]
+            unique_links = self._moloco_detail_links(page.content())
             
-            # 去重
-            seen_urls = set()
-            unique_links = []
-            for link in press_links:
-                href = link.get('href', '')
-                if href and href not in seen_urls:
-                    seen_urls.add(href)
-                    unique_links.append(link)
-            
-            print(f"    找到 {len(unique_links)} 个 press-releases 链接")
-            
-            for link in unique_links[:10]:
+            for href in unique_links[:10]:
                 try:
-                    href = link.get('href', '')
                     detail_url = urljoin(url, href)
                     
                     # 去重检查
@@ -844,109 +811,21 @@ class StealthFetcher:
                         continue
                     processed_urls.add(detail_url)
                     
-                    # 进入详情页获取标题和日期
-                    detail_page = self.context.new_page()
-                    try:
-                        detail_page.goto(detail_url, wait_until="domcontentloaded", timeout=30000)
-                        detail_page.wait_for_timeout(3000)
-                        
-                        detail_html = detail_page.content()
-                        detail_soup = BeautifulSoup(detail_html, 'html.parser')
-                        
-                        # 获取标题
-                        title = ""
-                        for selector in ['h1', 'h2', '.title', '[class*="title"]']:
-                            elem = detail_soup.select_one(selector)
-                            if elem:
-                                title = self.clean_text(elem.get_text())
-                                if len(title) > 10:
-                                    break
-                        
-                        if not title:
-                            detail_page.close()
-                            continue
-                        
-                        # 获取日期
-                        date_str = ""
-                        time_elem = detail_soup.find('time')
-                        if time_elem:
-                            datetime_attr = time_elem.get('datetime', '')
-                            time_text = time_elem.get_text(strip=True)
-                            
-                            # 尝试标准格式
-                            match = re.search(r'(\d{4})-(\d{2})-(\d{2})', datetime_attr)
-                            if match:
-                                date_str = f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
-                            else:
-                                # 尝试文本格式
-                                match = re.match(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})', time_text, re.IGNORECASE)
-                                if match:
-                                    months = {'january': '01', 'february': '02', 'march': '03', 'april': '04', 'may': '05', 'june': '06',
-                                             'july': '07', 'august': '08', 'september': '09', 'october': '10', 'november': '11', 'december': '12'}
-                                    month_num = months.get(match.group(1).lower(), '01')
-                                    date_str = f"{match.group(3)}-{month_num}-{match.group(2).zfill(2)}"
-                        
-                        # 备选：从 body 文本查找
-                        if not date_str:
-                            body_text = detail_soup.get_text()[:3000]
-                            match = re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})', body_text, re.IGNORECASE)
-                            if match:
-                                months = {'january': '01', 'february': '02', 'march': '03', 'april': '04', 'may': '05', 'june': '06',
-                                         'july': '07', 'august': '08', 'september': '09', 'october': '10', 'november': '11', 'december': '12'}
-                                month_num = months.get(match.group(1).lower(), '01')
-                                date_str = f"{match.group(3)}-{month_num}-{match.group(2).zfill(2)}"
-                        
-                        # 如果无法提取日期，使用当前日期
-                        if not date_str:
-                            date_str = datetime.now().strftime('%Y-%m-%d')
-                        
-                        print(f"    [{len(items)+1}] {title[:50]}... | 日期: {date_str}", end="")
-                        
-                        # 检查日期窗口
-                        if not self.is_in_date_window(date_str, window_start, window_end):
-                            print(f" - 不在窗口")
-                            detail_page.close()
-                            continue
-                        
-                        # 获取内容
-                        content = ""
-                        for selector in ['.content', 'article', '.post-content', '.press-content', 'main']:
-                            elem = detail_soup.select_one(selector)
-                            if elem:
-                                text = elem.get_text(separator=' ', strip=True)
-                                if len(text) > 200:
-                                    content = self.clean_text(text)
-                                    break
-                        
-                        if not content:
-                            # 备选
-                            for script in detail_soup(["script", "style", "nav", "header"]):
-                                script.decompose()
-                            body = detail_soup.find('body')
-                            if body:
-                                content = self.clean_text(body.get_text(separator=' ', strip=True))
-                        
-                        if content:
-                            items.append(ContentItem(
-                                title=title,
-                                summary=content[:600],
-                                date=date_str,
-                                url=detail_url,
-                                source="Moloco"
-                            ))
-                            print(f" ✓ 已添加")
-                        else:
-                            print(f" ✗ 无内容")
-                        
-                        detail_page.close()
-                        
-                    except Exception as e:
-                        print(f" ✗ 详情页错误: {e}")
+                    known, item = self._seen_item(detail_url, "Moloco", window_start, window_end)
+                    if not known:
+                        # 进入详情页获取标题和日期
                         try:
-                            detail_page.close()
-                        except:
-                            pass
-                        continue
+                            detail_html = self._load_detail_html(detail_url, "Moloco")
+                            item = self._moloco_item(detail_html, detail_url, len(items), window_start, window_end)
+                        except Exception as e:
+                            print(f" ✗ 详情页错误: {e}")
+                            continue
+                    if item:
+                        items.append(item)
+                    
+                    # 列表按日期倒序：详情页日期（已记入抓取状态）早于窗口起点后不再继续
+                    if passed_window("Moloco", self.crawl_state.known_date(detail_url), window_start):
+                        break
                         
                 except Exception as e:
                     continue
@@ -954,11 +833,94 @@ class StealthFetcher:
         except Exception as e:
             print(f"    ✗ Moloco 错误: {e}")
         finally:
-            page.close()
+            self._close_page(page)
         
         print(f"    Moloco: {len(items)} 条")
         return items
     
+    def _moloco_detail_links(self, html: str) -> List[str]:
+        """解析 Moloco newsroom，返回去重后的 press-releases 链接"""
+        soup = make_soup(html)
+        
+        # 查找所有 press-releases 链接
+        all_links = soup.find_all('a', href=True)
+        press_links = [l for l in all_links if '/press-releases/' in l.get('href', '')]
+        
+        # 去重
+        seen_urls = set()
+        unique_links = []
+        for link in press_links:
+            href = link.get('href', '')
+            if href and href not in seen_urls:
+                seen_urls.add(href)
+                unique_links.append(href)
+        
+        print(f"    找到 {len(unique_links)} 个 press-releases 链接")
+        return unique_links
+    
+    def _moloco_item(self, detail_html: str, detail_url: str, index: int,
+                     window_start: datetime, window_end: datetime) -> Optional[ContentItem]:
+        """解析 Moloco 详情页，不在窗口或无内容时返回 None"""
+        doc = Document(detail_html, detail_url)
+        detail_soup = doc.soup
+        
+        # 获取标题
+        title = ""
+        for selector in ['h1', 'h2', '.title', '[class*="title"]']:
+            elem = detail_soup.select_one(selector)
+            if elem:
+                title = self.clean_text(elem.get_text())
+                if len(title) > 10:
+                    break
+        
+        if not title:
+            return None
+        
+        # 获取日期
+        date_str = ""
+        time_elem = detail_soup.find('time')
+        if time_elem:
+            datetime_attr = time_elem.get('datetime', '')
+            time_text = time_elem.get_text(strip=True)
+            
+            # 尝试标准格式，再尝试文本格式
+            date_str = parse_iso_date(datetime_attr) or parse_named_month_date(time_text) or ""
+        
+        # 备选：从 body 文本查找
+        if not date_str:
+            date_str = parse_named_month_date(doc.text(budget=3000, skip=())) or ""
+        
+        # 如果无法提取日期，使用当前日期（不写入抓取状态）
+        page_date = date_str
+        if not date_str:
+            date_str = datetime.now().strftime('%Y-%m-%d')
+        
+        print(f"    [{index+1}] {title[:50]}... | 日期: {date_str}", end="")
+        
+        # 检查日期窗口
+        if not self.is_in_date_window(date_str, window_start, window_end):
+            print(f" - 不在窗口")
+            self.crawl_state.remember(detail_url, page_date, title)
+            return None
+        
+        # 获取内容
+        content = self._extract_body_text(doc, ['.content', 'article', '.post-content', '.press-content', 'main'])
+        if page_date:
+            self.crawl_state.remember(detail_url, page_date, title, content)
+        
+        if not content:
+            print(f" ✗ 无内容")
+            return None
+        
+        print(f" ✓ 已添加")
+        return ContentItem(
+            title=title,
+            summary=content[:600],
+            date=date_str,
+            url=detail_url,
+            source="Moloco"
+        )
+    
     def fetch_mobvista(self, window_start: datetime, window_end: datetime) -> List[ContentItem]:
         """抓取 Mobvista - 投资者关系页面
         日期在 announce-item-time 类中，格式 "February 6, 2026"
@@ -971,14 +933,13 @@ class StealthFetcher:
         if not self._init_browser():
             return items
         
-        page = self.context.new_page()
+        page = self._new_page()
         
         try:
-            page.goto(url, wait_until="load", timeout=120000)
-            self._random_delay(5000, 8000)
+            self._goto_ready(page, url, "mobvista", wait_until="load", timeout=120000)
             
             html = page.content()
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = make_soup(html)
             
             # 查找公告项
             announce_items = soup.select('.announce-item')
@@ -997,15 +958,10 @@ class StealthFetcher:
                     date_text = time_elem.get_text(strip=True) if time_elem else ""
                     
                     # 解析日期 "February 6, 2026" -> "2026-02-06"
-                    match = re.match(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})', date_text, re.IGNORECASE)
-                    if not match:
+                    date_str = parse_named_month_date(date_text)
+                    if not date_str:
                         continue
                     
-                    months = {'january': '01', 'february': '02', 'march': '03', 'april': '04', 'may': '05', 'june': '06',
-                             'july': '07', 'august': '08', 'september': '09', 'october': '10', 'november': '11', 'december': '12'}
-                    month_num = months.get(match.group(1).lower(), '01')
-                    date_str = f"{match.group(3)}-{month_num}-{match.group(2).zfill(2)}"
-                    
                     # 获取链接
                     link_elem = item.find('a', href=True)
                     detail_url = link_elem.get('href', '') if link_elem else ""
@@ -1047,7 +1003,7 @@ class StealthFetcher:
         except Exception as e:
             print(f"    ✗ Mobvista 错误: {e}")
         finally:
-            page.close()
+            self._close_page(page)
         
         print(f"    Mobvista: {len(items)} 条")
         return items
@@ -1194,12 +1150,11 @@ class StealthFetcher:
         
         try:
             from urllib.parse import quote_plus
-            import requests
             
             url = f"https://news.google.com/rss/search?q={quote_plus(query)}&hl=en&gl=US&ceid=US:en"
             print(f"    使用 Google News RSS...")
             
-            resp = requests.get(url, timeout=30, headers={
+            resp = self.transport.get(url, timeout=30, headers={
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             })
             resp.raise_for_status()
@@ -1220,18 +1175,7 @@ class StealthFetcher:
                         continue
                     
                     # 解析日期
-                    date_str = None
-                    if pub_date:
-                        try:
-                            dt = datetime.strptime(pub_date, '%a, %d %b %Y %H:%M:%S %Z')
-                            date_str = dt.strftime('%Y-%m-%d')
-                        except:
-                            # 尝试其他格式
-                            date_match = re.search(r'(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{4})', pub_date)
-                            if date_match:
-                                months = {'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04', 'may': '05', 'jun': '06',
-                                         'jul': '07', 'aug': '08', 'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'}
-                                date_str = f"{date_match.group(3)}-{months.get(date_match.group(2).lower(), '01')}-{date_match.group(1).zfill(2)}"
+                    date_str = parse_rss_date(pub_date)
                     
                     if not date_str:
                         date_str = window_end.strftime('%Y-%m-%d')
@@ -1296,11 +1240,11 @@ class StealthFetcher:
         items = []
         url = "https://investor.magnite.com/press-releases"
         
-        html = self.fetch_page(url, timeout=60000)
+        html = self.fetch_page(url, timeout=60000, source="Magnite")
         if not html:
             return items
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         
         # 查找新闻链接
         news_links = soup.find_all('a', href=re.compile(r'/press-releases/'))
@@ -1332,6 +1276,10 @@ class StealthFetcher:
                 if not date_str:
                     date_str = datetime.now().strftime('%Y-%m-%d')
                 
+                # 列表按日期倒序：早于窗口起点后不再继续
+                if passed_window("Magnite", date_str, window_start):
+                    break
+                
                 if not self.is_in_date_window(date_str, window_start, window_end):
                     continue
                 
@@ -1342,7 +1290,8 @@ class StealthFetcher:
                 # 尝试从详情页获取内容（更准确）
                 content, detail_date = self._fetch_detail_content(
                     detail_url,
-                    ['.press-release', '.entry-content', 'article', '.content', 'main']
+                    ['.press-release', '.entry-content', 'article', '.content', 'main'],
+                    "Magnite"
                 )
                 
                 # 如果详情页获取到日期，验证是否在窗口内
@@ -1385,128 +1334,130 @@ class StealthFetcher:
         if not self._init_browser():
             return items
         
-        page = self.context.new_page()
-        processed_urls = set()
+        page = self._new_page()
         
         try:
-            page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            self._random_delay(5000, 7000)
-            
-            html = page.content()
-            soup = BeautifulSoup(html, 'html.parser')
+            self._goto_ready(page, url, "Taboola", timeout=60000)
             
-            # 查找文章链接
-            articles = soup.find_all('article')
-            if not articles:
-                articles = soup.select('.post, .entry, .blog-post')
-            print(f"    找到 {len(articles)} 篇文章")
-            
-            for article in articles[:15]:
+            for detail_url, title in self._taboola_candidates(page.content(), url):
+                known, item = self._seen_item(detail_url, "Taboola", window_start, window_end)
+                if known:
+                    if item:
+                        items.append(item)
+                    continue
+                
+                # 进入详情页获取日期
                 try:
-                    link = article.find('a', href=True)
-                    if not link:
-                        continue
-                    
-                    detail_url = urljoin(url, link['href'])
-                    if not '/press-releases/' in detail_url:
-                        continue
-                    
-                    # 去重
-                    if detail_url in processed_urls:
-                        continue
-                    processed_urls.add(detail_url)
-                    
-                    title = self.clean_text(link.get_text())
-                    if not title or len(title) < 10:
-                        continue
-                    
-                    # 进入详情页获取日期
-                    detail_page = self.context.new_page()
-                    try:
-                        detail_page.goto(detail_url, wait_until="domcontentloaded", timeout=30000)
-                        self._random_delay(2000, 4000)
-                        
-                        detail_html = detail_page.content()
-                        detail_soup = BeautifulSoup(detail_html, 'html.parser')
-                        
-                        # 提取日期 - Taboola 使用非标准格式
-                        date_str = None
-                        time_elem = detail_soup.find('time')
-                        
-                        if time_elem:
-                            datetime_attr = time_elem.get('datetime', '')
-                            time_text = time_elem.get_text(strip=True)
-                            
-                            # 尝试标准格式
-                            match = re.search(r'(\d{4})-(\d{2})-(\d{2})', datetime_attr)
-                            if match:
-                                date_str = f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
-                            # 尝试非标准格式 "2026-Feb-Thu"
-                            elif re.match(r'\d{4}-[A-Za-z]{3}-[A-Za-z]{3}', datetime_attr):
-                                match = re.match(r'(\d{4})-([A-Za-z]{3})', datetime_attr)
-                                if match:
-                                    months = {'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04', 'may': '05', 'jun': '06',
-                                             'jul': '07', 'aug': '08', 'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'}
-                                    month_num = months.get(match.group(2).lower(), '01')
-                                    day_match = re.search(r'(\d{1,2})', time_text)
-                                    if day_match:
-                                        date_str = f"{match.group(1)}-{month_num}-{day_match.group(1).zfill(2)}"
-                            # 尝试文本格式 "Feb 05 2026"
-                            elif not date_str:
-                                match = re.match(r'([A-Za-z]{3})\s+(\d{1,2})\s+(\d{4})', time_text, re.IGNORECASE)
-                                if match:
-                                    months = {'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04', 'may': '05', 'jun': '06',
-                                             'jul': '07', 'aug': '08', 'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'}
-                                    date_str = f"{match.group(3)}-{months.get(match.group(1).lower(), '01')}-{match.group(2).zfill(2)}"
-                        
-                        if not date_str:
-                            detail_page.close()
-                            continue
-                        
-                        if not self.is_in_date_window(date_str, window_start, window_end):
-                            detail_page.close()
-                            continue
-                        
-                        # 获取内容
-                        content = ""
-                        for selector in ['article', '.content', '.main-content', 'main', '.post-content', '.entry-content']:
-                            elem = detail_soup.select_one(selector)
-                            if elem:
-                                text = elem.get_text(separator=' ', strip=True)
-                                if len(text) > 200:
-                                    content = self.clean_text(text)
-                                    break
-                        
-                        if content:
-                            items.append(ContentItem(
-                                title=title,
-                                summary=content[:600],
-                                date=date_str,
-                                url=detail_url,
-                                source="Taboola"
-                            ))
-                            print(f"    ✓ {title[:40]}... ({date_str})")
-                        
-                        detail_page.close()
-                        
-                    except Exception as e:
-                        try:
-                            detail_page.close()
-                        except:
-                            pass
-                        continue
-                        
+                    detail_html = self._load_detail_html(detail_url, "Taboola")
+                    item = self._taboola_item(detail_html, detail_url, title, window_start, window_end)
+                    if item:
+                        items.append(item)
                 except Exception as e:
                     continue
                     
         except Exception as e:
             print(f"    ✗ Taboola 错误: {e}")
         finally:
-            page.close()
+            self._close_page(page)
         
         print(f"    Taboola: {len(items)} 条")
         return items
     
+    def _taboola_candidates(self, html: str, url: str) -> List[tuple]:
+        """
+        解析 Taboola 列表页
+        :return: [(detail_url, title), ...]
+        """
+        soup = make_soup(html)
+        
+        # 查找文章链接
+        articles = soup.find_all('article')
+        if not articles:
+            articles = soup.select('.post, .entry, .blog-post')
+        print(f"    找到 {len(articles)} 篇文章")
+        
+        candidates = []
+        processed_urls = set()
+        
+        for article in articles[:15]:
+            try:
+                link = article.find('a', href=True)
+                if not link:
+                    continue
+                
+                detail_url = urljoin(url, link['href'])
+                if not '/press-releases/' in detail_url:
+                    continue
+                
+                # 去重
+                if detail_url in processed_urls:
+                    continue
+                processed_urls.add(detail_url)
+                
+                title = self.clean_text(link.get_text())
+                if not title or len(title) < 10:
+                    continue
+                
+                candidates.append((detail_url, title))
+                
+            except Exception as e:
+                continue
+        
+        return candidates
+    
+    def _taboola_item(self, detail_html: str, detail_url: str, title: str,
+                      window_start: datetime, window_end: datetime) -> Optional[ContentItem]:
+        """解析 Taboola 详情页，不在窗口或无内容时返回 None"""
+        doc = Document(detail_html, detail_url)
+        detail_soup = doc.soup
+        
+        # 提取日期 - Taboola 使用非标准格式
+        date_str = None
+        time_elem = detail_soup.find('time')
+        
+        if time_elem:
+            datetime_attr = time_elem.get('datetime', '')
+            time_text = time_elem.get_text(strip=True)
+            
+            # 尝试标准格式
+            date_str = parse_iso_date(datetime_attr)
+            # 尝试非标准格式 "2026-Feb-Thu"（日在文本中）
+            if not date_str:
+                match = YEAR_MONTH_WEEKDAY.match(datetime_attr)
+                day_match = DAY_NUMBER.search(time_text) if match else None
+                if day_match:
+                    date_str = format_ymd(match.group(1), month_number(match.group(2)), day_match.group(1))
+            # 尝试文本格式 "Feb 05 2026"
+            if not date_str:
+                date_str = parse_named_month_date(time_text)
+        
+        if not date_str:
+            return None
+        
+        if not self.is_in_date_window(date_str, window_start, window_end):
+            self.crawl_state.remember(detail_url, date_str, title)
+            return None
+        
+        # 获取内容
+        content = self._extract_body_text(
+            doc,
+            ['article', '.content', '.main-content', 'main', '.post-content', '.entry-content'],
+            body_fallback=False
+        )
+        self.crawl_state.remember(detail_url, date_str, title, content)
+        
+        if not content:
+            return None
+        
+        print(f"    ✓ {title[:40]}... ({date_str})")
+        return ContentItem(
+            title=title,
+            summary=content[:600],
+            date=date_str,
+            url=detail_url,
+            source="Taboola"
+        )
+    
     def fetch_ttd(self, window_start: datetime, window_end: datetime) -> List[ContentItem]:
         """抓取 TTD - 使用官网标题 + Google 搜索找全文"""
         print("  [Stealth] 抓取 TTD...")
@@ -1514,11 +1465,11 @@ class StealthFetcher:
         items = []
         url = "https://www.thetradedesk.com/press-room"
         
-        html = self.fetch_page(url, timeout=60000)
+        html = self.fetch_page(url, timeout=60000, source="TTD")
         if not html:
             return items
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         
         # 查找新闻链接
         news_links = soup.find_all('a', href=re.compile(r'/press-room/'))
@@ -1553,6 +1504,10 @@ class StealthFetcher:
                 else:
                     date_str = datetime.now().strftime('%Y-%m-%d')
                 
+                # 列表按日期倒序：早于窗口起点后不再继续
+                if passed_window("TTD", date_str, window_start):
+                    break
+                
                 if not self.is_in_date_window(date_str, window_start, window_end):
                     continue
                 
@@ -1563,7 +1518,8 @@ class StealthFetcher:
                 # 尝试从详情页获取内容（更准确）
                 content, detail_date = self._fetch_detail_content(
                     detail_url,
-                    ['.press-release', '.entry-content', 'article', '.content', 'main']
+                    ['.press-release', '.entry-content', 'article', '.content', 'main'],
+                    "TTD"
                 )
                 
                 # 如果详情页获取到日期，验证是否在窗口内
@@ -1597,77 +1553,65 @@ class StealthFetcher:
         print(f"    TTD: {len(items)} 条")
         return items
     
-    def _fetch_detail_content(self, url: str, selectors: list = None) -> tuple:
+    def _fetch_detail_content(self, url: str, selectors: list = None, source: str = None) -> tuple:
         """
         获取详情页内容和日期
         :param url: 详情页URL
         :param selectors: 内容选择器列表（按优先级）
+        :param source: 公司 key，用于读取详情页就绪条件
         :return: (content, date_str) 元组
         """
-        if not selectors:
-            selectors = ['.entry-content', '.post-content', '.article-content', 'article', '.content', 'main']
+        # 以前打开过的详情页直接使用记录的正文和日期
+        entry = self.crawl_state.get(url)
+        if entry and entry.get("summary"):
+            return entry["summary"], entry.get("date", "")
         
         try:
-            html = self.fetch_page(url, timeout=30000)
+            html = self.fetch_page(url, timeout=30000, source=source, detail=True)
             if not html:
                 return "", ""
-            
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # 提取日期 - 多种方法
-            date_str = ""
-            
-            # 方法1: time标签的 datetime 属性
-            time_tag = soup.find('time')
-            if time_tag:
-                datetime_attr = time_tag.get('datetime', '')
-                if datetime_attr:
-                    # 尝试提取 YYYY-MM-DD 格式
-                    match = re.search(r'(\d{4})-(\d{2})-(\d{2})', datetime_attr)
-                    if match:
-                        year, month, day = match.group(1), match.group(2), match.group(3)
-                        # 验证日期有效性
-                        if int(month) <= 12 and int(day) <= 31:
-                            date_str = f"{year}-{month}-{day}"
-            
-            # 方法2: time标签的文本内容
-            if not date_str and time_tag:
-                time_text = time_tag.get_text(strip=True)
-                parsed = self.parse_date(time_text)
-                if parsed:
-                    date_str = parsed
-            
-            # 方法3: 查找任何包含日期的元素
-            if not date_str:
-                for elem in soup.find_all(['span', 'div', 'p'], class_=re.compile('date|time|published', re.I)):
-                    text = elem.get_text(strip=True)
-                    parsed = self.parse_date(text)
-                    if parsed:
-                        date_str = parsed
-                        break
-            
-            # 方法4: 从URL提取日期
-            if not date_str:
-                date_str = self._extract_date_from_url(url)
-            
-            # 提取内容
-            content = ""
-            for selector in selectors:
-                elem = soup.select_one(selector)
-                if elem:
-                    # 移除脚本和样式
-                    for script in elem.find_all(['script', 'style']):
-                        script.decompose()
-                    text = elem.get_text(separator=' ', strip=True)
-                    if len(text) > 100:
-                        content = self.clean_text(text)
-                        break
-            
+            content, date_str = self._parse_detail_content(html, url, selectors)
+            self.crawl_state.remember(url, date_str, None, content)
             return content, date_str
-            
         except Exception as e:
             return "", ""
     
+    def _parse_detail_content(self, html: str, url: str, selectors: list = None) -> tuple:
+        """
+        解析详情页内容和日期
+        :param html: 详情页 HTML
+        :param url: 详情页URL（用于兜底提取日期）
+        :param selectors: 内容选择器列表（按优先级）
+        :return: (content, date_str) 元组
+        """
+        if not selectors:
+            selectors = ['.entry-content', '.post-content', '.article-content', 'article', '.content', 'main']
+        
+        # 日期：time 标签 → 日期类元素 → URL；正文取第一个超过 100 字符的选择器
+        doc = Document(html, url)
+        content = doc.content(selectors, min_length=100, strip=('script', 'style'))
+        return content, doc.date
+    
+    def _load_detail_html(self, url: str, source: str) -> str:
+        """打开详情页，等待就绪后返回 HTML"""
+        detail_page = self._new_page()
+        try:
+            self._goto_ready(detail_page, url, source, detail=True, timeout=30000)
+            return detail_page.content()
+        finally:
+            self._close_page(detail_page)
+    
+    def _extract_body_text(self, doc: Document, selectors: list, body_fallback: bool = True) -> str:
+        """
+        按选择器优先级提取正文（长度需超过 200 字符）
+        :param doc: 详情页 Document
+        :param selectors: 内容选择器列表
+        :param body_fallback: 未命中时是否退回到 body 文本
+        :return: 正文文本
+        """
+        return doc.content(selectors, min_length=200, strip=('script', 'style', 'nav', 'header'),
+                           body_fallback=body_fallback)
+    
     def _is_not_main_subject(self, title: str, company: str) -> bool:
         """检查新闻是否不是关于公司本身的主体新闻"""
         title_lower = title.lower()
@@ -1691,21 +1635,8 @@ class StealthFetcher:
         return False
     
     def _extract_date_from_url(self, url: str) -> str:
-        """从URL提取日期 - 支持多种格式"""
-        # 标准格式: /YYYY/MM/DD/ 或 /YYYY/DD/MM/
-        match = re.search(r'/(\d{4})/(\d{2})/(\d{2})/', url)
-        if match:
-            year, part2, part3 = match.group(1), match.group(2), match.group(3)
-            # 判断是 MM/DD 还是 DD/MM
-            # 如果 part2 > 12，则 part2 是日，part3 是月
-            # 否则假设是标准的 YYYY/MM/DD
-            if int(part2) > 12:
-                # 格式是 YYYY/DD/MM
-                return f"{year}-{part3}-{part2}"
-            else:
-                # 格式是 YYYY/MM/DD（标准）
-                return f"{year}-{part2}-{part3}"
-        return ""
+        """从URL提取日期（/YYYY/MM/DD/，第二段大于 12 时按 /YYYY/DD/MM/）"""
+        return parse_url_date(url) or ""
     
     def _extract_date_from_element(self, elem) -> str:
         """从元素中提取日期"""
@@ -1714,9 +1645,9 @@ class StealthFetcher:
         if time_tag:
             datetime_attr = time_tag.get('datetime', '')
             if datetime_attr:
-                match = re.search(r'(\d{4})-(\d{2})-(\d{2})', datetime_attr)
-                if match:
-                    return match.group(0)
+                date_str = parse_iso_date(datetime_attr)
+                if date_str:
+                    return date_str
         
         # 查找日期类
         date_elem = elem.find(class_=re.compile('date|time'))
@@ -1730,11 +1661,11 @@ class StealthFetcher:
         url = COMPETITOR_SOURCES[company_key]["url"]
         print(f"  [Stealth] 通用抓取 {company_key}...")
         
-        html = self.fetch_page(url, timeout=60000)
+        html = self.fetch_page(url, timeout=60000, source=company_key)
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         items = []
         
         # 尝试多种选择器
@@ -1757,7 +1688,7 @@ class StealthFetcher:
                         if date_match:
                             date_str = f"{date_match.group(1)}-{date_match.group(2)}-{date_match.group(3)}"
                             if self.is_in_date_window(date_str, window_start, window_end):
-                                content = self._fetch_detail(detail_url)
+                                content = self._fetch_detail(detail_url, company_key)
                                 if content:
                                     items.append(ContentItem(
                                         title=title, summary=content[:600], date=date_str,
@@ -0,0 +1,66 @@
+"""
+抓取层结果记录 - 按公司保存上次成功的抓取层、时间和耗时
+
+HybridCompetitorFetcher 据此让每家公司直接从历史上成功的层开始抓取，
+并每隔 CACHE_CONFIG["tier_reprobe_every"] 次运行从 HTTP 层重新探测一次。
+"""
+
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from .state_file import JsonStateFile
+
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+from config.settings import CACHE_CONFIG
+
+
+class TierOutcomeStore:
+    """
+    持久化的抓取层结果，结构：
+    {company_key: {"tier": "stealth", "at": "2026-02-09T10:00:00", "elapsed": 12.3, "runs_since_probe": 1}}
+    """
+
+    def __init__(self, state_file: JsonStateFile = None, reprobe_every: int = None):
+        self.state_file = state_file or JsonStateFile(CACHE_CONFIG["tier_outcomes_file"])
+        self.reprobe_every = reprobe_every or CACHE_CONFIG["tier_reprobe_every"]
+        self.outcomes: Dict[str, Dict] = self.state_file.load()
+        self._lock = threading.Lock()
+
+    def start_tier(self, key: str) -> str:
+        """
+        本次运行该公司的起始层
+        :return: 历史成功层；无记录或到达重新探测周期时返回 "http"
+        """
+        outcome = self.outcomes.get(key)
+        if not outcome or outcome.get("tier", "http") == "http":
+            return "http"
+        if outcome.get("runs_since_probe", 0) + 1 >= self.reprobe_every:
+            return "http"
+        return outcome["tier"]
+
+    def record(self, key: str, tier: Optional[str], elapsed: float, probed: bool):
+        """
+        记录本次结果
+        :param tier: 成功的层，None 表示所有层都未抓到内容（不改变历史成功层）
+        :param elapsed: 成功层本次抓取耗时（秒）
+        :param probed: 本次是否从 HTTP 层开始
+        """
+        with self._lock:
+            outcome = dict(self.outcomes.get(key, {}))
+            outcome["runs_since_probe"] = 0 if probed else outcome.get("runs_since_probe", 0) + 1
+            if tier:
+                outcome.update({
+                    "tier": tier,
+                    "at": datetime.now().isoformat(timespec="seconds"),
+                    "elapsed": round(elapsed, 1),
+                })
+            self.outcomes[key] = outcome
+
+    def save(self):
+        with self._lock:
+            snapshot = dict(self.outcomes)
+        self.state_file.save(snapshot)
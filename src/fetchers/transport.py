@@ -0,0 +1,147 @@
+"""
+HTTP 传输层 - BaseFetcher / StealthFetcher / Validator 共用的连接池
+
+默认使用 requests（urllib3 连接池，可按主机设置连接数），
+配置 backend="httpx" 时使用 httpx（可选 HTTP/2，需要安装 httpx[http2]）。
+进程内共享一个实例，同一主机的 TLS 连接在各抓取器之间复用。
+"""
+
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+from config.settings import SCRAPER_CONFIG, TRANSPORT_CONFIG
+
+
+def default_headers() -> Dict[str, str]:
+    return {
+        "User-Agent": SCRAPER_CONFIG["user_agent"],
+        **SCRAPER_CONFIG["headers"],
+    }
+
+
+class Transport:
+    """传输层接口，返回的响应需提供 status_code / text / content / headers / raise_for_status()"""
+
+    name = "base"
+
+    def request(self, method: str, url: str, **kwargs):
+        raise NotImplementedError
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs):
+        return self.request("HEAD", url, **kwargs)
+
+    def close(self):
+        pass
+
+
+class RequestsTransport(Transport):
+    """基于 requests.Session 的传输层，支持按主机设置连接池大小"""
+
+    name = "requests"
+
+    def __init__(self, config: Dict = None):
+        config = config or TRANSPORT_CONFIG
+        self.session = requests.Session()
+        self.session.headers.update(default_headers())
+        if not config["keep_alive"]:
+            self.session.headers["Connection"] = "close"
+
+        # 重试由调用方控制，适配器本身不重试
+        adapter = HTTPAdapter(
+            pool_connections=config["pool_connections"],
+            pool_maxsize=config["pool_maxsize"],
+            max_retries=0,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        for host, size in config["host_pool_sizes"].items():
+            host_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size, max_retries=0)
+            self.session.mount(f"https://{host}/", host_adapter)
+            self.session.mount(f"http://{host}/", host_adapter)
+
+    def request(self, method: str, url: str, **kwargs):
+        return self.session.request(method, url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+class HttpxTransport(Transport):
+    """基于 httpx.Client 的传输层，可启用 HTTP/2（httpx 不支持按主机设置连接数）"""
+
+    name = "httpx"
+
+    def __init__(self, config: Dict = None):
+        import httpx
+
+        config = config or TRANSPORT_CONFIG
+        headers = default_headers()
+        if not config["keep_alive"]:
+            headers["Connection"] = "close"
+
+        limits = httpx.Limits(
+            max_connections=config["pool_connections"] * config["pool_maxsize"],
+            max_keepalive_connections=config["pool_maxsize"] if config["keep_alive"] else 0,
+        )
+        try:
+            self.client = httpx.Client(http2=config["http2"], limits=limits, headers=headers, follow_redirects=True)
+        except ImportError:
+            print("  [!] 未安装 h2，HTTP/2 不可用，使用 HTTP/1.1")
+            self.client = httpx.Client(limits=limits, headers=headers, follow_redirects=True)
+
+    def request(self, method: str, url: str, **kwargs):
+        # 兼容 requests 风格参数
+        if "allow_redirects" in kwargs:
+            kwargs["follow_redirects"] = kwargs.pop("allow_redirects")
+        stream = kwargs.pop("stream", False)
+        if stream:
+            timeout = kwargs.pop("timeout", None)
+            follow_redirects = kwargs.pop("follow_redirects", True)
+            req = self.client.build_request(method, url, timeout=timeout, **kwargs)
+            return self.client.send(req, stream=True, follow_redirects=follow_redirects)
+        return self.client.request(method, url, **kwargs)
+
+    def close(self):
+        self.client.close()
+
+
+def create_transport(config: Dict = None) -> Transport:
+    """按配置创建传输层，httpx 不可用时退回 requests"""
+    config = config or TRANSPORT_CONFIG
+    if config["backend"] == "httpx":
+        try:
+            return HttpxTransport(config)
+        except ImportError:
+            print("  [!] 未安装 httpx，使用 requests 传输层")
+    return RequestsTransport(config)
+
+
+_transport: Optional[Transport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> Transport:
+    """获取进程级共享传输层"""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = create_transport()
+        return _transport
+
+
+def set_transport(transport: Transport):
+    """替换共享传输层（之后创建的抓取器生效）"""
+    global _transport
+    with _transport_lock:
+        _transport = transport
@@ -0,0 +1,83 @@
+"""
+链接状态缓存 - 跨运行保存 Validator 的链接检查结果
+
+已发布的新闻稿链接一周内几乎不会失效：可用的链接在 TTL 内直接复用结果；
+404 / 410 作为确定失效单独缓存（较短 TTL）；超时、5xx 等临时失败不缓存，下次重新检查。
+"""
+
+import atexit
+import threading
+import time
+from typing import Dict, Optional
+
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+from fetchers.crawl_state import canonical_url
+from fetchers.state_file import JsonStateFile
+from config.settings import VALIDATION_CONFIG
+
+# 确定失效的状态码（可以缓存）
+DEAD_STATUS = {404, 410}
+
+
+class LinkStatusCache:
+    """
+    结构：{canonical_url: {"ok": bool, "status": int 或 None, "checked_at": float}}
+    """
+
+    def __init__(self, state_file: JsonStateFile = None, ok_ttl_hours: float = None, dead_ttl_hours: float = None):
+        self.state_file = state_file or JsonStateFile(VALIDATION_CONFIG["status_cache_file"])
+        self.ok_ttl = (ok_ttl_hours or VALIDATION_CONFIG["ok_ttl_hours"]) * 3600
+        self.dead_ttl = (dead_ttl_hours or VALIDATION_CONFIG["dead_ttl_hours"]) * 3600
+        self.entries: Dict[str, Dict] = self.state_file.load()
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    def get(self, url: str) -> Optional[bool]:
+        """TTL 内的缓存结果（True 可用 / False 确定失效），没有或已过期时返回 None"""
+        with self._lock:
+            entry = self.entries.get(canonical_url(url))
+        if not entry:
+            return None
+        ttl = self.ok_ttl if entry["ok"] else self.dead_ttl
+        if time.time() - entry["checked_at"] > ttl:
+            return None
+        return entry["ok"]
+
+    def record(self, url: str, ok: bool, status: Optional[int] = None):
+        """记录检查结果；失败且不是确定失效（404 / 410）时不缓存"""
+        if not ok and status not in DEAD_STATUS:
+            return
+        with self._lock:
+            self.entries[canonical_url(url)] = {"ok": ok, "status": status, "checked_at": time.time()}
+            self._dirty = True
+
+    def save(self):
+        """保存并清理过期记录"""
+        with self._lock:
+            if not self._dirty:
+                return
+            now = time.time()
+            self.entries = {
+                k: v for k, v in self.entries.items()
+                if now - v["checked_at"] <= (self.ok_ttl if v["ok"] else self.dead_ttl)
+            }
+            snapshot = dict(self.entries)
+            self._dirty = False
+        self.state_file.save(snapshot)
+
+
+_cache: Optional[LinkStatusCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_link_status_cache() -> LinkStatusCache:
+    """获取进程级共享链接状态缓存，进程退出时自动保存"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = LinkStatusCache()
+            atexit.register(_cache.save)
+        return _cache
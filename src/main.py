@@ -103,17 +103,13 @@ def main(run_date: datetime = None, test_mode: bool = False, dry_run: bool = Fal
     # 5. 生成摘要
     print("\n[4/6] 生成中文摘要...")
     
-    # 竞品资讯摘要
-    for company, items in competitor_items.items():
-        if items:
-            print(f"  处理 {company} ({len(items)} 条)...")
-            competitor_items[company] = summarizer.summarize_batch(items)
-    
-    # 行业资讯摘要
-    for module, items in industry_items.items():
-        if items:
-            print(f"  处理 {module} ({len(items)} 条)...")
-            industry_items[module] = summarizer.summarize_batch(items)
+    # 竞品和行业条目一起提交，共享并发名额和限速（summarize_batch 原地更新条目）
+    all_items = [item for items in competitor_items.values() for item in items]
+    all_items += [item for items in industry_items.values() for item in items]
+    print(f"  共 {len(all_items)} 条，并发数 {summarizer.concurrency}")
+    summarizer.summarize_batch(all_items)
+    # 长度不符合要求的摘要先修复，避免验证失败后整轮重跑
+    summarizer.repair_summaries(all_items)
     
     print("  摘要生成完成")
     
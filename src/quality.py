@@ -0,0 +1,132 @@
+"""
+摘要质量评分 - 检查摘要是否包含关键指标或关键事实
+
+数字模式合并为一个预编译正则；关键词编译为 Aho-Corasick 自动机（摘要先转小写），
+一次扫描得到全部命中，耗时只与摘要长度有关，与关键词数量无关。
+评分结果列出命中的数字和关键词，可用于调整关键词表。
+"""
+
+import re
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Tuple
+
+# 数字模式（金额、百分比、年份、小数、普通数字），按优先级排列
+NUMBER_PATTERN = re.compile(
+    r"(?P<money>[$€£]\s?\d[\d,]*(?:\.\d+)?)"
+    r"|(?P<percent>\d+(?:\.\d+)?\s?%)"
+    r"|(?P<year>(?<!\d)20\d{2}(?!\d))"
+    r"|(?P<decimal>\d+\.\d+)"
+    r"|(?P<number>\d+)"
+)
+
+# 只判断是否含数字时使用（NUMBER_PATTERN 的每个分支都包含数字）
+DIGIT = re.compile(r"\d")
+
+# 关键事实关键词
+FACT_KEYWORDS = (
+    '营收', '收入', '增长', '下降', '同比', '环比', '合作', '发布', '推出',
+    '收购', '并购', '融资', '投资', '用户', '客户', '市场', '份额',
+    'revenue', 'growth', 'decline', 'partnership', 'launch', 'acquire',
+    'merger', 'funding', 'investment', 'users', 'customers', 'market',
+    'million', 'billion', 'percent', '%', '$', '€', '£',
+    '亿', '万', '千', '百', '百万', '千万', '十亿',
+    '产品', '功能', '平台', '技术', '解决方案', '服务',
+    'product', 'feature', 'platform', 'technology', 'solution', 'service',
+    '第一', '第二', '第三', '首', '新', '最新',
+)
+
+
+@dataclass
+class QualityResult:
+    """评分结果"""
+    numbers: List[Tuple[str, str]] = field(default_factory=list)  # [(类型, 文本)]，类型如 money / percent
+    keywords: List[str] = field(default_factory=list)  # 命中的关键词（小写，按出现顺序）
+
+    @property
+    def passed(self) -> bool:
+        """包含数字或关键词至少一项"""
+        return bool(self.numbers or self.keywords)
+
+
+class KeywordAutomaton:
+    """Aho-Corasick 自动机，一次扫描找出文本中的全部关键词（包括重叠的，如 "百" 和 "百万"）"""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output: List[Tuple[str, ...]] = [()]
+        for keyword in keywords:
+            state = 0
+            for ch in keyword:
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                state = nxt
+            self.output[state] += (keyword,)
+
+        # 按层计算失败指针，并把后缀状态的输出合并进来
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[nxt] = self.goto[fallback].get(ch, 0)
+                self.output[nxt] += self.output[self.fail[nxt]]
+
+    def iter_matches(self, text: str) -> Iterator[str]:
+        """按结束位置顺序产出命中的关键词"""
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                yield from output[state]
+
+
+class SummaryScorer:
+    """编译后的摘要质量检查器，可在多次检查间复用"""
+
+    def __init__(self, keywords: Iterable[str] = FACT_KEYWORDS):
+        self.keywords = tuple(dict.fromkeys(k.lower() for k in keywords if k))
+        self.automaton = KeywordAutomaton(self.keywords)
+
+    def score(self, summary: str) -> QualityResult:
+        """扫描摘要，返回命中的数字和关键词"""
+        result = QualityResult()
+        if not summary:
+            return result
+        result.numbers = [(m.lastgroup, m.group()) for m in NUMBER_PATTERN.finditer(summary)]
+        result.keywords = list(self.automaton.iter_matches(summary.lower()))
+        return result
+
+    def passes(self, summary: str) -> bool:
+        """只判断是否通过，命中第一个数字或关键词即返回"""
+        if not summary:
+            return False
+        if DIGIT.search(summary):
+            return True
+        return next(self.automaton.iter_matches(summary.lower()), None) is not None
+
+    def keyword_counts(self, summaries: Iterable[str]) -> Counter:
+        """统计一批摘要中各关键词的命中次数（未命中的关键词计为 0）"""
+        counts = Counter({k: 0 for k in self.keywords})
+        for summary in summaries:
+            counts.update(self.score(summary).keywords)
+        return counts
+
+
+@lru_cache(maxsize=None)
+def default_scorer() -> SummaryScorer:
+    """使用 FACT_KEYWORDS 的共享检查器"""
+    return SummaryScorer()
@@ -5,14 +5,49 @@ HTML 渲染模块
 import os
 import re
 from datetime import datetime
-from typing import Dict, List
+from functools import lru_cache
+from html import escape
+from typing import Dict, Iterator, List
 
 import sys
 import os
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 from fetchers.base import ContentItem
-from config.settings import OUTPUT_CONFIG
+from template import CompiledTemplate, compile_template, load_template
+from config.settings import OUTPUT_CONFIG, INDUSTRY_SOURCES
+
+# 竞品资讯表格的一行
+COMPETITOR_ROW = compile_template("""<tr>
+  <td class="company">{{COMPANY}}</td>
+  <td>
+    <p class="item-title">{{TITLE}}</p>
+    <p class="item-summary">{{SUMMARY}}</p>
+    <p class="item-meta">{{DATE}} · <a href="{{URL}}" target="_blank" rel="noopener">原文链接</a></p>
+  </td>
+</tr>""")
+
+# 行业资讯卡片
+INDUSTRY_CARD = compile_template("""<div class="industry-item">
+  <p class="item-title">{{TITLE}}</p>
+  <p class="item-summary">{{SUMMARY}}</p>
+  <p class="item-meta">{{DATE}} · <a href="{{URL}}" target="_blank" rel="noopener">原文链接</a></p>
+</div>""")
+
+# 行业资讯中一个来源的小节
+INDUSTRY_SUBSECTION = compile_template("""
+            <!-- {{NAME}} -->
+            <div class="industry-subsection">
+                <h3>{{HEADING}}</h3>
+                {{ITEMS_HTML}}
+            </div>
+""")
+
+
+@lru_cache(maxsize=None)
+def industry_subsection(name: str, heading: str) -> CompiledTemplate:
+    """某个来源的小节模板：名称和标题已填入，只剩 ITEMS_HTML 插槽"""
+    return INDUSTRY_SUBSECTION.partial({"NAME": escape(name), "HEADING": escape(heading)})
 
 
 class HTMLRenderer:
@@ -26,10 +61,9 @@ class HTMLRenderer:
         )
         self.template = self._load_template()
     
-    def _load_template(self) -> str:
-        """加载 HTML 模板"""
-        with open(self.template_path, 'r', encoding='utf-8') as f:
-            return f.read()
+    def _load_template(self) -> CompiledTemplate:
+        """加载 HTML 模板（编译结果按文件缓存，多个渲染器共用）"""
+        return load_template(self.template_path)
     
     def render(self, competitor_items: Dict[str, List[ContentItem]], 
                industry_items: Dict[str, List[ContentItem]],
@@ -42,102 +76,74 @@ class HTMLRenderer:
         :param end_date: 结束日期 (YYYY-MM-DD)
         :return: HTML 内容
         """
-        html = self.template
-        
-        # 填充日期
-        html = html.replace("{{START_DATE}}", start_date)
-        html = html.replace("{{END_DATE}}", end_date)
-        html = html.replace("{{GENERATED_AT}}", datetime.now().strftime("%Y-%m-%d %H:%M"))
-        
-        # 填充竞品资讯
-        competitor_html = self._render_competitor_section(competitor_items)
-        html = html.replace("{{COMPETITOR_SECTION_HTML}}", competitor_html)
-        
+        return self.template.render(self._slot_values(competitor_items, industry_items, start_date, end_date))
+    
+    def _slot_values(self, competitor_items: Dict[str, List[ContentItem]],
+                     industry_items: Dict[str, List[ContentItem]],
+                     start_date: str, end_date: str) -> Dict:
+        """模板插槽 -> 内容（区块为逐行产出的生成器，渲染时直接写入输出）"""
+        values = {
+            # 填充日期
+            "START_DATE": start_date,
+            "END_DATE": end_date,
+            "GENERATED_AT": datetime.now().strftime("%Y-%m-%d %H:%M"),
+            # 填充竞品资讯
+            "COMPETITOR_SECTION_HTML": self._render_competitor_section(competitor_items),
+        }
         # 填充行业资讯
-        industry_html_map = self._render_industry_section(industry_items)
-        for key, value in industry_html_map.items():
-            html = html.replace(f"{{{{{key}}}}}", value)
-        
-        return html
+        values.update(self._render_industry_section(industry_items))
+        return values
     
-    def _render_competitor_section(self, items: Dict[str, List[ContentItem]]) -> str:
+    def _render_competitor_section(self, items: Dict[str, List[ContentItem]]) -> Iterator[str]:
         """
         渲染竞品资讯区块
         :param items: {公司名称: 内容列表}
-        :return: HTML 字符串
+        :return: HTML 片段
         """
-        rows = []
-        
+        first = True
         for company, company_items in items.items():
-            if not company_items:
-                continue
-            
             for item in company_items:
-                row_html = f"""<tr>
-  <td class="company">{company}</td>
-  <td>
-    <p class="item-title">{self._escape_html(item.title)}</p>
-    <p class="item-summary">{self._escape_html(item.summary)}</p>
-    <p class="item-meta">{item.date} · <a href="{item.url}" target="_blank" rel="noopener">原文链接</a></p>
-  </td>
-</tr>"""
-                rows.append(row_html)
-        
-        if not rows:
-            return '<tr><td colspan="2" class="empty-state">本周暂无竞品资讯</td></tr>'
+                if not first:
+                    yield "\n"
+                first = False
+                yield from COMPETITOR_ROW.chunks(self._item_values(item, COMPANY=company))
         
-        return "\n".join(rows)
+        if first:
+            yield '<tr><td colspan="2" class="empty-state">本周暂无竞品资讯</td></tr>'
+    
+    def _render_cards(self, items: List[ContentItem]) -> Iterator[str]:
+        """行业资讯卡片，卡片之间换行分隔"""
+        for index, item in enumerate(items):
+            if index:
+                yield "\n"
+            yield from INDUSTRY_CARD.chunks(self._item_values(item))
     
-    def _render_industry_section(self, items: Dict[str, List[ContentItem]]) -> Dict[str, str]:
+    def _item_values(self, item: ContentItem, **extra) -> Dict[str, str]:
+        return {
+            "TITLE": self._escape_html(item.title),
+            "SUMMARY": self._escape_html(item.summary),
+            "DATE": item.date,
+            "URL": item.url,
+            **extra,
+        }
+    
+    def _render_industry_section(self, items: Dict[str, List[ContentItem]]) -> Dict:
         """
         渲染行业资讯区块
+        按 INDUSTRY_SOURCES 的顺序输出有内容的来源，未配置的来源排在后面（标题使用来源名）
         :param items: {来源名称: 内容列表}
         :return: 插槽映射 {插槽名: HTML内容}
         """
-        result = {}
-        
-        # 隐藏旧的模块（Publisher, Technology, Platform, AI, Others）
-        old_slots = ["INDUSTRY_PUBLISHER", "INDUSTRY_TECHNOLOGY", "INDUSTRY_PLATFORM", "INDUSTRY_AI", "INDUSTRY_OTHERS"]
-        for slot_prefix in old_slots:
-            result[f"{slot_prefix}_ITEMS_HTML"] = ""
-            result[f"{slot_prefix}_HIDDEN_CLASS"] = "hidden"
-            result[f"{slot_prefix}_EMPTY_HTML"] = ""
-        
-        # 渲染 AdExchanger
-        adex_items = items.get("AdExchanger", [])
-        if adex_items:
-            cards = []
-            for item in adex_items:
-                card_html = f"""<div class="industry-item">
-  <p class="item-title">{self._escape_html(item.title)}</p>
-  <p class="item-summary">{self._escape_html(item.summary)}</p>
-  <p class="item-meta">{item.date} · <a href="{item.url}" target="_blank" rel="noopener">原文链接</a></p>
-</div>"""
-                cards.append(card_html)
-            result["ADEXCHANGER_ITEMS_HTML"] = "\n".join(cards)
-            result["ADEXCHANGER_HIDDEN_CLASS"] = ""
-        else:
-            result["ADEXCHANGER_ITEMS_HTML"] = ""
-            result["ADEXCHANGER_HIDDEN_CLASS"] = "hidden"
-        
-        # 渲染 Search Engine Land
-        sel_items = items.get("Search Engine Land", [])
-        if sel_items:
-            cards = []
-            for item in sel_items:
-                card_html = f"""<div class="industry-item">
-  <p class="item-title">{self._escape_html(item.title)}</p>
-  <p class="item-summary">{self._escape_html(item.summary)}</p>
-  <p class="item-meta">{item.date} · <a href="{item.url}" target="_blank" rel="noopener">原文链接</a></p>
-</div>"""
-                cards.append(card_html)
-            result["SEL_ITEMS_HTML"] = "\n".join(cards)
-            result["SEL_HIDDEN_CLASS"] = ""
-        else:
-            result["SEL_ITEMS_HTML"] = ""
-            result["SEL_HIDDEN_CLASS"] = "hidden"
-        
-        return result
+        return {"INDUSTRY_SECTION_HTML": self._industry_subsections(items)}
+    
+    def _industry_subsections(self, items: Dict[str, List[ContentItem]]) -> Iterator[str]:
+        sources = list(INDUSTRY_SOURCES) + [name for name in items if name not in INDUSTRY_SOURCES]
+        for name in sources:
+            source_items = items.get(name)
+            if not source_items:
+                continue
+            heading = INDUSTRY_SOURCES.get(name, {}).get("heading") or name
+            yield from industry_subsection(name, heading).chunks({"ITEMS_HTML": self._render_cards(source_items)})
     
     def _escape_html(self, text: str) -> str:
         """
@@ -148,14 +154,8 @@ class HTMLRenderer:
         if not text:
             return ""
         
-        # 转义特殊字符
-        text = text.replace("&", "&amp;")
-        text = text.replace("<", "&lt;")
-        text = text.replace(">", "&gt;")
-        text = text.replace('"', "&quot;")
-        text = text.replace("'", "&#x27;")
-        
-        return text
+        # 转义 & < > " '（' 转为 &#x27;）
+        return escape(text)
     
     def save(self, html_content: str, start_date: str, end_date: str) -> str:
         """
@@ -165,16 +165,20 @@ class HTMLRenderer:
         :param end_date: 结束日期
         :return: 文件路径
         """
-        # 创建输出目录
-        output_dir = OUTPUT_CONFIG["output_dir"]
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # 生成文件名
-        filename = f"weekly-report-{start_date}_{end_date}.html"
-        filepath = os.path.join(output_dir, filename)
+        filepath = self._output_path(start_date, end_date)
         
         # 保存文件
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(html_content)
         
         return filepath
+    
+    def _output_path(self, start_date: str, end_date: str) -> str:
+        """输出文件路径（同时创建输出目录）"""
+        # 创建输出目录
+        output_dir = OUTPUT_CONFIG["output_dir"]
+        os.makedirs(output_dir, exist_ok=True)
+        
+        # 生成文件名
+        filename = f"weekly-report-{start_date}_{end_date}.html"
+        return os.path.join(output_dir, filename)
@@ -3,23 +3,41 @@ DeepSeek API 摘要生成模块
 用于生成 80-100 字的中文摘要
 """
 
+import json
 import re
 import time
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 import sys
 import os
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 from fetchers.base import ContentItem
-from config.settings import DEEPSEEK_API_KEY, DEEPSEEK_API_BASE, DEEPSEEK_MODEL, CONTENT_CONFIG
+from rate_limit import TokenBucket, backoff_delay, parse_retry_after
+from summary_cache import SummaryCache, cache_key, get_summary_cache
+from config.settings import DEEPSEEK_API_KEY, DEEPSEEK_API_BASE, DEEPSEEK_MODEL, CONTENT_CONFIG, SUMMARY_CONFIG
+
+# 需要重试的 HTTP 状态码
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+# 生成失败时写入的占位摘要（不参与长度修复）
+FAILED_SUMMARIES = {"[摘要生成失败]", "摘要生成失败"}
+
+# 批量模式响应中的 JSON 数组（允许前后有 ```json 等多余文字）
+JSON_ARRAY = re.compile(r"\[.*\]", re.DOTALL)
 
 
 class Summarizer:
     """DeepSeek 摘要生成器"""
     
+    # 修改提示词后递增，使旧的缓存摘要失效
+    PROMPT_VERSION = "summary-v1"
+    REPAIR_PROMPT_VERSION = "repair-v1"
+    
     def __init__(self, api_key: str = None, api_base: str = None, model: str = None):
         self.api_key = api_key or DEEPSEEK_API_KEY
         self.api_base = api_base or DEEPSEEK_API_BASE
@@ -29,6 +47,24 @@ class Summarizer:
         
         if not self.api_key:
             raise ValueError("DeepSeek API Key 未设置，请设置 DEEPSEEK_API_KEY 环境变量")
+        
+        self.cache = get_summary_cache()
+        self._init_concurrency()
+    
+    def _init_concurrency(self, config: dict = None):
+        """并发数、令牌桶和连接池（连接数与并发数一致）"""
+        config = config or SUMMARY_CONFIG
+        self.concurrency = max(1, config["concurrency"])
+        self.max_retries = config["max_retries"]
+        self.backoff_base = config["backoff_base"]
+        self.backoff_max = config["backoff_max"]
+        self.timeout = config["timeout"]
+        self.batch_size = max(1, config["batch_size"])
+        self.repair_attempts = config["repair_attempts"]
+        self.rate_limiter = TokenBucket(config["requests_per_second"], config["burst"])
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=self.concurrency, max_retries=0))
+        self.session.mount("http://", HTTPAdapter(pool_maxsize=self.concurrency, max_retries=0))
     
     def summarize(self, title: str, content: str) -> str:
         """
@@ -37,18 +73,18 @@ class Summarizer:
         :param content: 文章内容
         :return: 80-100 字中文摘要
         """
-        # 清理内容
-        content = self._clean_content(content)
-        
-        # 截断内容以避免超出 token 限制
-        content = content[:3000]
-        
+        content, key = self._prepare(title, content)
+        cached = self.cache.get(key)
+        if cached:
+            return cached
+        return self._summarize_one(title, content, key)
+    
+    def _summarize_one(self, title: str, content: str, key: str) -> str:
+        """单条请求（content 为 _prepare 处理后的正文）"""
         prompt = f"""请根据以下文章标题和内容，生成一段{self.min_length}-{self.max_length}字的中文摘要。
 
 要求：
-1. 摘要必须包含原文的关键指标、关键事实（如：增长数据、营收、合作对象、产品/功能要点、时间节点等）
-2. 摘要必须基于原文明确事实，禁止推测影响或引入主观判断
-3. 摘要字数严格控制在{self.min_length}-{self.max_length}个中文字符（包含标点）
+{self._requirements()}
 4. 直接输出摘要内容，不要有任何前缀或说明
 
 文章标题：{title}
@@ -60,44 +96,284 @@ class Summarizer:
         try:
             response = self._call_api(prompt)
             if response:
-                summary = self._clean_summary(response)
-                # 验证长度
-                if self._validate_length(summary):
-                    return summary
-                else:
-                    # 如果长度不符合要求，尝试重新生成
-                    return self._adjust_summary(summary)
+                summary = self._finish(response)
+                self.cache.put(key, summary)
+                return summary
             return ""
         except Exception as e:
             print(f"生成摘要失败: {e}")
             return ""
     
+    def summarize_group(self, items: List[ContentItem]) -> List[str]:
+        """
+        一次请求生成多篇文章的摘要（响应为 JSON 数组）
+        缺失、解析失败或长度不足的条目退回逐条调用 summarize
+        :return: 与 items 顺序一致的摘要列表（失败为空字符串）
+        """
+        results = [""] * len(items)
+        pending = []  # (位置, 截断后正文, 缓存键)
+        for index, item in enumerate(items):
+            content, key = self._prepare(item.title, item.summary)
+            cached = self.cache.get(key)
+            if cached:
+                results[index] = cached
+            else:
+                pending.append((index, content, key))
+        
+        parsed: Dict[int, str] = {}
+        if len(pending) > 1:
+            articles = "\n\n".join(
+                f"【文章 {number}】\n标题：{items[index].title}\n内容：{content}"
+                for number, (index, content, key) in enumerate(pending, 1)
+            )
+            prompt = f"""请根据以下 {len(pending)} 篇文章的标题和内容，分别为每篇生成一段{self.min_length}-{self.max_length}字的中文摘要。
+
+要求：
+{self._requirements()}
+4. 只输出 JSON 数组，不要有任何其他文字，格式：[{{"id": 1, "summary": "摘要"}}, ...]，id 为文章编号
+
+{articles}
+
+请输出 JSON 数组："""
+            try:
+                response = self._call_api(prompt, max_tokens=300 * len(pending))
+                parsed = self._parse_group(response, len(pending))
+            except Exception as e:
+                print(f"批量生成摘要失败: {e}")
+            if len(parsed) < len(pending):
+                print(f"    [!] 批量摘要解析 {len(parsed)}/{len(pending)} 条，其余逐条生成")
+        
+        for number, (index, content, key) in enumerate(pending, 1):
+            summary = self._finish(parsed[number]) if number in parsed else ""
+            # 逐条校验：缺失或长度不足时单独请求
+            if summary and len(summary) >= self.min_length:
+                self.cache.put(key, summary)
+                results[index] = summary
+            else:
+                results[index] = self._summarize_one(items[index].title, content, key)
+        return results
+    
+    def _prepare(self, title: str, content: str):
+        """清理、截断正文并计算缓存键，返回 (正文, 缓存键)"""
+        # 清理内容
+        content = self._clean_content(content)
+        
+        # 截断内容以避免超出 token 限制
+        content = content[:3000]
+        
+        # 批量与逐条请求的摘要要求相同，共用缓存键
+        key = cache_key("summary", self.model, f"{self.PROMPT_VERSION}:{self.min_length}-{self.max_length}",
+                        title, content)
+        return content, key
+    
+    def _requirements(self) -> str:
+        return f"""1. 摘要必须包含原文的关键指标、关键事实（如：增长数据、营收、合作对象、产品/功能要点、时间节点等）
+2. 摘要必须基于原文明确事实，禁止推测影响或引入主观判断
+3. 摘要字数严格控制在{self.min_length}-{self.max_length}个中文字符（包含标点）"""
+    
+    def _finish(self, response: str) -> str:
+        """清理 API 返回的摘要并校正长度"""
+        summary = self._clean_summary(response)
+        # 验证长度
+        if not self._validate_length(summary):
+            # 如果长度不符合要求，尝试重新生成
+            summary = self._adjust_summary(summary)
+        return summary
+    
+    def _parse_group(self, response: Optional[str], count: int) -> Dict[int, str]:
+        """
+        解析批量响应
+        :return: {文章编号: 摘要}，只包含编号有效、内容非空的条目
+        """
+        match = JSON_ARRAY.search(response or "")
+        if not match:
+            return {}
+        try:
+            data = json.loads(match.group(0))
+        except ValueError:
+            return {}
+        if not isinstance(data, list):
+            return {}
+        
+        parsed = {}
+        for position, entry in enumerate(data, 1):
+            if isinstance(entry, dict):
+                number, text = entry.get("id", position), entry.get("summary")
+            else:
+                number, text = position, entry
+            try:
+                number = int(number)
+            except (TypeError, ValueError):
+                continue
+            if 1 <= number <= count and isinstance(text, str) and text.strip():
+                parsed.setdefault(number, text.strip())
+        return parsed
+    
+    def repair_summaries(self, items: List[ContentItem]) -> int:
+        """
+        修复长度不符合要求的摘要（在 Validator 之前调用）
+        只把摘要本身发回模型扩写或压缩，不重新抓取、不重新生成；多条并发进行
+        :return: 修复后符合长度要求的条目数
+        """
+        targets = [item for item in items
+                   if item.summary and item.summary not in FAILED_SUMMARIES
+                   and not self._validate_length(item.summary)]
+        if not targets or self.repair_attempts <= 0:
+            return 0
+        
+        print(f"  修复摘要长度: {len(targets)} 条")
+        repaired = 0
+        workers = min(self.concurrency, len(targets))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="repair") as pool:
+            futures = {pool.submit(self.repair_summary, item.summary): item for item in targets}
+            for future in as_completed(futures):
+                item = futures[future]
+                before = len(item.summary)
+                try:
+                    item.summary = future.result()
+                except Exception as e:
+                    print(f"    ✗ {item.title[:30]}... 修复失败: {e}")
+                    continue
+                if self._validate_length(item.summary):
+                    repaired += 1
+                    print(f"    ✓ {item.title[:30]}... {before} → {len(item.summary)} 字")
+                else:
+                    print(f"    ✗ {item.title[:30]}... 仍为 {len(item.summary)} 字")
+        return repaired
+    
+    def repair_summary(self, summary: str) -> str:
+        """
+        按长度要求扩写或压缩一条摘要，最多请求 repair_attempts 次
+        仍然过长时截断；仍然过短时返回最接近要求的结果
+        """
+        key = cache_key("repair", self.model, f"{self.REPAIR_PROMPT_VERSION}:{self.min_length}-{self.max_length}",
+                        "", summary)
+        cached = self.cache.get(key)
+        if cached:
+            return cached
+        
+        current = summary
+        for _ in range(self.repair_attempts):
+            length = len(current)
+            if self._validate_length(current):
+                break
+            if length < self.min_length:
+                instruction = f"扩写到{self.min_length}-{self.max_length}字，只能补充摘要中已有事实的细节或说明，不得添加新的事实"
+            else:
+                instruction = f"压缩到{self.min_length}-{self.max_length}字，优先保留数字、公司名和产品名"
+            prompt = f"""下面这段中文摘要共{length}字，请{instruction}。
+
+直接输出修改后的摘要，不要有任何前缀或说明。
+
+摘要：{current}"""
+            response = self._call_api(prompt)
+            if not response:
+                break
+            candidate = self._clean_summary(response)
+            # 只接受更接近长度要求的结果
+            if self._length_gap(candidate) < self._length_gap(current):
+                current = candidate
+        
+        if len(current) > self.max_length:
+            current = self._adjust_summary(current)
+        if self._validate_length(current):
+            self.cache.put(key, current)
+        return current
+    
+    def _length_gap(self, summary: str) -> int:
+        """摘要长度与要求区间的距离，符合要求时为 0"""
+        length = len(summary)
+        return max(self.min_length - length, length - self.max_length, 0)
+    
     def summarize_batch(self, items: List[ContentItem]) -> List[ContentItem]:
         """
-        批量生成摘要
+        批量生成摘要（并发，按 SUMMARY_CONFIG 限速）
         :param items: 内容条目列表
         :return: 更新后的内容条目列表
         """
-        results = []
-        for i, item in enumerate(items):
-            print(f"  生成摘要 [{i+1}/{len(items)}]: {item.title[:30]}...")
-            summary = self.summarize(item.title, item.summary)
+        def on_done(done, total, item, summary, error):
+            print(f"  生成摘要 [{done}/{total}]: {item.title[:30]}...")
+            if not summary:
+                print(f"    ⚠️ 摘要生成失败")
+        
+        summaries = self.summarize_concurrent(items, on_done)
+        for item, summary in zip(items, summaries):
+            # 如果生成失败，保留原内容但标记
+            item.summary = summary or "[摘要生成失败]"
+        return list(items)
+    
+    def summarize_items(self, items: List[ContentItem], label: str = "摘要",
+                        keep_original: bool = False) -> List[ContentItem]:
+        """
+        并发生成摘要并写回 item.summary，失败时保留原内容前 100 字；
+        生成成功但长度不符合要求的摘要随后经 repair_summaries 修复（失败条目保留的原文不送修）
+        :param items: 内容条目列表
+        :param label: 进度输出前缀（如 "竞品"）
+        :param keep_original: 失败时保留完整原内容（不截断）
+        :return: 原列表
+        """
+        def on_done(done, total, item, summary, error):
+            print(f"  [{label} {done}/{total}] {item.source} | {item.title[:35]}...")
             if summary:
-                item.summary = summary
-                results.append(item)
+                print(f"      ✓ {len(summary)} 字")
             else:
-                # 如果生成失败，保留原内容但标记
-                print(f"    ⚠️ 摘要生成失败")
-                item.summary = "[摘要生成失败]"
-                results.append(item)
-            # 避免请求过快
-            time.sleep(0.5)
+                print(f"      ✗ 摘要生成失败{': ' + str(error) if error else ''}")
+        
+        summaries = self.summarize_concurrent(items, on_done)
+        generated = []
+        for item, summary in zip(items, summaries):
+            if summary:
+                item.summary = summary
+                generated.append(item)
+            elif not keep_original:
+                item.summary = item.summary[:100] if item.summary else "摘要生成失败"
+        self.repair_summaries(generated)
+        return items
+    
+    def summarize_concurrent(self, items: List[ContentItem],
+                             on_done: Callable = None) -> List[str]:
+        """
+        用线程池并发调用 summarize，结果顺序与 items 一致（失败为空字符串）
+        :param on_done: 每完成一条回调 on_done(已完成数, 总数, item, summary, error)，在调用线程中执行
+        """
+        items = list(items)
+        results = [""] * len(items)
+        if not items:
+            return results
+        
+        # 按 batch_size 分组，每组一次请求
+        groups = [list(range(start, min(start + self.batch_size, len(items))))
+                  for start in range(0, len(items), self.batch_size)]
+        workers = min(self.concurrency, len(groups))
+        done = 0
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="summarize") as pool:
+            futures = {pool.submit(self._summarize_indices, items, group): group for group in groups}
+            for future in as_completed(futures):
+                group = futures[future]
+                error = None
+                try:
+                    for index, summary in zip(group, future.result()):
+                        results[index] = summary or ""
+                except Exception as e:
+                    error = e
+                for index in group:
+                    done += 1
+                    if on_done:
+                        on_done(done, len(items), items[index], results[index], error)
+        self.cache.report()
         return results
     
-    def _call_api(self, prompt: str) -> Optional[str]:
+    def _summarize_indices(self, items: List[ContentItem], indices: List[int]) -> List[str]:
+        if len(indices) == 1:
+            item = items[indices[0]]
+            return [self.summarize(item.title, item.summary)]
+        return self.summarize_group([items[i] for i in indices])
+    
+    def _call_api(self, prompt: str, max_tokens: int = 300) -> Optional[str]:
         """
         调用 DeepSeek API
         :param prompt: 提示词
+        :param max_tokens: 回复长度上限（批量请求按条数放大）
         :return: API 响应内容
         """
         headers = {
@@ -114,29 +390,45 @@ class Summarizer:
                 }
             ],
             "temperature": 0.3,
-            "max_tokens": 300
+            "max_tokens": max_tokens
         }
         
-        try:
-            response = requests.post(
-                f"{self.api_base}/chat/completions",
-                headers=headers,
-                json=data,
-                timeout=60
-            )
-            response.raise_for_status()
-            result = response.json()
+        url = f"{self.api_base}/chat/completions"
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            retry_after = None
+            try:
+                response = self.session.post(url, headers=headers, json=data, timeout=self.timeout)
+                if response.status_code in RETRY_STATUS:
+                    reason = f"HTTP {response.status_code}"
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                else:
+                    response.raise_for_status()
+                    result = response.json()
+                    
+                    if "choices" in result and len(result["choices"]) > 0:
+                        content = result["choices"][0].get("message", {}).get("content", "")
+                        return content.strip()
+                    return None
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                reason = type(e).__name__
+            except requests.exceptions.RequestException as e:
+                print(f"API 请求失败: {e}")
+                return None
+            except Exception as e:
+                print(f"API 调用异常: {e}")
+                return None
             
-            if "choices" in result and len(result["choices"]) > 0:
-                content = result["choices"][0].get("message", {}).get("content", "")
-                return content.strip()
-            return None
-        except requests.exceptions.RequestException as e:
-            print(f"API 请求失败: {e}")
-            return None
-        except Exception as e:
-            print(f"API 调用异常: {e}")
-            return None
+            if attempt == self.max_retries:
+                print(f"API 请求失败: {reason}，已重试 {self.max_retries} 次")
+                return None
+            delay = backoff_delay(attempt, self.backoff_base, self.backoff_max, retry_after)
+            if retry_after is not None or reason == "HTTP 429":
+                # 被限流时所有线程一起放慢
+                self.rate_limiter.pause(delay)
+            print(f"    [!] API {reason}，{delay:.1f}s 后重试 ({attempt + 1}/{self.max_retries})")
+            time.sleep(delay)
+        return None
     
     def _clean_content(self, content: str) -> str:
         """
@@ -231,6 +523,12 @@ class MockSummarizer(Summarizer):
     def __init__(self, *args, **kwargs):
         self.min_length = CONTENT_CONFIG["summary_min_length"]
         self.max_length = CONTENT_CONFIG["summary_max_length"]
+        self.model = "mock"
+        # 不读写摘要缓存文件（get 恒未命中，put 不保存）
+        self.cache = SummaryCache(enabled=False)
+        self._init_concurrency()
+        # 模拟摘要不调用 API，逐条生成
+        self.batch_size = 1
     
     def summarize(self, title: str, content: str) -> str:
         """生成模拟摘要"""
@@ -242,5 +540,5 @@ class MockSummarizer(Summarizer):
             mock_summary = mock_summary[:self.max_length - 1] + "。"
         return mock_summary
     
-    def _call_api(self, prompt: str) -> Optional[str]:
+    def _call_api(self, prompt: str, max_tokens: int = 300) -> Optional[str]:
         return None
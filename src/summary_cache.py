@@ -0,0 +1,117 @@
+"""
+AI 摘要缓存 - Summarizer 和 integrate_and_send 共用
+
+键为 (类型, 模型, 提示词版本, 标题, 截断后正文) 的 SHA-256，同一周重跑或发送失败后重跑时，
+未变化的条目直接使用本地结果，不再调用 DeepSeek。条目数超过上限时淘汰最久未使用的。
+"""
+
+import atexit
+import hashlib
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+from fetchers.state_file import JsonStateFile
+from config.settings import CACHE_CONFIG
+
+
+def cache_key(kind: str, model: str, prompt_version: str, title: str, content: str) -> str:
+    """内容寻址的缓存键，content 应为实际送入提示词的截断正文"""
+    digest = hashlib.sha256()
+    for part in (kind, model, prompt_version, title or "", content or ""):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class SummaryCache:
+    """
+    结构：{key: {"value": 摘要或 [标题, 摘要], "used_at": float}}
+    """
+
+    def __init__(self, state_file: JsonStateFile = None, max_entries: int = None, enabled: bool = None):
+        self.state_file = state_file or JsonStateFile(CACHE_CONFIG["summary_cache_file"])
+        self.max_entries = max_entries or CACHE_CONFIG["summary_cache_max_entries"]
+        self.enabled = CACHE_CONFIG["summary_cache_enabled"] if enabled is None else enabled
+        self.entries: Dict[str, Dict] = self.state_file.load() if self.enabled else {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    def get(self, key: str) -> Optional[Any]:
+        """命中时返回缓存值并刷新使用时间"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            entry["used_at"] = time.time()
+            self._dirty = True
+            return entry["value"]
+
+    def put(self, key: str, value: Any):
+        """只应写入成功的结果（失败时不缓存，下次重新生成）"""
+        if not self.enabled or not value:
+            return
+        with self._lock:
+            self.entries[key] = {"value": value, "used_at": time.time()}
+            self._dirty = True
+            if len(self.entries) > self.max_entries * 1.1:
+                self._evict()
+
+    def _evict(self):
+        """按使用时间保留最近的 max_entries 条（调用方持有锁）"""
+        keep = sorted(self.entries.items(), key=lambda kv: kv[1].get("used_at", 0), reverse=True)
+        self.entries = dict(keep[:self.max_entries])
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self.entries),
+            }
+
+    def report(self):
+        """打印本次运行的命中统计（没有查询时不输出）"""
+        stats = self.stats()
+        if stats["hits"] + stats["misses"]:
+            print(f"  摘要缓存: 命中 {stats['hits']} / 未命中 {stats['misses']}"
+                  f"（{stats['hit_rate']:.0%}），共 {stats['entries']} 条")
+
+    def save(self):
+        """保存并淘汰超出上限的条目"""
+        if not self.enabled:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            if len(self.entries) > self.max_entries:
+                self._evict()
+            snapshot = {k: dict(v) for k, v in self.entries.items()}
+            self._dirty = False
+        self.state_file.save(snapshot)
+
+
+_cache: Optional[SummaryCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_summary_cache() -> SummaryCache:
+    """获取进程级共享摘要缓存，进程退出时自动保存"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = SummaryCache()
+            atexit.register(_cache.save)
+        return _cache
@@ -0,0 +1,90 @@
+"""
+HTML 模板编译 - 把 {{SLOT}} 占位符模板解析为字面量 / 插槽片段
+
+解析一次后缓存，渲染时按顺序输出片段，不再对整个模板反复 str.replace。
+插槽值可以是字符串，也可以是逐块产出字符串的可迭代对象（如生成器），
+便于把多行内容直接写入同一个输出缓冲区或文件。
+"""
+
+import os
+import re
+from functools import lru_cache
+from typing import Iterable, Iterator, Mapping, Union
+
+SLOT = re.compile(r"\{\{([A-Za-z0-9_]+)\}\}")
+
+SlotValue = Union[str, Iterable[str]]
+
+
+class CompiledTemplate:
+    """编译后的模板：[(字面量, 插槽名, 原始占位符)] + 结尾字面量"""
+
+    def __init__(self, text: str):
+        segments = []
+        position = 0
+        for match in SLOT.finditer(text):
+            segments.append((text[position:match.start()], match.group(1), match.group(0)))
+            position = match.end()
+        self._set_segments(segments, text[position:])
+
+    def _set_segments(self, segments, tail: str):
+        self.segments = segments
+        self.tail = tail
+        self.slots = frozenset(slot for _, slot, _ in self.segments)
+
+    def chunks(self, values: Mapping[str, SlotValue]) -> Iterator[str]:
+        """
+        按顺序产出渲染结果的各个片段
+        :param values: {插槽名: 字符串或字符串片段的可迭代对象}，未提供的插槽保留原占位符
+        """
+        for literal, slot, placeholder in self.segments:
+            if literal:
+                yield literal
+            value = values.get(slot)
+            if value is None:
+                yield placeholder
+            elif isinstance(value, str):
+                yield value
+            else:
+                yield from value
+        if self.tail:
+            yield self.tail
+
+    def partial(self, values: Mapping[str, str]) -> "CompiledTemplate":
+        """
+        填入部分插槽（值应为已转义的 HTML），返回保留其余插槽的新模板
+        在片段级替换：填入的值并入相邻字面量，不会再被当作模板扫描 {{…}}
+        """
+        segments = []
+        pending = ""
+        for literal, slot, placeholder in self.segments:
+            value = values.get(slot)
+            if value is None:
+                segments.append((pending + literal, slot, placeholder))
+                pending = ""
+            else:
+                pending += literal + (value if isinstance(value, str) else "".join(value))
+        template = CompiledTemplate.__new__(CompiledTemplate)
+        template._set_segments(segments, pending + self.tail)
+        return template
+
+    def render(self, values: Mapping[str, SlotValue]) -> str:
+        """渲染为字符串（所有片段一次拼接）"""
+        return "".join(self.chunks(values))
+
+
+@lru_cache(maxsize=64)
+def compile_template(text: str) -> CompiledTemplate:
+    """编译模板文本（相同文本只编译一次）"""
+    return CompiledTemplate(text)
+
+
+@lru_cache(maxsize=16)
+def _compile_file(path: str, mtime_ns: int) -> CompiledTemplate:
+    with open(path, "r", encoding="utf-8") as f:
+        return CompiledTemplate(f.read())
+
+
+def load_template(path: str) -> CompiledTemplate:
+    """读取并编译模板文件，文件未修改时复用缓存"""
+    return _compile_file(os.path.abspath(path), os.stat(path).st_mtime_ns)
@@ -3,19 +3,35 @@
 """
 
 import re
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Tuple
+from typing import Iterable, List, Dict, Optional, Tuple
 from urllib.parse import urlparse
 
-import requests
-
 import sys
 import os
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 from fetchers.base import ContentItem
-from config.settings import SCRAPER_CONFIG, CONTENT_CONFIG
+from fetchers.transport import get_transport
+from fetchers.crawl_state import get_crawl_state
+from fetchers.http_cache import get_http_cache
+from link_status import get_link_status_cache
+from quality import default_scorer
+from config.settings import SCRAPER_CONFIG, CONTENT_CONFIG, VALIDATION_CONFIG
+
+
+def _interleave(groups: List[List[str]]) -> List[List[str]]:
+    """[[a1, a2], [b1]] -> [[a1], [b1], [a2]]，按轮次交替取各组元素"""
+    rounds = []
+    depth = max((len(group) for group in groups), default=0)
+    for i in range(depth):
+        rounds.append([group[i] for group in groups if i < len(group)])
+    return rounds
 
 
 @dataclass
@@ -30,14 +46,23 @@ class ValidationError:
 class Validator:
     """内容验证器"""
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": SCRAPER_CONFIG["user_agent"],
-        })
-        self.timeout = 15
+    def __init__(self, force_revalidate: bool = None):
+        """
+        :param force_revalidate: 忽略抓取记录和链接状态缓存全部重新检查，默认取 VALIDATION_CONFIG["force_revalidate"]
+        """
+        self.transport = get_transport()
+        self.timeout = VALIDATION_CONFIG["timeout"]
+        self.workers = VALIDATION_CONFIG["workers"]
+        self.per_host_limit = VALIDATION_CONFIG["per_host_limit"]
+        self.recently_seen = VALIDATION_CONFIG["recently_seen_hours"] * 3600
+        self.crawl_state = get_crawl_state()
+        self.http_cache = get_http_cache()
+        self.link_cache = get_link_status_cache()
+        self.force_revalidate = (VALIDATION_CONFIG["force_revalidate"]
+                                 if force_revalidate is None else force_revalidate)
         self.min_length = CONTENT_CONFIG["summary_min_length"]
         self.max_length = CONTENT_CONFIG["summary_max_length"]
+        self.scorer = default_scorer()
     
     def validate_competitor_items(self, items: Dict[str, List[ContentItem]], 
                                    window_start: datetime, window_end: datetime) -> Tuple[Dict[str, List[ContentItem]], List[ValidationError]]:
@@ -50,11 +75,13 @@ class Validator:
         """
         validated = {}
         errors = []
+        link_status = self.check_links(item.url for company_items in items.values() for item in company_items)
         
         for company, company_items in items.items():
             validated[company] = []
             for item in company_items:
-                is_valid, error = self._validate_item(item, window_start, window_end, f"竞品-{company}")
+                is_valid, error = self._validate_item(item, window_start, window_end, f"竞品-{company}",
+                                                      link_status.get(item.url))
                 if is_valid:
                     validated[company].append(item)
                 else:
@@ -73,11 +100,13 @@ class Validator:
         """
         validated = {}
         errors = []
+        link_status = self.check_links(item.url for module_items in items.values() for item in module_items)
         
         for module, module_items in items.items():
             validated[module] = []
             for item in module_items:
-                is_valid, error = self._validate_item(item, window_start, window_end, f"行业-{module}")
+                is_valid, error = self._validate_item(item, window_start, window_end, f"行业-{module}",
+                                                      link_status.get(item.url))
                 if is_valid:
                     validated[module].append(item)
                 else:
@@ -86,13 +115,17 @@ class Validator:
         return validated, errors
     
     def _validate_item(self, item: ContentItem, window_start: datetime, 
-                       window_end: datetime, module: str) -> Tuple[bool, ValidationError]:
+                       window_end: datetime, module: str,
+                       link_ok: Optional[bool] = None) -> Tuple[bool, ValidationError]:
         """
         验证单个条目
+        :param link_ok: check_links 得到的链接状态，None 时单独检查
         :return: (是否通过, 错误信息)
         """
         # 1. 验证链接可用性
-        if not self._validate_link(item.url):
+        if link_ok is None:
+            link_ok = self._validate_link(item.url)
+        if not link_ok:
             return False, ValidationError(
                 module=module,
                 title=item.title,
@@ -147,27 +180,98 @@ class Validator:
         
         return True, None
     
+    def check_links(self, urls: Iterable[str]) -> Dict[str, bool]:
+        """
+        并发检查一批链接
+        相同 URL 只检查一次；抓取器最近成功打开过的 URL 直接视为可用；
+        链接状态缓存 TTL 内的结果直接复用（force_revalidate 时以上两项都跳过，全部重新请求）；
+        同一主机同时最多 per_host_limit 个请求
+        :return: {url: 是否可用}
+        """
+        unique = list(dict.fromkeys(url for url in urls if url))
+        status = {}
+        pending = []
+        reused = cached = 0
+        for url in unique:
+            # force_revalidate 时跳过所有捷径；复用的结果不写入链接状态缓存，缓存只记录真实请求
+            if self.force_revalidate:
+                pending.append(url)
+                continue
+            if self._recently_seen(url):
+                status[url] = True
+                reused += 1
+                continue
+            known = self.link_cache.get(url)
+            if known is not None:
+                status[url] = known
+                cached += 1
+            else:
+                pending.append(url)
+        
+        if pending:
+            by_host = defaultdict(list)
+            for url in pending:
+                by_host[urlparse(url).netloc.lower()].append(url)
+            host_slots = {host: threading.Semaphore(self.per_host_limit) for host in by_host}
+            
+            def check(url):
+                with host_slots[urlparse(url).netloc.lower()]:
+                    ok, code = self._probe_link(url)
+                self.link_cache.record(url, ok, code)
+                return ok
+            
+            # 按主机轮流排列，避免线程都阻塞在同一主机上
+            ordered = [url for group in _interleave(list(by_host.values())) for url in group]
+            
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(ordered)),
+                                    thread_name_prefix="validate") as pool:
+                for url, ok in zip(ordered, pool.map(check, ordered)):
+                    status[url] = ok
+        
+        self.link_cache.save()
+        dead = sum(1 for ok in status.values() if not ok)
+        print(f"  链接检查: {len(unique)} 个 URL（复用抓取结果 {reused}，缓存 {cached}，"
+              f"请求 {len(pending)}，不可用 {dead}）")
+        return status
+    
+    def _recently_seen(self, url: str) -> bool:
+        """抓取器在 recently_seen 秒内成功打开过该 URL"""
+        cutoff = time.time() - self.recently_seen
+        # 只信任记录了成功状态码的抓取记录，浏览器渲染出的 404 / 错误页不算
+        if self.crawl_state.ok_since(url, cutoff):
+            return True
+        if self.http_cache:
+            return (self.http_cache.last_used(url) or 0) >= cutoff
+        return False
+    
     def _validate_link(self, url: str) -> bool:
         """
         验证链接可用性
         :param url: 链接 URL
         :return: 是否可用
         """
+        return self._probe_link(url)[0]
+    
+    def _probe_link(self, url: str) -> Tuple[bool, Optional[int]]:
+        """
+        请求链接
+        :return: (是否可用, 最终状态码；网络异常时为 None)
+        """
         try:
-            response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+            response = self.transport.head(url, timeout=self.timeout, allow_redirects=True)
             # HTTP 状态码 < 400 且非 404
             if response.status_code < 400:
-                return True
+                return True, response.status_code
             
             # 如果 HEAD 请求失败，尝试 GET 请求
             if response.status_code in [405, 403]:  # Method Not Allowed or Forbidden
-                response = self.session.get(url, timeout=self.timeout, stream=True)
+                response = self.transport.get(url, timeout=self.timeout, stream=True)
                 response.close()
-                return response.status_code < 400
+                return response.status_code < 400, response.status_code
             
-            return False
+            return False, response.status_code
         except Exception as e:
-            return False
+            return False, None
     
     def _validate_summary_quality(self, summary: str) -> bool:
         """
@@ -175,41 +279,8 @@ class Validator:
         :param summary: 摘要内容
         :return: 是否包含关键信息
         """
-        if not summary:
-            return False
-        
-        # 检查摘要中是否包含数字（指标/数据）或特定关键词
-        # 数字模式（包括百分比、金额、年份等）
-        number_patterns = [
-            r'\d+',  # 普通数字
-            r'\d+\.\d+',  # 小数
-            r'\d+%',  # 百分比
-            r'\$\d+',  # 金额
-            r'\d{4}',  # 年份
-            r'20\d{2}',  # 2000+ 年份
-        ]
-        
-        # 关键事实关键词
-        fact_keywords = [
-            '营收', '收入', '增长', '下降', '同比', '环比', '合作', '发布', '推出',
-            '收购', '并购', '融资', '投资', '用户', '客户', '市场', '份额',
-            'revenue', 'growth', 'decline', 'partnership', 'launch', 'acquire',
-            'merger', 'funding', 'investment', 'users', 'customers', 'market',
-            'million', 'billion', 'percent', '%', '$', '€', '£',
-            '亿', '万', '千', '百', '百万', '千万', '十亿',
-            '产品', '功能', '平台', '技术', '解决方案', '服务',
-            'product', 'feature', 'platform', 'technology', 'solution', 'service',
-            '第一', '第二', '第三', '首', '新', '最新',
-        ]
-        
-        # 检查是否包含数字
-        has_number = any(re.search(pattern, summary) for pattern in number_patterns)
-        
-        # 检查是否包含关键词
-        has_keyword = any(keyword in summary.lower() for keyword in fact_keywords)
-        
-        # 至少需要满足一项
-        return has_number or has_keyword
+        # 包含数字（指标/数据）或关键事实关键词，至少满足一项
+        return self.scorer.passes(summary)
     
     def validate_pr_section_empty(self, html_content: str) -> Tuple[bool, str]:
         """
@@ -0,0 +1,33 @@
+"""
+ContentItem 日期处理测试：不补零的日期在各构建路径上都应规范化，而不是丢弃或抛错
+"""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.fetchers.base import ContentItem
+
+
+def _data(day):
+    return {"title": "t", "summary": "s", "date": day, "url": "https://example.com/a", "source": "TTD"}
+
+
+def test_init_normalizes_unpadded_date():
+    item = ContentItem("t", "s", "2026-2-9", "https://example.com/a", "TTD")
+    assert item.day == date(2026, 2, 9)
+    assert item.date == "2026-02-09"
+
+
+def test_from_dict_trusted_accepts_unpadded_date():
+    item = ContentItem.from_dict(_data("2026-2-9"))
+    assert item.date == "2026-02-09"
+    assert item == ContentItem.from_dict(_data("2026-02-09"), trusted=False)
+
+
+def test_invalid_date_is_empty():
+    assert ContentItem.from_dict(_data("2026-13-01")).date == ""
+    assert ContentItem.from_dict(_data("")).day is None
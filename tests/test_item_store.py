@@ -0,0 +1,44 @@
+"""
+条目库测试：未抓到条目的分组也要记录，才能被 covering_run 复用
+"""
+
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.fetchers.base import ContentItem
+from src.fetchers.item_store import ItemStore
+
+
+def _item(url, day):
+    return ContentItem(title="t", summary="s", date=day.isoformat(), url=url, source="TTD")
+
+
+def test_covering_run_with_empty_groups(tmp_path):
+    store = ItemStore(str(tmp_path / "items.db"))
+    ws, we = datetime(2026, 2, 2), datetime(2026, 2, 8)
+    groups = ["TTD", "Criteo", "Moloco"]
+
+    results = {"TTD": [_item("https://example.com/a", date(2026, 2, 3))], "Criteo": [], "Moloco": []}
+    store.record_run("competitor", results, ws, we, complete=True)
+
+    assert store.covering_run("competitor", ws, we, groups) is not None
+    items = store.items_between("competitor", ws, we, groups)
+    assert list(items) == groups
+    assert [i.url for i in items["TTD"]] == ["https://example.com/a"]
+    assert items["Criteo"] == [] and items["Moloco"] == []
+    store.close()
+
+
+def test_covering_run_ignores_incomplete_or_partial_groups(tmp_path):
+    store = ItemStore(str(tmp_path / "items.db"))
+    ws, we = datetime(2026, 2, 2), datetime(2026, 2, 8)
+
+    store.record_run("competitor", {"TTD": []}, ws, we, complete=True)
+    store.record_run("competitor", {"TTD": [], "Criteo": []}, ws, we, complete=False)
+
+    assert store.covering_run("competitor", ws, we, ["TTD", "Criteo"]) is None
+    store.close()